@@ -0,0 +1,155 @@
+"""Minimal, dependency-free benchmark harness (pyperf-style calibration and JSON output).
+
+Each benchmark is calibrated so one sample takes at least ``min_time`` seconds, then
+``samples`` samples are taken. Results are written as JSON so runs can be stored and
+compared across releases with :func:`compare_results`.
+"""
+
+from __future__ import annotations
+
+import gc
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A named, parametrised callable to time."""
+
+    name: str
+    group: str
+    func: Callable[[], Any]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def full_name(self) -> str:
+        if not self.params:
+            return self.name
+        rendered = ",".join(f"{key}={value}" for key, value in self.params.items())
+        return f"{self.name}[{rendered}]"
+
+
+def _time_loops(func: Callable[[], Any], loops: int) -> float:
+    timer = time.perf_counter
+    start = timer()
+    for _ in range(loops):
+        func()
+    return timer() - start
+
+
+def calibrate_loops(func: Callable[[], Any], min_time: float) -> int:
+    """Return the number of calls needed for one sample to last ``min_time`` seconds."""
+
+    loops = 1
+    while True:
+        elapsed = _time_loops(func, loops)
+        if elapsed >= min_time or loops >= 1_000_000:
+            return loops
+        # Aim slightly above min_time; never grow by more than 10x per step.
+        factor = min(10.0, max(2.0, (min_time * 1.2) / max(elapsed, 1e-9)))
+        loops = int(loops * factor) + 1
+
+
+def measure(benchmark: Benchmark, *, min_time: float = 0.05, samples: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """Time ``benchmark`` and return per-call statistics in seconds."""
+
+    func = benchmark.func
+    for _ in range(warmup):
+        func()
+
+    loops = calibrate_loops(func, min_time)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = [_time_loops(func, loops) / loops for _ in range(samples)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    mean = statistics.fmean(timings)
+    return {
+        "min": min(timings),
+        "max": max(timings),
+        "mean": mean,
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "ops_per_sec": 1.0 / mean if mean else None,
+        "loops": loops,
+        "samples": samples,
+    }
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    *,
+    min_time: float = 0.05,
+    samples: int = 5,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run every benchmark and return a JSON-serialisable report."""
+
+    from pydantic_schemaforms import __version__
+
+    results: List[Dict[str, Any]] = []
+    for benchmark in benchmarks:
+        result = {
+            "name": benchmark.full_name,
+            "group": benchmark.group,
+            "params": benchmark.params,
+            "stats": measure(benchmark, min_time=min_time, samples=samples),
+        }
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    return {
+        "suite": "pydantic-schemaforms",
+        "library_version": __version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "settings": {"min_time": min_time, "samples": samples},
+        "results": results,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], *, threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Compare median timings with a baseline report.
+
+    Returns one entry per benchmark present in both reports; entries whose median grew
+    by more than ``threshold`` (a fraction) are flagged as regressions.
+    """
+
+    baseline_by_name = {result["name"]: result for result in baseline.get("results", [])}
+    comparisons: List[Dict[str, Any]] = []
+    for result in current.get("results", []):
+        previous = baseline_by_name.get(result["name"])
+        if previous is None:
+            continue
+        before = previous["stats"]["median"]
+        after = result["stats"]["median"]
+        change = (after - before) / before if before else 0.0
+        comparisons.append(
+            {
+                "name": result["name"],
+                "baseline_median": before,
+                "median": after,
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return comparisons
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
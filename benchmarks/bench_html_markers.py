@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark SchemaForms marker wrapping against document size.
+
+Compares the previous ``strip()``/``splitlines()`` implementation with the current
+edge-scanning one. Locating the markers inspects only the ends of the document, so
+its cost stays flat as the document grows; the remaining cost of
+``wrap_with_schemaforms_markers`` is the single copy needed to build the result.
+
+Usage:
+    python benchmarks/bench_html_markers.py [--repeat 200] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from pydantic_schemaforms.html_markers import (  # noqa: E402
+    END_MARKER,
+    START_MARKER,
+    _content_bounds,
+    wrap_with_schemaforms_markers,
+)
+
+SIZES_KB = (1, 10, 100, 300, 1000)
+
+
+def legacy_wrap(html: str) -> str:
+    """The splitlines-based implementation this module replaced."""
+
+    normalized = (html or "").lstrip().rstrip()
+    lines = normalized.splitlines()
+    if lines and lines[0].strip() == START_MARKER:
+        lines = lines[1:]
+    if lines and lines[-1].strip() == END_MARKER:
+        lines = lines[:-1]
+    inner = "\n".join(lines).strip()
+    if inner:
+        return f"{START_MARKER}\n{inner}\n{END_MARKER}"
+    return f"{START_MARKER}\n{END_MARKER}"
+
+
+def build_document(size_kb: int) -> str:
+    line = '<div class="mb-3"><input type="text" name="field" class="form-control" /></div>\n'
+    body = line * (size_kb * 1024 // len(line) + 1)
+    return f"\n{body}\n"
+
+
+def run(repeat: int) -> list[dict]:
+    results = []
+    for size_kb in SIZES_KB:
+        document = build_document(size_kb)
+        assert legacy_wrap(document) == wrap_with_schemaforms_markers(document)
+        row = {"size_kb": size_kb}
+        for name, func in (
+            ("legacy_wrap_us", legacy_wrap),
+            ("wrap_us", wrap_with_schemaforms_markers),
+            ("marker_scan_us", _content_bounds),
+        ):
+            timings = timeit.repeat(
+                lambda func=func, document=document: func(document), number=repeat, repeat=5
+            )
+            seconds = min(timings) / repeat
+            row[name] = round(seconds * 1e6, 2)
+        results.append(row)
+    return results
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SchemaForms marker wrapping.")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per timing sample (default: 200).")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps({"benchmark": "html_markers", "results": results}, indent=2))
+        return 0
+
+    print(f"{'size':>8} {'legacy wrap':>14} {'wrap':>10} {'marker scan':>13}")
+    for row in results:
+        print(
+            f"{row['size_kb']:>6}KB {row['legacy_wrap_us']:>12.2f}us "
+            f"{row['wrap_us']:>8.2f}us {row['marker_scan_us']:>11.2f}us"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,302 @@
+"""Benchmark cases for renderers, layouts and form-data parsing.
+
+Cases use the representative models from ``examples/shared_models.py`` plus synthetic
+flat models of 10/100/1000 fields, so results scale with form size the same way across
+releases. Everything renders offline (vendored, local-static, cdn and none asset modes
+only change the emitted tags).
+"""
+
+from __future__ import annotations
+
+import sys
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for _path in (REPO_ROOT, REPO_ROOT / "examples"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from pydantic import create_model  # noqa: E402
+
+from pydantic_schemaforms.enhanced_renderer import EnhancedFormRenderer, render_form_html  # noqa: E402
+from pydantic_schemaforms.form_data import parse_nested_form_data  # noqa: E402
+from pydantic_schemaforms.html_markers import wrap_with_schemaforms_markers  # noqa: E402
+from pydantic_schemaforms.model_list import ModelListRenderer  # noqa: E402
+from pydantic_schemaforms.modern_renderer import FormDefinition, ModernFormRenderer  # noqa: E402
+from pydantic_schemaforms.modern_renderer import FormField as DefinitionField  # noqa: E402
+from pydantic_schemaforms.schema_form import Field, FormModel  # noqa: E402
+from pydantic_schemaforms.simple_material_renderer import SimpleMaterialRenderer  # noqa: E402
+
+with warnings.catch_warnings():
+    # shared_models imports the deprecated form_layouts module for its layout demo.
+    warnings.simplefilter("ignore", DeprecationWarning)
+    import shared_models  # noqa: E402
+
+from _harness import Benchmark  # noqa: E402
+
+FRAMEWORKS = ("bootstrap", "material", "none")
+ASSET_MODES = ("vendored", "local-static", "cdn", "none")
+FIELD_COUNTS = (10, 100, 1000)
+LIST_ITEM_COUNTS = (0, 10, 100, 500)
+
+QUICK_FIELD_COUNTS = (10, 100)
+QUICK_LIST_ITEM_COUNTS = (0, 10)
+QUICK_ASSET_MODES = ("vendored", "none")
+
+# (annotation, field kwargs, submitted value) cycled to build synthetic models.
+_FIELD_KINDS: Tuple[Tuple[Any, Dict[str, Any], str], ...] = (
+    (str, {"ui_element": "text", "min_length": 1, "max_length": 100}, "Ada Lovelace"),
+    (int, {"ui_element": "number", "ge": 0, "le": 1000}, "42"),
+    (bool, {"ui_element": "checkbox"}, "on"),
+    (str, {"ui_element": "email"}, "ada@example.com"),
+    (str, {"ui_element": "select", "ui_options": {"choices": ["low", "medium", "high"]}}, "medium"),
+    (str, {"ui_element": "textarea"}, "Some longer free text"),
+    (str, {"ui_element": "date"}, "2024-01-31"),
+)
+
+_PET = {"name": "Rex", "species": "Dog", "age": "3", "weight": "20.5"}
+
+_flat_models: Dict[int, Type[FormModel]] = {}
+
+
+def flat_model(field_count: int) -> Type[FormModel]:
+    """Return a synthetic FormModel with ``field_count`` mixed-type fields."""
+
+    model = _flat_models.get(field_count)
+    if model is None:
+        definitions: Dict[str, Any] = {}
+        for index in range(field_count):
+            annotation, kwargs, _value = _FIELD_KINDS[index % len(_FIELD_KINDS)]
+            default = False if annotation is bool else None
+            definitions[f"field_{index}"] = (
+                annotation if default is not None else annotation | None,
+                Field(default, title=f"Field {index}", **kwargs),
+            )
+        model = create_model(f"Flat{field_count}Form", __base__=FormModel, **definitions)
+        _flat_models[field_count] = model
+    return model
+
+
+def flat_form_data(field_count: int) -> Dict[str, str]:
+    """Submitted (string) values for :func:`flat_model`."""
+
+    return {
+        f"field_{index}": _FIELD_KINDS[index % len(_FIELD_KINDS)][2]
+        for index in range(field_count)
+    }
+
+
+def pet_list_form_data(item_count: int) -> Dict[str, str]:
+    """Flat form keys for ``PetRegistrationForm`` with ``item_count`` pets."""
+
+    data = {"owner_name": "Ada Lovelace", "email": "ada@example.com"}
+    for index in range(item_count):
+        for key, value in _PET.items():
+            data[f"pets[{index}].{key}"] = value
+    return data
+
+
+def _definition(field_count: int) -> FormDefinition:
+    kinds = ("text", "email", "number", "textarea", "checkbox")
+    fields = [
+        DefinitionField(f"field_{index}", kinds[index % len(kinds)], required=index % 3 == 0)
+        for index in range(field_count)
+    ]
+    return FormDefinition(title=f"Definition {field_count}", fields=fields)
+
+
+def enhanced_renderer_cases(field_counts, asset_modes) -> Iterator[Benchmark]:
+    for framework in FRAMEWORKS:
+        for asset_mode in asset_modes:
+            renderer = EnhancedFormRenderer(
+                framework=framework,
+                include_framework_assets=True,
+                asset_mode=asset_mode,
+            )
+            for field_count in field_counts:
+                model = flat_model(field_count)
+                data = flat_form_data(field_count)
+                yield Benchmark(
+                    "enhanced_render",
+                    "EnhancedFormRenderer",
+                    lambda renderer=renderer, model=model, data=data: renderer.render_form_from_model(
+                        model, data=data, submit_url="/submit"
+                    ),
+                    {"framework": framework, "asset_mode": asset_mode, "fields": field_count},
+                )
+
+
+def render_form_html_cases(field_counts) -> Iterator[Benchmark]:
+    for framework in FRAMEWORKS:
+        for field_count in field_counts:
+            model = flat_model(field_count)
+            yield Benchmark(
+                "render_form_html",
+                "render_form_html",
+                lambda model=model, framework=framework: render_form_html(
+                    model, framework=framework, submit_url="/submit"
+                ),
+                {"framework": framework, "fields": field_count},
+            )
+
+
+def simple_material_cases(field_counts) -> Iterator[Benchmark]:
+    renderer = SimpleMaterialRenderer()
+    for field_count in field_counts:
+        model = flat_model(field_count)
+        data = flat_form_data(field_count)
+        yield Benchmark(
+            "simple_material_render",
+            "SimpleMaterialRenderer",
+            lambda model=model, data=data: renderer.render_form_from_model(model, data=data, submit_url="/submit"),
+            {"fields": field_count},
+        )
+
+
+def modern_renderer_cases(field_counts) -> Iterator[Benchmark]:
+    for framework in ("bootstrap", "material"):
+        renderer = ModernFormRenderer(framework=framework)
+        for field_count in field_counts:
+            definition = _definition(field_count)
+            definition.css_framework = framework
+            yield Benchmark(
+                "modern_render",
+                "ModernFormRenderer",
+                lambda definition=definition, renderer=renderer: renderer.render_form(definition),
+                {"framework": framework, "fields": field_count},
+            )
+
+
+def model_list_cases(item_counts) -> Iterator[Benchmark]:
+    for framework in ("bootstrap", "material"):
+        list_renderer = ModelListRenderer(framework=framework)
+        for item_count in item_counts:
+            values: List[Dict[str, Any]] = [dict(_PET) for _ in range(item_count)]
+            yield Benchmark(
+                "model_list_render",
+                "ModelListRenderer",
+                lambda list_renderer=list_renderer, values=values: list_renderer.render_model_list(
+                    "pets", "Pets", shared_models.PetModel, values=values, max_items=max(10, len(values))
+                ),
+                {"framework": framework, "items": item_count},
+            )
+
+    for framework in FRAMEWORKS:
+        renderer = EnhancedFormRenderer(framework=framework)
+        for item_count in item_counts:
+            data = parse_nested_form_data(pet_list_form_data(item_count))
+            yield Benchmark(
+                "model_list_form_render",
+                "ModelListRenderer",
+                lambda renderer=renderer, data=data: renderer.render_form_from_model(
+                    shared_models.PetRegistrationForm, data=data, submit_url="/submit"
+                ),
+                {"framework": framework, "items": item_count},
+            )
+
+
+def layout_engine_cases(field_counts) -> Iterator[Benchmark]:
+    models: List[Tuple[str, Type[FormModel]]] = [
+        ("CompleteShowcaseForm", shared_models.CompleteShowcaseForm),
+        ("MediumContactForm", shared_models.MediumContactForm),
+    ]
+    models.extend((f"Flat{count}", flat_model(count)) for count in field_counts if count <= 100)
+
+    for framework in FRAMEWORKS:
+        renderer = EnhancedFormRenderer(framework=framework)
+        for layout in ("tabbed", "side-by-side"):
+            for model_name, model in models:
+                yield Benchmark(
+                    "layout_render",
+                    "LayoutEngine",
+                    lambda renderer=renderer, model=model, layout=layout: renderer.render_form_from_model(
+                        model, submit_url="/submit", layout=layout
+                    ),
+                    {"framework": framework, "layout": layout, "model": model_name},
+                )
+        yield Benchmark(
+            "layout_fields_render",
+            "LayoutEngine",
+            lambda renderer=renderer: renderer.render_form_from_model(
+                shared_models.LayoutDemonstrationForm, submit_url="/submit"
+            ),
+            {"framework": framework, "model": "LayoutDemonstrationForm"},
+        )
+
+
+def form_data_cases(field_counts, item_counts) -> Iterator[Benchmark]:
+    for field_count in field_counts:
+        data = flat_form_data(field_count)
+        yield Benchmark(
+            "parse_nested_form_data",
+            "parse_nested_form_data",
+            lambda data=data: parse_nested_form_data(data),
+            {"shape": "flat", "fields": field_count},
+        )
+    for item_count in item_counts:
+        data = pet_list_form_data(item_count)
+        yield Benchmark(
+            "parse_nested_form_data",
+            "parse_nested_form_data",
+            lambda data=data: parse_nested_form_data(data),
+            {"shape": "list", "items": item_count},
+        )
+    for item_count in item_counts:
+        data = pet_list_form_data(item_count)
+        yield Benchmark(
+            "parse_nested_form_data",
+            "parse_nested_form_data",
+            lambda data=data: parse_nested_form_data(data, sparse_indices=True),
+            {"shape": "list", "items": item_count, "sparse": True},
+        )
+    nested = shared_models.create_sample_nested_data()
+    flattened = _flatten(nested)
+    yield Benchmark(
+        "parse_nested_form_data",
+        "parse_nested_form_data",
+        lambda: parse_nested_form_data(flattened),
+        {"shape": "CompanyOrganizationForm", "keys": len(flattened)},
+    )
+
+
+def html_marker_cases() -> Iterator[Benchmark]:
+    for size_kb in (10, 300):
+        document = "\n" + "<div>field</div>\n" * (size_kb * 1024 // 17) + "\n"
+        yield Benchmark(
+            "wrap_with_schemaforms_markers",
+            "html_markers",
+            lambda document=document: wrap_with_schemaforms_markers(document),
+            {"size_kb": size_kb},
+        )
+
+
+def _flatten(value: Any, prefix: str = "") -> Dict[str, str]:
+    flat: Dict[str, str] = {}
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flat.update(_flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            flat.update(_flatten(item, f"{prefix}[{index}]"))
+    else:
+        flat[prefix] = "" if value is None else str(value)
+    return flat
+
+
+def all_cases(*, quick: bool = False) -> Iterator[Benchmark]:
+    """Yield every benchmark; ``quick`` trims sizes and asset modes for smoke runs."""
+
+    field_counts = QUICK_FIELD_COUNTS if quick else FIELD_COUNTS
+    item_counts = QUICK_LIST_ITEM_COUNTS if quick else LIST_ITEM_COUNTS
+    asset_modes = QUICK_ASSET_MODES if quick else ASSET_MODES
+
+    yield from enhanced_renderer_cases(field_counts, asset_modes)
+    yield from render_form_html_cases(field_counts)
+    yield from simple_material_cases(field_counts)
+    yield from modern_renderer_cases(field_counts)
+    yield from model_list_cases(item_counts)
+    yield from layout_engine_cases(field_counts)
+    yield from form_data_cases(field_counts, item_counts)
+    yield from html_marker_cases()
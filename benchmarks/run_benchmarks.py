@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Run the pydantic-schemaforms render benchmark suite.
+
+Covers EnhancedFormRenderer (bootstrap/material/none x asset modes x 10/100/1000
+fields), render_form_html, SimpleMaterialRenderer, ModernFormRenderer,
+ModelListRenderer (0-500 items), LayoutEngine tabbed/side-by-side layouts,
+parse_nested_form_data and marker wrapping. Runs offline with no extra dependencies.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # full suite, table output
+    python benchmarks/run_benchmarks.py --quick              # smaller sizes (smoke run)
+    python benchmarks/run_benchmarks.py -k model_list        # only matching benchmarks
+    python benchmarks/run_benchmarks.py --json results.json  # machine-readable report
+    python benchmarks/run_benchmarks.py --compare baseline.json --threshold 0.15
+
+With ``--compare`` the exit status is 1 when any benchmark's median regressed by more
+than the threshold, so the suite can gate releases in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _harness import compare_results, format_seconds, run_benchmarks  # noqa: E402
+from cases import all_cases  # noqa: E402
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Run the pydantic-schemaforms benchmark suite.")
+    parser.add_argument("--quick", action="store_true", help="Use smaller sizes and fewer asset modes.")
+    parser.add_argument("-k", "--filter", default=None, help="Only run benchmarks whose name contains this text.")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per sample (default: 0.05).")
+    parser.add_argument("--samples", type=int, default=5, help="Samples per benchmark (default: 5).")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the JSON report to this path ('-' for stdout).")
+    parser.add_argument("--compare", default=None, help="Baseline JSON report to compare medians against.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Regression threshold as a fraction (default: 0.10).")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases(quick=args.quick) if not args.filter or args.filter in case.full_name]
+    quiet = args.json_path == "-"
+
+    def _print_result(result: dict) -> None:
+        if not quiet:
+            stats = result["stats"]
+            print(f"{result['name']:<90} {format_seconds(stats['median']):>12} +- {format_seconds(stats['stdev'])}")
+
+    report = run_benchmarks(cases, min_time=args.min_time, samples=args.samples, on_result=_print_result)
+
+    if args.json_path == "-":
+        print(json.dumps(report, indent=2))
+    elif args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if not args.compare:
+        return 0
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    comparisons = compare_results(report, baseline, threshold=args.threshold)
+    regressions = [item for item in comparisons if item["regression"]]
+    stream = sys.stderr if quiet else sys.stdout
+    for item in comparisons:
+        marker = "REGRESSION" if item["regression"] else ""
+        print(f"{item['name']:<90} {item['change']:+7.1%} {marker}", file=stream)
+    print(f"{len(regressions)} regression(s) over {args.threshold:.0%} in {len(comparisons)} compared benchmarks", file=stream)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -17,95 +17,121 @@ IMPORTANT: This library requires Python 3.14+ and provides NO backward compatibi
 import logging
 import os
 from importlib import import_module
+from typing import Dict
 
-from .enhanced_renderer import (
-    EnhancedFormRenderer,
-    SchemaFormValidationError,
-)
-# Enhanced FormField matching design_idea.py vision
-from .form_field import (
-    CheckboxField,
-    DateField,
-    EmailField,
-    FormField,
-    NumberField,
-    SelectField,
-    TextAreaField,
-    TextField,
-)
-# Layout composition system matching design_idea.py vision
-from .form_layouts import FormDesign, ListLayout, SectionDesign, TabbedLayout
-# Input type constants and validation
-from .input_types import (
-    ALL_INPUT_TYPES,
-    DATETIME_INPUTS,
-    NUMERIC_INPUTS,
-    SELECTION_INPUTS,
-    SPECIALIZED_INPUTS,
-    TEXT_INPUTS,
-)
-# Input component export metadata
-from .inputs import __all__ as _INPUT_EXPORTS
-# Core form building and rendering
-from .integration import (
-    AutoFormBuilder,
-    FormBuilder,
-    FormIntegration,
-    create_contact_form,
-    create_form_from_model,
-    create_login_form,
-    create_registration_form,
-    handle_form,
-    handle_form_async,
-    render_form_page,
-)
-# Live validation system
-from .live_validation import HTMXValidationConfig, LiveValidator
-# Modern renderer with Python 3.14 template strings
-from .modern_renderer import FormDefinition, FormSection, ModernFormRenderer
-from .render_form import render_form_html, render_form_html_async
-from .rendering.context import RenderContext
-from .form_data import coerce_form_value, parse_nested_form_data
-# Layout system
-from .rendering.layout_engine import (
-    AccordionLayout,
-    CardLayout,
-    GridLayout,
-    HorizontalLayout,
-    Layout,
-    LayoutComposer,
-    LayoutFactory,
-    ModalLayout,
-    ResponsiveGridLayout,
-    TabLayout,
-    VerticalLayout,
-)
-# FormModel abstraction for Pydantic models with UI hints
-from .schema_form import Field, FormModel, ValidationResult, form_validator
-from .templates import FormTemplates, TemplateString
-# Validation system
-from .validation import (
-    CrossFieldRules,
-    CustomRule,
-    DateRangeRule,
-    EmailRule,
-    FieldValidator,
-    FormValidator,
-    MaxLengthRule,
-    MinLengthRule,
-    NumericRangeRule,
-    PhoneRule,
-    RegexRule,
-    RequiredRule,
-    ValidationResponse,
-    ValidationRule,
-    create_email_validator,
-    create_password_strength_validator,
-    create_validator,
-)
-# Check Python version before any other imports
+# Python version checks. Imported eagerly so the 3.14 guard runs on ``import
+# pydantic_schemaforms``; the module only needs ``sys`` and costs next to nothing.
 from .version_check import check_python_version, verify_template_strings
 
+# Input component export metadata (the inputs package resolves its classes lazily)
+from .inputs import __all__ as _INPUT_EXPORTS
+# Pre-fork cache warm-up. Imported eagerly (it is dependency-free at import time) because
+# the module shares its name with the function and would otherwise shadow it.
+from .warmup import WarmupReport, warmup
+
+# Public API resolved on first attribute access (PEP 562). Importing the package stays
+# cheap for CLI tools and serverless cold starts; renderers, themes, layouts, validation
+# and framework integration load only when one of their names is used.
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Enhanced renderer
+    "EnhancedFormRenderer": ".enhanced_renderer",
+    "SchemaFormValidationError": ".enhanced_renderer",
+    # Enhanced FormField matching design_idea.py vision
+    "CheckboxField": ".form_field",
+    "DateField": ".form_field",
+    "EmailField": ".form_field",
+    "FormField": ".form_field",
+    "NumberField": ".form_field",
+    "SelectField": ".form_field",
+    "TextAreaField": ".form_field",
+    "TextField": ".form_field",
+    # Layout composition system matching design_idea.py vision
+    "FormDesign": ".form_layouts",
+    "ListLayout": ".form_layouts",
+    "SectionDesign": ".form_layouts",
+    "TabbedLayout": ".form_layouts",
+    # Render instrumentation
+    "RenderMetrics": ".instrumentation",
+    "RenderObserver": ".instrumentation",
+    "add_render_observer": ".instrumentation",
+    "collect_render_metrics": ".instrumentation",
+    "remove_render_observer": ".instrumentation",
+    # Input type constants and validation
+    "ALL_INPUT_TYPES": ".input_types",
+    "DATETIME_INPUTS": ".input_types",
+    "NUMERIC_INPUTS": ".input_types",
+    "SELECTION_INPUTS": ".input_types",
+    "SPECIALIZED_INPUTS": ".input_types",
+    "TEXT_INPUTS": ".input_types",
+    # Core form building and rendering
+    "AutoFormBuilder": ".integration",
+    "FormBuilder": ".integration",
+    "FormIntegration": ".integration",
+    "create_contact_form": ".integration",
+    "create_form_from_model": ".integration",
+    "create_login_form": ".integration",
+    "create_registration_form": ".integration",
+    "handle_form": ".integration",
+    "handle_form_async": ".integration",
+    "render_form_page": ".integration",
+    # Live validation system
+    "HTMXValidationConfig": ".live_validation",
+    "LiveValidator": ".live_validation",
+    # Modern renderer with Python 3.14 template strings
+    "FormDefinition": ".modern_renderer",
+    "FormSection": ".modern_renderer",
+    "ModernFormRenderer": ".modern_renderer",
+    "aiter_render_form": ".render_form",
+    "iter_render_form": ".render_form",
+    "render_form_html": ".render_form",
+    "render_form_html_async": ".render_form",
+    "RenderContext": ".rendering.context",
+    # Raw form-data helpers
+    "FormDataLimitError": ".form_data",
+    "FormDataLimits": ".form_data",
+    "FormDataShapeError": ".form_data",
+    "coerce_form_value": ".form_data",
+    "parse_nested_form_data": ".form_data",
+    # Layout system
+    "AccordionLayout": ".rendering.layout_engine",
+    "CardLayout": ".rendering.layout_engine",
+    "GridLayout": ".rendering.layout_engine",
+    "HorizontalLayout": ".rendering.layout_engine",
+    "Layout": ".rendering.layout_engine",
+    "LayoutComposer": ".rendering.layout_engine",
+    "LayoutFactory": ".rendering.layout_engine",
+    "ModalLayout": ".rendering.layout_engine",
+    "ResponsiveGridLayout": ".rendering.layout_engine",
+    "TabLayout": ".rendering.layout_engine",
+    "VerticalLayout": ".rendering.layout_engine",
+    # FormModel abstraction for Pydantic models with UI hints
+    "Field": ".schema_form",
+    "FormModel": ".schema_form",
+    "ValidationResult": ".schema_form",
+    "form_validator": ".schema_form",
+    "FormTemplates": ".templates",
+    "TemplateString": ".templates",
+    # Validation system
+    "CrossFieldRules": ".validation",
+    "CustomRule": ".validation",
+    "DateRangeRule": ".validation",
+    "EmailRule": ".validation",
+    "FieldValidator": ".validation",
+    "FormValidator": ".validation",
+    "MaxLengthRule": ".validation",
+    "MinLengthRule": ".validation",
+    "NumericRangeRule": ".validation",
+    "PhoneRule": ".validation",
+    "RegexRule": ".validation",
+    "RequiredRule": ".validation",
+    "ValidationResponse": ".validation",
+    "ValidationRule": ".validation",
+    "create_email_validator": ".validation",
+    "create_password_strength_validator": ".validation",
+    "create_validator": ".validation",
+    "cross_field_rule": ".validation",
+}
+
 # Legacy compatibility (deprecated) - archived modules
 # The following modules have been archived:
 # - form_layout.py -> use layouts.py instead
@@ -157,6 +183,14 @@ __all__ = [
     "SchemaFormValidationError",
     "render_form_html",
     "render_form_html_async",
+    "iter_render_form",
+    "aiter_render_form",
+    # Render instrumentation
+    "RenderMetrics",
+    "RenderObserver",
+    "add_render_observer",
+    "remove_render_observer",
+    "collect_render_metrics",
     # Pre-built form templates
     "create_login_form",
     "create_registration_form",
@@ -171,6 +205,7 @@ __all__ = [
     # Validation system
     "create_validator",
     "FormValidator",
+    "cross_field_rule",
     "RequiredRule",
     "EmailRule",
     # Input types
@@ -186,6 +221,12 @@ __all__ = [
     # Raw form-data helpers
     "parse_nested_form_data",
     "coerce_form_value",
+    "FormDataLimits",
+    "FormDataLimitError",
+    "FormDataShapeError",
+    # Pre-fork warm-up
+    "warmup",
+    "WarmupReport",
     "__package_name__",
 ] + list(_INPUT_EXPORTS)
 
@@ -259,8 +300,13 @@ result = await FormIntegration.fastapi_integration(form, data)
 
 
 def __getattr__(name: str):
-    """Expose input components lazily at the package root."""
+    """Resolve the public API and input components lazily at the package root."""
 
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        attr = getattr(import_module(module_name, __name__), name)
+        globals()[name] = attr
+        return attr
     if name in _INPUT_EXPORTS: # pragma: no cover - improves import time
         inputs_module = import_module("pydantic_schemaforms.inputs")
         attr = getattr(inputs_module, name)
@@ -272,4 +318,4 @@ def __getattr__(name: str):
 
 
 def __dir__():  # pragma: no cover - improves interactive discovery
-    return sorted(set(list(globals().keys()) + __all__))
+    return sorted(set(list(globals().keys()) + list(_LAZY_EXPORTS) + __all__))
@@ -0,0 +1,226 @@
+/* pydantic-schemaforms client validation runtime.
+ *
+ * Static and identical for every form: per-form rules are read from
+ * <script type="application/json" data-schemaforms-rules> descriptors emitted next
+ * to the rendered form (see pydantic_schemaforms.client_validation).
+ */
+(function (window, document) {
+  'use strict';
+
+  if (window.SchemaFormsValidation) {
+    return;
+  }
+
+  var patternCache = {};
+
+  function isEmpty(value) {
+    return value === null || value === undefined || String(value).trim() === '';
+  }
+
+  function compilePattern(pattern) {
+    if (!(pattern in patternCache)) {
+      try {
+        patternCache[pattern] = new RegExp(pattern);
+      } catch (error) {
+        // Python-only syntax: leave the check to the server.
+        patternCache[pattern] = null;
+      }
+    }
+    return patternCache[pattern];
+  }
+
+  function checkNumber(rule, value) {
+    var number = Number(value);
+    if (isNaN(number)) {
+      return rule.message;
+    }
+    if (rule.min !== undefined && (rule.exclusive_min ? number <= rule.min : number < rule.min)) {
+      return rule.message;
+    }
+    if (rule.max !== undefined && (rule.exclusive_max ? number >= rule.max : number > rule.max)) {
+      return rule.message;
+    }
+    return null;
+  }
+
+  var checks = {
+    required: function (rule, value) {
+      return isEmpty(value) ? rule.message : null;
+    },
+    min_length: function (rule, value) {
+      return String(value).length < rule.min_length ? rule.message : null;
+    },
+    max_length: function (rule, value) {
+      return String(value).length > rule.max_length ? rule.message : null;
+    },
+    numeric_range: checkNumber,
+    date_range: function (rule, value) {
+      // ISO dates compare correctly as strings.
+      if (rule.min_date && value < rule.min_date) {
+        return rule.message;
+      }
+      if (rule.max_date && value > rule.max_date) {
+        return rule.message;
+      }
+      return null;
+    },
+    enum: function (rule, value) {
+      return rule.values.map(String).indexOf(String(value)) === -1 ? rule.message : null;
+    }
+  };
+
+  function checkRule(rule, value) {
+    if (rule.type !== 'required' && isEmpty(value)) {
+      return null;
+    }
+    if (rule.pattern !== undefined) {
+      var regex = compilePattern(rule.pattern);
+      return regex && !regex.test(String(value)) ? rule.message : null;
+    }
+    var check = checks[rule.type];
+    // Unknown rule types (custom, async) are validated by the server.
+    return check ? check(rule, value) : null;
+  }
+
+  function validateValue(rules, value) {
+    for (var i = 0; i < rules.length; i++) {
+      var message = checkRule(rules[i], value);
+      if (message) {
+        return message;
+      }
+    }
+    return null;
+  }
+
+  function showError(input, message) {
+    var container = input.parentNode;
+    var existing = container && container.querySelector('.error-message[data-schemaforms-for="' + input.name + '"]');
+    if (existing) {
+      existing.remove();
+    }
+    input.classList.toggle('error', Boolean(message));
+    if (message) {
+      input.setAttribute('aria-invalid', 'true');
+    } else {
+      input.removeAttribute('aria-invalid');
+    }
+    if (input.setCustomValidity) {
+      input.setCustomValidity(message || '');
+    }
+    if (message && container) {
+      var element = document.createElement('div');
+      element.className = 'error-message';
+      element.setAttribute('data-schemaforms-for', input.name);
+      element.textContent = message;
+      container.insertBefore(element, input.nextSibling);
+    }
+  }
+
+  function validateInput(fields, input) {
+    var rules = fields[input.name];
+    if (!rules) {
+      return null;
+    }
+    var message = validateValue(rules, input.value);
+    showError(input, message);
+    return message;
+  }
+
+  function validateForm(form, fields) {
+    var isValid = true;
+    var errors = {};
+    Object.keys(fields).forEach(function (name) {
+      var input = form.elements.namedItem(name);
+      if (!input || !input.name) {
+        return;
+      }
+      var message = validateInput(fields, input);
+      if (message) {
+        errors[name] = message;
+        isValid = false;
+      }
+    });
+    return { isValid: isValid, errors: errors };
+  }
+
+  function precedingForm(node) {
+    var forms = document.forms;
+    var found = null;
+    for (var i = 0; i < forms.length; i++) {
+      if (forms[i].compareDocumentPosition(node) & Node.DOCUMENT_POSITION_FOLLOWING) {
+        found = forms[i];
+      }
+    }
+    return found;
+  }
+
+  function attach(form, fields) {
+    if (form.__schemaformsFields) {
+      Object.assign(form.__schemaformsFields, fields);
+      return;
+    }
+    form.__schemaformsFields = fields;
+    var onChange = function (event) {
+      if (event.target && event.target.name) {
+        validateInput(form.__schemaformsFields, event.target);
+      }
+    };
+    form.addEventListener('input', onChange);
+    form.addEventListener('blur', onChange, true);
+    form.addEventListener('submit', function (event) {
+      var result = validateForm(form, form.__schemaformsFields);
+      if (!result.isValid || !form.checkValidity()) {
+        event.preventDefault();
+        event.stopPropagation();
+      }
+      form.classList.add('was-validated');
+    });
+  }
+
+  function init(root) {
+    var descriptors = (root || document).querySelectorAll('script[type="application/json"][data-schemaforms-rules]');
+    for (var i = 0; i < descriptors.length; i++) {
+      var script = descriptors[i];
+      if (script.__schemaformsLoaded) {
+        continue;
+      }
+      script.__schemaformsLoaded = true;
+      var formId = script.getAttribute('data-form');
+      var form = formId ? document.getElementById(formId) : precedingForm(script);
+      if (!form) {
+        continue;
+      }
+      try {
+        attach(form, JSON.parse(script.textContent).fields || {});
+      } catch (error) {
+        // A malformed descriptor disables client checks; the server still validates.
+      }
+    }
+  }
+
+  var style = document.createElement('style');
+  style.textContent =
+    '.error{border-color:#dc3545!important;box-shadow:0 0 0 .2rem rgba(220,53,69,.25)!important}' +
+    '.error-message{color:#dc3545;font-size:.875rem;margin-top:.25rem}';
+  (document.head || document.documentElement).appendChild(style);
+
+  window.SchemaFormsValidation = {
+    init: init,
+    validateValue: validateValue,
+    validateForm: function (form) {
+      return validateForm(form, form.__schemaformsFields || {});
+    }
+  };
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', function () {
+      init();
+    });
+  } else {
+    init();
+  }
+  // Forms swapped in by HTMX carry their own descriptors.
+  document.addEventListener('htmx:load', function () {
+    init();
+  });
+})(window, document);
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import zlib
+from dataclasses import dataclass
 from functools import lru_cache
 from importlib import resources
 
+# URL prefix where the local-static asset handler is mounted by the host app.
+DEFAULT_STATIC_URL_PREFIX = '/schemaforms-static'
+_static_url_prefix = DEFAULT_STATIC_URL_PREFIX
+
 
 @lru_cache(maxsize=32)
 def read_asset_text(relative_path: str) -> str:
@@ -11,8 +19,14 @@ def read_asset_text(relative_path: str) -> str:
 
     Example: "assets/vendor/htmx/htmx.min.js"
     """
+    return read_asset_bytes(relative_path).decode('utf-8')
+
+
+@lru_cache(maxsize=32)
+def read_asset_bytes(relative_path: str) -> bytes:
+    """Read packaged asset bytes by path relative to the pydantic_schemaforms package."""
     package_root = resources.files('pydantic_schemaforms')
-    return (package_root / relative_path).read_text(encoding='utf-8')
+    return (package_root / relative_path).read_bytes()
 
 
 def script_tag_inline(js: str) -> str:
@@ -51,7 +65,160 @@ def vendored_asset_version(name: str) -> str | None:
 
 
 def _normalized_asset_mode(asset_mode: str | None) -> str:
-    return (asset_mode or 'vendored').strip().lower()
+    mode = (asset_mode or 'vendored').strip().lower()
+    return 'local-static' if mode == 'local_static' else mode
+
+
+def set_static_url_prefix(prefix: str) -> None:
+    """Set the URL prefix used for asset_mode='local-static' tags.
+
+    Must match the path the static asset handler is mounted at
+    (see ``pydantic_schemaforms.assets.static``).
+    """
+    global _static_url_prefix
+    cleaned = (prefix or '').strip().rstrip('/')
+    _static_url_prefix = cleaned if cleaned.startswith('/') or '://' in cleaned else f'/{cleaned}'
+    static_asset_url.cache_clear()
+
+
+def get_static_url_prefix() -> str:
+    return _static_url_prefix
+
+
+def _manifest_file_checksums() -> dict[str, str | None]:
+    """Map package-relative paths of manifest files to their pinned sha256 (if any)."""
+    checksums: dict[str, str | None] = {}
+    for asset in _vendor_manifest().get('assets') or []:
+        if not isinstance(asset, dict):
+            continue
+        for entry in asset.get('files') or []:
+            path = entry.get('path') if isinstance(entry, dict) else None
+            if not isinstance(path, str) or not path.startswith('pydantic_schemaforms/'):
+                continue
+            sha = entry.get('sha256')
+            checksums[path[len('pydantic_schemaforms/') :]] = sha if isinstance(sha, str) and sha else None
+    return checksums
+
+
+def vendored_asset_paths() -> tuple[str, ...]:
+    """Return package-relative paths of every file listed in vendor_manifest.json."""
+    return tuple(_manifest_file_checksums())
+
+
+# Assets written for this package (not vendored, so absent from the manifest).
+VALIDATION_RUNTIME_PATH = 'assets/js/schemaforms-validation.js'
+FIRST_PARTY_ASSET_PATHS = (VALIDATION_RUNTIME_PATH,)
+
+
+def packaged_asset_paths() -> tuple[str, ...]:
+    """Return package-relative paths of every servable asset: vendored and first-party."""
+    return vendored_asset_paths() + FIRST_PARTY_ASSET_PATHS
+
+
+@lru_cache(maxsize=32)
+def vendored_asset_sha256(relative_path: str) -> str:
+    """Return the sha256 of a vendored file, preferring the pinned manifest checksum."""
+    sha = _manifest_file_checksums().get(relative_path)
+    return sha or hashlib.sha256(read_asset_bytes(relative_path)).hexdigest()
+
+
+@dataclass(frozen=True)
+class AssetVariants:
+    """Encoded representations of one packaged asset, computed once per process.
+
+    ``identity`` holds the raw UTF-8 bytes; ``gzip`` and ``deflate`` hold precompressed
+    bodies ready to be sent with the matching ``Content-Encoding``.
+    """
+
+    relative_path: str
+    identity: bytes
+    gzip: bytes
+    deflate: bytes
+    sha256: str
+
+    def body(self, encoding: str = 'identity') -> bytes:
+        """Return the body for a Content-Encoding token ('identity', 'gzip' or 'deflate')."""
+        if encoding == 'gzip':
+            return self.gzip
+        if encoding == 'deflate':
+            return self.deflate
+        return self.identity
+
+    def etag(self, encoding: str = 'identity') -> str:
+        """Return a strong ETag that differs per encoded representation."""
+        return f'"{self.sha256}"' if encoding == 'identity' else f'"{self.sha256}-{encoding}"'
+
+
+@lru_cache(maxsize=32)
+def asset_variants(relative_path: str) -> AssetVariants:
+    """Return cached identity/gzip/deflate bodies and digest for a packaged asset."""
+    identity = read_asset_bytes(relative_path)
+    return AssetVariants(
+        relative_path=relative_path,
+        identity=identity,
+        # mtime=0 keeps the gzip body (and therefore its ETag) stable across processes.
+        gzip=gzip.compress(identity, compresslevel=9, mtime=0),
+        deflate=zlib.compress(identity, 9),
+        sha256=hashlib.sha256(identity).hexdigest(),
+    )
+
+
+def vendored_asset_variants() -> dict[str, AssetVariants]:
+    """Return precompressed variants for every vendored file in the manifest."""
+    return {path: asset_variants(path) for path in vendored_asset_paths()}
+
+
+def negotiate_asset_encoding(accept_encoding: str | None) -> str:
+    """Pick 'gzip', 'deflate' or 'identity' from an Accept-Encoding header value."""
+    if not accept_encoding:
+        return 'identity'
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        token, _, params = item.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip().lower()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[token] = quality
+    wildcard = weights.get('*', 0.0)
+    gzip_quality = weights.get('gzip', wildcard)
+    deflate_quality = weights.get('deflate', wildcard)
+    # Highest q-value wins; gzip is preferred over deflate on ties.
+    if gzip_quality > 0 and gzip_quality >= deflate_quality:
+        return 'gzip'
+    if deflate_quality > 0:
+        return 'deflate'
+    return 'identity'
+
+
+def hashed_asset_name(relative_path: str) -> str:
+    """Return the content-hashed public name for a packaged asset.
+
+    Example: "assets/vendor/htmx/htmx.min.js" -> "htmx/htmx.min.60231ae6ba9d.js"
+    and "assets/js/schemaforms-validation.js" -> "js/schemaforms-validation.<digest>.js"
+    """
+    public_path = relative_path
+    for prefix in ('assets/vendor/', 'assets/'):
+        if relative_path.startswith(prefix):
+            public_path = relative_path[len(prefix) :]
+            break
+    directory, _, filename = public_path.rpartition('/')
+    stem, dot, suffix = filename.rpartition('.')
+    digest = vendored_asset_sha256(relative_path)[:12]
+    hashed = f'{stem}.{digest}.{suffix}' if dot else f'{filename}.{digest}'
+    return f'{directory}/{hashed}' if directory else hashed
+
+
+@lru_cache(maxsize=32)
+def static_asset_url(relative_path: str) -> str:
+    """Return the URL a rendered page should use for a locally served vendored asset."""
+    return f'{_static_url_prefix}/{hashed_asset_name(relative_path)}'
 
 
 def _vendored_text_or_empty(relative_path: str) -> str:
@@ -61,6 +228,13 @@ def _vendored_text_or_empty(relative_path: str) -> str:
         return ''
 
 
+def _local_static_tag(tag_builder, relative_path: str) -> str:
+    try:
+        return tag_builder(static_asset_url(relative_path))
+    except FileNotFoundError:
+        return ''
+
+
 def _pinned_unpkg_url(package: str, asset_name: str, path_suffix: str = '') -> str:
     version = vendored_asset_version(asset_name)
     suffix = f'@{version}' if version else ''
@@ -80,6 +254,7 @@ def htmx_script_tag(*, asset_mode: str = 'vendored') -> str:
 
     Modes:
     - vendored: inline the vendored HTMX JS (offline-by-default)
+    - local-static: reference the vendored file served by the local static handler
     - cdn: reference the pinned CDN URL (explicit opt-in)
     - none: return empty string
     """
@@ -92,16 +267,37 @@ def htmx_script_tag(*, asset_mode: str = 'vendored') -> str:
         # Explicit opt-in. Keep pinned to the vendored version.
         return script_tag_src(_pinned_unpkg_url('htmx.org', 'htmx'))
 
+    if mode == 'local-static':
+        return script_tag_src(static_asset_url('assets/vendor/htmx/htmx.min.js'))
+
     # Default: vendored
     js = read_asset_text('assets/vendor/htmx/htmx.min.js')
     return script_tag_inline(js)
 
 
+def validation_runtime_script_tag(*, asset_mode: str = 'vendored') -> str:
+    """Return the <script> tag for the client validation runtime.
+
+    The runtime is first-party, so there is no CDN copy: 'cdn' inlines it like 'vendored'.
+    With 'local-static' it is one hashed, immutable file shared by every form.
+    """
+    mode = _normalized_asset_mode(asset_mode)
+
+    if mode == 'none':
+        return ''
+
+    if mode == 'local-static':
+        return script_tag_src(static_asset_url(VALIDATION_RUNTIME_PATH))
+
+    return script_tag_inline(read_asset_text(VALIDATION_RUNTIME_PATH))
+
+
 def imask_script_tag(*, asset_mode: str = 'vendored') -> str:
     """Return the IMask <script> tag based on the requested asset mode.
 
     Modes:
     - vendored: inline the vendored IMask JS
+    - local-static: reference the vendored file served by the local static handler
     - cdn: reference the pinned CDN URL (explicit opt-in)
     - none: return empty string
     """
@@ -110,6 +306,8 @@ def imask_script_tag(*, asset_mode: str = 'vendored') -> str:
         return ''
     if mode == 'cdn':
         return script_tag_src(_pinned_unpkg_url('imask', 'imask', 'dist/imask.min.js'))
+    if mode == 'local-static':
+        return script_tag_src(static_asset_url('assets/vendor/imask/imask.min.js'))
 
     js = read_asset_text('assets/vendor/imask/imask.min.js')
     return script_tag_inline(js)
@@ -119,6 +317,7 @@ def framework_css_tag(*, framework: str, asset_mode: str = 'vendored') -> str:
     """Return framework CSS tag for Bootstrap/Materialize.
 
     For asset_mode='vendored', CSS is inlined.
+    For asset_mode='local-static', a <link> to the local static handler is emitted.
     For asset_mode='cdn', a pinned jsDelivr URL is emitted.
     """
     mode = _normalized_asset_mode(asset_mode)
@@ -130,6 +329,8 @@ def framework_css_tag(*, framework: str, asset_mode: str = 'vendored') -> str:
     if fw == 'bootstrap':
         if mode == 'cdn':
             return style_tag_href(_pinned_jsdelivr_url('bootstrap', 'bootstrap', 'dist/css/bootstrap.min.css'))
+        if mode == 'local-static':
+            return _local_static_tag(style_tag_href, 'assets/vendor/bootstrap/bootstrap.min.css')
         css = _vendored_text_or_empty('assets/vendor/bootstrap/bootstrap.min.css')
         return style_tag_inline(css) if css else ''
 
@@ -142,6 +343,8 @@ def framework_css_tag(*, framework: str, asset_mode: str = 'vendored') -> str:
                     'dist/css/materialize.min.css',
                 )
             )
+        if mode == 'local-static':
+            return _local_static_tag(style_tag_href, 'assets/vendor/materialize/materialize.min.css')
         css = _vendored_text_or_empty('assets/vendor/materialize/materialize.min.css')
         return style_tag_inline(css) if css else ''
 
@@ -152,6 +355,7 @@ def framework_js_tag(*, framework: str, asset_mode: str = 'vendored') -> str:
     """Return framework JS tag for Bootstrap/Materialize.
 
     For asset_mode='vendored', JS is inlined.
+    For asset_mode='local-static', a <script src> to the local static handler is emitted.
     For asset_mode='cdn', a pinned jsDelivr URL is emitted.
     """
     mode = _normalized_asset_mode(asset_mode)
@@ -163,6 +367,8 @@ def framework_js_tag(*, framework: str, asset_mode: str = 'vendored') -> str:
     if fw == 'bootstrap':
         if mode == 'cdn':
             return script_tag_src(_pinned_jsdelivr_url('bootstrap', 'bootstrap', 'dist/js/bootstrap.bundle.min.js'))
+        if mode == 'local-static':
+            return _local_static_tag(script_tag_src, 'assets/vendor/bootstrap/bootstrap.bundle.min.js')
         js = _vendored_text_or_empty('assets/vendor/bootstrap/bootstrap.bundle.min.js')
         return script_tag_inline(js) if js else ''
 
@@ -175,6 +381,8 @@ def framework_js_tag(*, framework: str, asset_mode: str = 'vendored') -> str:
                     'dist/js/materialize.min.js',
                 )
             )
+        if mode == 'local-static':
+            return _local_static_tag(script_tag_src, 'assets/vendor/materialize/materialize.min.js')
         js = _vendored_text_or_empty('assets/vendor/materialize/materialize.min.js')
         return script_tag_inline(js) if js else ''
 
@@ -0,0 +1,177 @@
+"""Static handler for vendored assets (asset_mode='local-static').
+
+Forms rendered with ``asset_mode='local-static'`` reference vendored files by
+content-hashed URL (for example ``/schemaforms-static/htmx/htmx.min.60231ae6ba9d.js``)
+instead of inlining them. Mount one of the apps below at the same prefix so the
+browser can fetch, and cache forever, each file once:
+
+    # FastAPI / Starlette
+    app.mount('/schemaforms-static', create_asgi_static_app())
+
+    # Flask
+    app.wsgi_app = DispatcherMiddleware(
+        app.wsgi_app, {'/schemaforms-static': create_wsgi_static_app()}
+    )
+
+Because the filename embeds the sha256 of the file, responses carry
+``Cache-Control: public, max-age=31536000, immutable`` and a strong ETag. Bodies come
+from the precompressed variants in ``assets.runtime.asset_variants`` and are selected
+by ``Accept-Encoding``, so nothing is compressed per request.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .runtime import asset_variants, hashed_asset_name, negotiate_asset_encoding, packaged_asset_paths
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_CONTENT_TYPES = {
+    'js': 'text/javascript; charset=utf-8',
+    'css': 'text/css; charset=utf-8',
+}
+
+
+@dataclass(frozen=True)
+class StaticAssetResponse:
+    """Framework-agnostic response produced by :func:`serve_static_asset`."""
+
+    status: int
+    headers: Tuple[Tuple[str, str], ...]
+    body: bytes = b''
+
+    @property
+    def status_line(self) -> str:
+        return {
+            200: '200 OK',
+            304: '304 Not Modified',
+            404: '404 Not Found',
+            405: '405 Method Not Allowed',
+        }[self.status]
+
+
+@lru_cache(maxsize=1)
+def static_asset_index() -> Dict[str, str]:
+    """Map public hashed names to package-relative paths for every servable packaged file."""
+    return {
+        hashed_asset_name(relative_path): relative_path
+        for relative_path in packaged_asset_paths()
+        if relative_path.rpartition('.')[2] in _CONTENT_TYPES
+    }
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+
+def serve_static_asset(
+    path: str,
+    *,
+    method: str = 'GET',
+    if_none_match: Optional[str] = None,
+    accept_encoding: Optional[str] = None,
+) -> StaticAssetResponse:
+    """Resolve a request for a hashed vendored asset.
+
+    Args:
+        path: Request path relative to the mount prefix (leading slash optional).
+        method: HTTP method; only GET and HEAD are allowed.
+        if_none_match: Value of the ``If-None-Match`` request header, if any.
+        accept_encoding: Value of the ``Accept-Encoding`` request header, if any.
+    """
+    if method not in ('GET', 'HEAD'):
+        return StaticAssetResponse(405, (('allow', 'GET, HEAD'), ('content-length', '0')))
+
+    relative_path = static_asset_index().get(path.lstrip('/'))
+    if relative_path is None:
+        return StaticAssetResponse(404, (('content-type', 'text/plain; charset=utf-8'), ('content-length', '9')), b'Not Found')
+
+    variants = asset_variants(relative_path)
+    encoding = negotiate_asset_encoding(accept_encoding)
+    cache_headers = (
+        ('cache-control', IMMUTABLE_CACHE_CONTROL),
+        ('etag', variants.etag(encoding)),
+        ('vary', 'Accept-Encoding'),
+    )
+    if _etag_matches(if_none_match, variants.etag(encoding)):
+        return StaticAssetResponse(304, cache_headers)
+
+    body = variants.body(encoding)
+    headers = (
+        ('content-type', _CONTENT_TYPES[relative_path.rpartition('.')[2]]),
+        ('content-length', str(len(body))),
+        *((('content-encoding', encoding),) if encoding != 'identity' else ()),
+        *cache_headers,
+    )
+    return StaticAssetResponse(200, headers, b'' if method == 'HEAD' else body)
+
+
+def create_asgi_static_app() -> Callable[..., Awaitable[None]]:
+    """Return an ASGI app serving hashed vendored assets (mount it at the static prefix)."""
+
+    async def app(scope: Mapping[str, Any], receive: Callable[..., Awaitable[Any]], send: Callable[..., Awaitable[None]]) -> None:
+        if scope.get('type') != 'http':
+            return
+
+        path = scope.get('path', '')
+        root_path = scope.get('root_path', '')
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+
+        if_none_match = None
+        accept_encoding = None
+        for name, value in scope.get('headers') or []:
+            name = name.lower()
+            if name == b'if-none-match':
+                if_none_match = value.decode('latin-1')
+            elif name == b'accept-encoding':
+                accept_encoding = value.decode('latin-1')
+
+        response = serve_static_asset(
+            path,
+            method=scope.get('method', 'GET'),
+            if_none_match=if_none_match,
+            accept_encoding=accept_encoding,
+        )
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': response.status,
+                'headers': [(name.encode('latin-1'), value.encode('latin-1')) for name, value in response.headers],
+            }
+        )
+        await send({'type': 'http.response.body', 'body': response.body})
+
+    return app
+
+
+def create_wsgi_static_app() -> Callable[[Dict[str, Any], Callable[..., Any]], Iterable[bytes]]:
+    """Return a WSGI app serving hashed vendored assets (mount it at the static prefix)."""
+
+    def app(environ: Dict[str, Any], start_response: Callable[..., Any]) -> List[bytes]:
+        response = serve_static_asset(
+            environ.get('PATH_INFO', ''),
+            method=environ.get('REQUEST_METHOD', 'GET'),
+            if_none_match=environ.get('HTTP_IF_NONE_MATCH'),
+            accept_encoding=environ.get('HTTP_ACCEPT_ENCODING'),
+        )
+        start_response(response.status_line, list(response.headers))
+        return [response.body]
+
+    return app
+
+
+__all__ = [
+    'IMMUTABLE_CACHE_CONTROL',
+    'StaticAssetResponse',
+    'create_asgi_static_app',
+    'create_wsgi_static_app',
+    'serve_static_asset',
+    'static_asset_index',
+]
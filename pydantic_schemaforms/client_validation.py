@@ -0,0 +1,278 @@
+"""Per-form rule descriptors for the static client validation runtime.
+
+Browser-side checks live in one static file, ``assets/js/schemaforms-validation.js``, that
+is identical for every form: it is inlined with ``asset_mode="vendored"`` and served as a
+hashed, immutable file with ``asset_mode="local-static"``. A rendered form only carries a
+compact JSON descriptor of its rules::
+
+    <script type="application/json" data-schemaforms-rules>
+    {"fields":{"age":[{"type":"numeric_range","message":"Must be at least 18","min":18}]}}
+    </script>
+
+Descriptors combine the pydantic constraints already collected in the model's
+:class:`~.rendering.schema_parser.SchemaMetadata` (required, minLength, maxLength,
+pattern, minimum, maximum, enum) with the client-side rules of a
+:class:`~.validation.FormValidator`. Rule types the runtime does not implement (custom
+callbacks, async rules) are left out and stay server-side.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+from collections import OrderedDict
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .assets.runtime import validation_runtime_script_tag
+from .validation import (
+    EmailRule,
+    MaxLengthRule,
+    MinLengthRule,
+    NumericRangeRule,
+    RegexRule,
+    RequiredRule,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .validation import FormValidator
+
+# Rule types implemented by the runtime; anything else is validated by the server only.
+CLIENT_RULE_TYPES = frozenset(
+    {
+        "required",
+        "min_length",
+        "max_length",
+        "regex",
+        "email",
+        "phone",
+        "numeric_range",
+        "date_range",
+        "enum",
+    }
+)
+
+_SCALAR_TYPES = frozenset({"string", "integer", "number"})
+
+FieldRules = Dict[str, List[Dict[str, Any]]]
+
+
+def _compact(descriptor: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the ``client`` flag and unset parameters from a rule descriptor."""
+
+    return {key: value for key, value in descriptor.items() if key != "client" and value is not None}
+
+
+def _scalar_schema(field_schema: Dict[str, Any], schema_defs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the schema of a single-valued text/number/choice field, ``None`` otherwise.
+
+    ``Optional[...]`` fields are unwrapped and ``$ref`` enums resolved; booleans, arrays and
+    nested models have no client rules.
+    """
+
+    variants = [
+        variant
+        for variant in field_schema.get("anyOf") or (field_schema,)
+        if variant.get("type") != "null"
+    ]
+    if len(variants) != 1:
+        return None
+    variant = variants[0]
+    ref = variant.get("$ref")
+    if ref:
+        variant = schema_defs.get(ref.rsplit("/", 1)[-1], {})
+    if "enum" in variant or variant.get("type") in _SCALAR_TYPES:
+        return variant
+    return None
+
+
+def _numeric_rule(schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    low_exclusive = "exclusiveMinimum" in schema
+    high_exclusive = "exclusiveMaximum" in schema
+    low = schema.get("exclusiveMinimum") if low_exclusive else schema.get("minimum")
+    high = schema.get("exclusiveMaximum") if high_exclusive else schema.get("maximum")
+    if low is None and high is None:
+        return None
+
+    descriptor = NumericRangeRule(low, high).to_descriptor()
+    if low_exclusive or high_exclusive:
+        parts = []
+        if low is not None:
+            parts.append(f"greater than {low}" if low_exclusive else f"at least {low}")
+        if high is not None:
+            parts.append(f"less than {high}" if high_exclusive else f"no more than {high}")
+        descriptor["message"] = "Must be " + " and ".join(parts)
+        descriptor["exclusive_min"] = low_exclusive or None
+        descriptor["exclusive_max"] = high_exclusive or None
+    return descriptor
+
+
+def _schema_field_rules(schema: Dict[str, Any], required: bool) -> List[Dict[str, Any]]:
+    descriptors = []
+    if required:
+        descriptors.append(RequiredRule().to_descriptor())
+    if "minLength" in schema:
+        descriptors.append(MinLengthRule(schema["minLength"]).to_descriptor())
+    if "maxLength" in schema:
+        descriptors.append(MaxLengthRule(schema["maxLength"]).to_descriptor())
+    if "pattern" in schema:
+        descriptors.append(RegexRule(schema["pattern"]).to_descriptor())
+    if schema.get("format") == "email":
+        descriptors.append(EmailRule().to_descriptor())
+    if schema.get("type") in ("integer", "number"):
+        numeric = _numeric_rule(schema)
+        if numeric is not None:
+            descriptors.append(numeric)
+    if "enum" in schema:
+        descriptors.append(
+            {"type": "enum", "message": "Please select a valid option", "values": list(schema["enum"])}
+        )
+    return [_compact(descriptor) for descriptor in descriptors]
+
+
+def _schema_rules(metadata: Any) -> FieldRules:
+    """Client rules for every top-level scalar field of ``metadata``."""
+
+    from .rendering.schema_parser import MULTI_VALUE_UI_ELEMENTS, resolve_ui_element
+
+    required_fields = set(metadata.required_fields)
+    rules: FieldRules = {}
+    for field_name, field_schema in metadata.non_layout_fields:
+        if field_name in metadata.array_fields or resolve_ui_element(field_schema) in MULTI_VALUE_UI_ELEMENTS:
+            continue
+        schema = _scalar_schema(field_schema, metadata.schema_defs)
+        if schema is None:
+            continue
+        field_rules = _schema_field_rules(schema, field_name in required_fields)
+        if field_rules:
+            rules[field_name] = field_rules
+    return rules
+
+
+def _validator_rules(validator: "FormValidator") -> FieldRules:
+    rules: FieldRules = {}
+    for field_name, field_validator in validator.field_validators.items():
+        field_rules = [
+            _compact(descriptor)
+            for descriptor in field_validator.to_rule_descriptors()
+            if descriptor["client"] and descriptor["type"] in CLIENT_RULE_TYPES
+        ]
+        if field_rules:
+            rules[field_name] = field_rules
+    return rules
+
+
+def _serialize(fields: FieldRules) -> str:
+    # "<" only occurs inside JSON strings, where < is equivalent and cannot close the tag.
+    return json.dumps({"fields": fields}, separators=(",", ":"), ensure_ascii=False).replace(
+        "<", "\\u003c"
+    )
+
+
+_CLIENT_RULES_CACHE_MAX = 256
+# model -> (schema metadata the entry was built from, rules, serialized descriptor)
+_client_rules_cache: "OrderedDict[type, Tuple[Any, FieldRules, str]]" = OrderedDict()
+_client_rules_cache_lock = RLock()
+
+
+def _model_entry(model_cls: Any) -> Optional[Tuple[Any, FieldRules, str]]:
+    """Return the cached rules for ``model_cls``, rebuilt with its schema metadata."""
+
+    if model_cls is None or not hasattr(model_cls, "model_json_schema"):
+        return None
+    from .rendering.schema_parser import build_schema_metadata
+
+    try:
+        metadata = build_schema_metadata(model_cls)
+    except Exception:  # pragma: no cover - models without a JSON schema get no schema rules
+        return None
+
+    with _client_rules_cache_lock:
+        entry = _client_rules_cache.get(model_cls)
+        if entry is not None and entry[0] is metadata:
+            _client_rules_cache.move_to_end(model_cls)
+            return entry
+        rules = _schema_rules(metadata)
+        entry = (metadata, rules, _serialize(rules))
+        _client_rules_cache[model_cls] = entry
+        _client_rules_cache.move_to_end(model_cls)
+        if len(_client_rules_cache) > _CLIENT_RULES_CACHE_MAX:
+            _client_rules_cache.popitem(last=False)
+        return entry
+
+
+def reset_client_rules_cache() -> None:
+    """Clear the per-model rule descriptors (used in tests or hot reload)."""
+
+    with _client_rules_cache_lock:
+        _client_rules_cache.clear()
+
+
+def form_rule_descriptor(
+    model_cls: Any = None, *, validator: Optional["FormValidator"] = None
+) -> Dict[str, Any]:
+    """Return the ``{"fields": {name: [rule, ...]}}`` descriptor read by the runtime.
+
+    A validator's rules take precedence over schema rules of the same type on a field.
+    """
+
+    entry = _model_entry(model_cls)
+    fields: FieldRules = {name: list(rules) for name, rules in entry[1].items()} if entry else {}
+    if validator is not None:
+        for field_name, field_rules in _validator_rules(validator).items():
+            overridden = {descriptor["type"] for descriptor in field_rules}
+            merged = [
+                descriptor
+                for descriptor in fields.get(field_name, ())
+                if descriptor["type"] not in overridden
+            ] + field_rules
+            # The runtime reports the first failing rule; "required" goes first.
+            merged.sort(key=lambda descriptor: descriptor["type"] != "required")
+            fields[field_name] = merged
+    return {"fields": fields}
+
+
+def rule_descriptor_tag(descriptor: Dict[str, Any], *, form_id: Optional[str] = None) -> str:
+    """Return the JSON ``<script>`` carrying ``descriptor``.
+
+    The runtime binds it to the form with ``form_id``, or else to the nearest preceding form.
+    """
+
+    return _descriptor_tag(_serialize(descriptor.get("fields", {})), form_id)
+
+
+def _descriptor_tag(payload: str, form_id: Optional[str]) -> str:
+    form_attr = f' data-form="{html.escape(form_id, quote=True)}"' if form_id else ""
+    return f'<script type="application/json" data-schemaforms-rules{form_attr}>{payload}</script>'
+
+
+def client_validation_tags(
+    model_cls: Any = None,
+    *,
+    validator: Optional["FormValidator"] = None,
+    asset_mode: str = "vendored",
+    form_id: Optional[str] = None,
+) -> str:
+    """Return the rule descriptor followed by the runtime ``<script>`` for one form.
+
+    Place it after the form. With ``asset_mode="none"`` only the descriptor is emitted and
+    the page is expected to load the runtime itself.
+    """
+
+    if validator is None:
+        entry = _model_entry(model_cls)
+        payload = entry[2] if entry else _serialize({})
+    else:
+        payload = _serialize(form_rule_descriptor(model_cls, validator=validator)["fields"])
+    runtime = validation_runtime_script_tag(asset_mode=asset_mode)
+    descriptor = _descriptor_tag(payload, form_id)
+    return f"{descriptor}\n{runtime}" if runtime else descriptor
+
+
+__all__ = [
+    "CLIENT_RULE_TYPES",
+    "client_validation_tags",
+    "form_rule_descriptor",
+    "reset_client_rules_cache",
+    "rule_descriptor_tag",
+]
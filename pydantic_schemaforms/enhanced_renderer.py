@@ -14,20 +14,36 @@ import logging
 import re
 import time
 from functools import partial
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
-
-from .html_markers import wrap_with_schemaforms_markers
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from .html_markers import iter_with_schemaforms_markers, wrap_with_schemaforms_markers
+from .instrumentation import (
+    NULL_RECORDER,
+    PHASE_ASSETS,
+    PHASE_DEFAULTS,
+    PHASE_LAYOUT,
+    PHASE_MARKERS,
+    PHASE_RENDER_PLAN,
+    PHASE_SCHEMA_METADATA,
+    PHASE_WRAPPER,
+    begin_render,
+)
 from .rendering.context import RenderContext
 from .rendering.field_renderer import FieldRenderer
 from .rendering.frameworks import get_framework_config
 from .rendering.layout_engine import LayoutEngine, get_nested_form_data
-from .rendering.schema_parser import SchemaMetadata, build_schema_metadata, resolve_ui_element
+from .rendering.render_plan import RenderPlan, get_render_plan
+from .rendering.renderer_pool import get_pooled_renderer
+from .rendering.schema_parser import SchemaMetadata, build_schema_metadata
 from .rendering.themes import RendererTheme, get_theme_for_framework
 from .schema_form import FormModel
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Stands in for the form body while the wrapper is rendered ahead of the fields.
+_FORM_CONTENT_PLACEHOLDER = "\x00schemaforms-form-content\x00"
+
 
 class SchemaFormValidationError(Exception):
     """Raised when validation errors match the SchemaForm contract."""
@@ -89,16 +105,130 @@ class EnhancedFormRenderer:
         # Start timing
         start_time = time.perf_counter()
 
-        metadata: SchemaMetadata = build_schema_metadata(model_cls)
         data = dict(data or {})
-        errors = errors or {}
+        combined_output = "".join(
+            self._iter_form_fragments(
+                model_cls,
+                data,
+                errors,
+                submit_url=submit_url,
+                method=method,
+                include_csrf=include_csrf,
+                include_submit_button=include_submit_button,
+                layout=layout,
+                show_timing=show_timing,
+                enable_logging=enable_logging,
+                **kwargs,
+            )
+        )
 
-        context = RenderContext(form_data=data, schema_defs=metadata.schema_defs)
+        if not debug:
+            return combined_output
 
-        if isinstance(errors, dict) and "errors" in errors:
-            errors = {err.get("name", ""): err.get("message", "") for err in errors["errors"]}
+        return combined_output + self._build_debug_panel(
+            form_html=combined_output,
+            model_cls=model_cls,
+            data=data,
+            errors=self._normalize_errors(errors),
+            metadata=build_schema_metadata(model_cls),
+            render_time=time.perf_counter() - start_time,
+        )
 
-        error_summary_markup = self._render_error_summary(errors)
+    def iter_form_from_model(
+        self,
+        model_cls: Type[FormModel],
+        data: Optional[Dict[str, Any]] = None,
+        errors: Optional[Dict[str, Any]] = None,
+        *,
+        submit_url: str = "/submit",
+        method: str = "POST",
+        include_csrf: bool = False,
+        include_submit_button: bool = True,
+        layout: str = "vertical",
+        show_timing: bool = False,
+        enable_logging: bool = False,
+        **kwargs,
+    ) -> Iterator[str]:
+        """Yield the form produced by ``render_form_from_model`` as ordered HTML fragments.
+
+        Fragments come out as they are rendered: layout styles, the theme prelude and
+        ``<form>`` open tag, one fragment per field, then the submit button/closing tag
+        and any model-list scripts. ``"".join(...)`` of the fragments equals the
+        ``render_form_from_model`` output (without the debug panel).
+        """
+
+        return self._iter_form_fragments(
+            model_cls,
+            dict(data or {}),
+            errors,
+            submit_url=submit_url,
+            method=method,
+            include_csrf=include_csrf,
+            include_submit_button=include_submit_button,
+            layout=layout,
+            show_timing=show_timing,
+            enable_logging=enable_logging,
+            **kwargs,
+        )
+
+    def _iter_form_fragments(
+        self,
+        model_cls: Type[FormModel],
+        data: Dict[str, Any],
+        errors: Optional[Dict[str, Any]],
+        *,
+        submit_url: str,
+        method: str,
+        include_csrf: bool,
+        include_submit_button: bool,
+        layout: str,
+        show_timing: bool,
+        enable_logging: bool,
+        **kwargs,
+    ) -> Iterator[str]:
+        recorder = begin_render(model_cls, "EnhancedFormRenderer", framework=self.framework, layout=layout)
+        return recorder.track(
+            self._generate_form_fragments(
+                model_cls,
+                data,
+                errors,
+                recorder,
+                submit_url=submit_url,
+                method=method,
+                include_csrf=include_csrf,
+                include_submit_button=include_submit_button,
+                layout=layout,
+                show_timing=show_timing,
+                enable_logging=enable_logging,
+                **kwargs,
+            )
+        )
+
+    def _generate_form_fragments(
+        self,
+        model_cls: Type[FormModel],
+        data: Dict[str, Any],
+        errors: Optional[Dict[str, Any]],
+        recorder: Any,
+        *,
+        submit_url: str,
+        method: str,
+        include_csrf: bool,
+        include_submit_button: bool,
+        layout: str,
+        show_timing: bool,
+        enable_logging: bool,
+        **kwargs,
+    ) -> Iterator[str]:
+        # ``data`` is updated in place with layout defaults so callers can inspect it.
+        start_time = time.perf_counter()
+
+        metadata: SchemaMetadata = build_schema_metadata(model_cls)
+        recorder.mark(PHASE_SCHEMA_METADATA)
+        recorder.observe_fields(metadata)
+        errors = self._normalize_errors(errors)
+
+        context = RenderContext(form_data=data, schema_defs=metadata.schema_defs)
 
         default_form_class = self._theme.form_class() or self.config.get("form_class", "")
         form_attrs = {
@@ -112,108 +242,150 @@ class EnhancedFormRenderer:
         form_attrs = self._theme.transform_form_attributes(form_attrs)
 
         csrf_markup = self._render_csrf_field() if include_csrf else ""
-        form_body_parts: List[str] = []
+        submit_markup = self._render_submit_button() if include_submit_button else ""
 
-        fields = metadata.fields
-        required_fields = metadata.required_fields
-        layout_fields = metadata.layout_fields
-        non_layout_fields = metadata.non_layout_fields
+        plan = get_render_plan(self, model_cls, metadata, layout)
+        recorder.mark(PHASE_RENDER_PLAN)
 
-        if layout_fields:
-            model_fields = getattr(model_cls, "model_fields", {}) or {}
-            for field_name, _field_schema in layout_fields:
-                if field_name in data:
-                    continue
-                field_info = model_fields.get(field_name)
-                if not field_info:
+        for field_name, field_info in plan.layout_defaults:
+            if field_name in data:
+                continue
+            default_factory = getattr(field_info, "default_factory", None)
+            if default_factory is not None:
+                try:
+                    data[field_name] = default_factory()
+                except Exception:  # pragma: no cover - defensive
                     continue
-                default_factory = getattr(field_info, "default_factory", None)
-                if default_factory is not None:
-                    try:
-                        data[field_name] = default_factory()
-                    except Exception:  # pragma: no cover - defensive
-                        continue
-                elif not field_info.is_required():
-                    default_value = getattr(field_info, "default", None)
-                    if default_value is not None:
-                        data[field_name] = default_value
-
-        if len(layout_fields) > 1 and len(non_layout_fields) == 0:
-            form_body_parts.extend(
-                self._render_layout_fields_as_tabs(
-                    layout_fields,
-                    data,
-                    errors,
-                    required_fields,
-                    context,
-                )
-            )
-        elif layout == "tabbed":
-            form_body_parts.extend(
-                self._render_tabbed_layout(fields, data, errors, required_fields, context)
-            )
-        elif layout == "side-by-side":
-            form_body_parts.extend(
-                self._render_side_by_side_layout(fields, data, errors, required_fields, context)
+            elif not field_info.is_required():
+                default_value = getattr(field_info, "default", None)
+                if default_value is not None:
+                    data[field_name] = default_value
+        recorder.mark(PHASE_DEFAULTS)
+
+        body_parts = self._iter_form_body(plan, data, errors, context, layout, recorder)
+
+        layout_styles = self._render_layout_support_styles()
+        recorder.mark(PHASE_ASSETS)
+        yield layout_styles
+        yield "\n"
+
+        # Render the wrapper around a placeholder so the open tag can be sent before the
+        # fields exist. The timing display needs the final render time, and a custom
+        # wrapper might not embed the content verbatim; both fall back to buffering.
+        wrapper = ""
+        if not show_timing:
+            wrapper = self._theme.render_form_wrapper(
+                form_attrs=form_attrs,
+                csrf_token=csrf_markup,
+                form_content=_FORM_CONTENT_PLACEHOLDER,
+                submit_markup=submit_markup,
+                render_time=None,
             )
+            recorder.mark(PHASE_WRAPPER)
+
+        head, placeholder, tail = wrapper.partition(_FORM_CONTENT_PLACEHOLDER)
+        if placeholder and _FORM_CONTENT_PLACEHOLDER not in tail:
+            yield head
+            for index, part in enumerate(body_parts):
+                yield f"\n{part}" if index else part
+            render_time = time.perf_counter() - start_time
+            yield tail
         else:
-            for field_name, field_schema in fields:
-                form_body_parts.append(
-                    self._render_field(
-                        field_name,
-                        field_schema,
-                        data.get(field_name),
-                        errors.get(field_name),
-                        required_fields,
-                        context,
-                        layout,
-                        errors,
-                    )
-                )
-
-        if error_summary_markup:
-            form_body_parts.insert(0, error_summary_markup)
-
-        submit_markup = self._render_submit_button() if include_submit_button else ""
-
-        # Calculate render time before form_wrapper (we'll add timing display inside form)
-        render_time = time.perf_counter() - start_time
-
-        form_markup = self._theme.render_form_wrapper(
-            form_attrs=form_attrs,
-            csrf_token=csrf_markup,
-            form_content="\n".join(form_body_parts),
-            submit_markup=submit_markup,
-            render_time=render_time if show_timing else None,
-        )
-
-        output_parts = [self._render_layout_support_styles(), form_markup]
+            form_content = "\n".join(body_parts)
+            render_time = time.perf_counter() - start_time
+            form_html = self._theme.render_form_wrapper(
+                form_attrs=form_attrs,
+                csrf_token=csrf_markup,
+                form_content=form_content,
+                submit_markup=submit_markup,
+                render_time=render_time if show_timing else None,
+            )
+            recorder.mark(PHASE_WRAPPER)
+            yield form_html
 
-        has_model_list_fields = any(
-            resolve_ui_element(field_schema) == "model_list" for _name, field_schema in fields
-        )
-        if has_model_list_fields:
+        if plan.has_model_list_fields:
             from .model_list import ModelListRenderer
 
             list_renderer = ModelListRenderer(framework=self._model_list_framework())
-            output_parts.append(list_renderer.get_model_list_javascript())
-
-        combined_output = "\n".join(output_parts)
+            model_list_js = list_renderer.get_model_list_javascript()
+            recorder.mark(PHASE_ASSETS)
+            yield "\n"
+            yield model_list_js
 
         if enable_logging:
             logger.debug(f"Form rendered in {render_time:.3f} seconds (model: {model_cls.__name__})")
 
-        if not debug:
-            return combined_output
+    def _iter_form_body(
+        self,
+        plan: RenderPlan,
+        data: Dict[str, Any],
+        errors: Dict[str, Any],
+        context: RenderContext,
+        layout: str,
+        recorder: Any = NULL_RECORDER,
+    ) -> Iterator[str]:
+        """Yield the error summary and field markup in document order."""
 
-        return combined_output + self._build_debug_panel(
-            form_html=combined_output,
-            model_cls=model_cls,
-            data=data,
-            errors=errors,
-            metadata=metadata,
-            render_time=render_time,
-        )
+        metadata = plan.metadata
+        fields = metadata.fields
+        required_fields = metadata.required_fields
+        layout_fields = metadata.layout_fields
+
+        error_summary_markup = self._render_error_summary(errors)
+        if error_summary_markup:
+            yield error_summary_markup
+
+        if len(layout_fields) > 1 and len(metadata.non_layout_fields) == 0:
+            layout_parts = self._render_layout_fields_as_tabs(
+                layout_fields,
+                data,
+                errors,
+                required_fields,
+                context,
+            )
+            recorder.mark(PHASE_LAYOUT)
+            yield from layout_parts
+        elif layout == "tabbed":
+            layout_parts = self._render_tabbed_layout(fields, data, errors, required_fields, context)
+            recorder.mark(PHASE_LAYOUT)
+            yield from layout_parts
+        elif layout == "side-by-side":
+            layout_parts = self._render_side_by_side_layout(fields, data, errors, required_fields, context)
+            recorder.mark(PHASE_LAYOUT)
+            yield from layout_parts
+        elif plan.fields and self._compiles_field_plans():
+            render_compiled = self._field_renderer.render_compiled_field
+            for field_plan in plan.fields:
+                field_html = render_compiled(
+                    field_plan,
+                    data.get(field_plan.name),
+                    errors.get(field_plan.name),
+                    context,
+                    errors,
+                )
+                recorder.mark_field(field_plan.ui_element)
+                yield field_html
+        else:
+            for field_name, field_schema in fields:
+                field_html = self._render_field(
+                    field_name,
+                    field_schema,
+                    data.get(field_name),
+                    errors.get(field_name),
+                    required_fields,
+                    context,
+                    layout,
+                    errors,
+                )
+                recorder.mark_schema_field(field_schema)
+                yield field_html
+
+    @staticmethod
+    def _normalize_errors(errors: Any) -> Dict[str, Any]:
+        errors = errors or {}
+        if isinstance(errors, dict) and "errors" in errors:
+            errors = {err.get("name", ""): err.get("message", "") for err in errors["errors"]}
+        return errors
 
     def render_form_fields_only(
         self,
@@ -307,6 +479,15 @@ class EnhancedFormRenderer:
             all_errors,
         )
 
+    def _compiles_field_plans(self) -> bool:
+        """Return True when this renderer uses the stock per-field rendering path.
+
+        False when a subclass overrides ``_render_field`` or an instance replaces it.
+        """
+
+        render_field = getattr(self._render_field, "__func__", None)
+        return render_field is EnhancedFormRenderer._render_field
+
     def _render_tabbed_layout(
         self,
         fields: List[Tuple[str, Dict[str, Any]]],
@@ -573,12 +754,12 @@ class EnhancedFormRenderer:
             model_source = f"Source not available for {model_cls.__name__}: {exc}"
 
         try:
-            schema_json = json.dumps(model_cls.model_json_schema(), indent=2, default=str)
+            schema_json = json.dumps(metadata.schema, indent=2, default=str)
         except Exception as exc:  # pragma: no cover - defensive
             schema_json = f"Schema generation failed: {exc}"
 
         try:
-            schema = model_cls.model_json_schema()
+            schema = metadata.schema
             required = set(schema.get("required", []) or [])
             properties = schema.get("properties", {}) or {}
             validation_rules: Dict[str, Any] = {}
@@ -725,25 +906,13 @@ class EnhancedFormRenderer:
         return panel
 
 
-def render_form_html(
-    form_model_cls: Type[FormModel],
-    form_data: Optional[Dict[str, Any]] = None,
-    errors: Optional[Union[Dict[str, str], SchemaFormValidationError]] = None,
-    framework: str = "bootstrap",
-    layout: str = "vertical",
-    debug: bool = False,
-    show_timing: bool = False,
-    enable_logging: bool = False,
-    *,
-    include_html_markers: bool = True,
-    **kwargs,
-) -> str:
-    """Convenience wrapper mirroring the legacy helper."""
+def _resolve_form_html_renderer(framework: str, kwargs: Dict[str, Any]) -> Tuple[EnhancedFormRenderer, str]:
+    """Pop the legacy asset/submit knobs from ``kwargs`` and return (renderer, submit_url)."""
 
     # Backwards-compatible knobs (historically accepted via kwargs).
     # - self_contained: inline framework assets (CSS/JS) for the selected framework.
     # - include_framework_assets: explicit opt-in for framework assets.
-    # - asset_mode: 'vendored' (inline) or 'cdn' (external).
+    # - asset_mode: 'vendored' (inline), 'local-static' (hashed local URLs) or 'cdn' (external).
     self_contained = bool(kwargs.pop("self_contained", False))
     include_framework_assets = bool(kwargs.pop("include_framework_assets", False))
     asset_mode = str(kwargs.pop("asset_mode", "vendored"))
@@ -756,18 +925,47 @@ def render_form_html(
     if self_contained:
         include_framework_assets = True
 
+    if framework == "material":
+        return get_pooled_renderer(framework), submit_url
+
+    renderer = get_pooled_renderer(
+        framework,
+        include_framework_assets=include_framework_assets,
+        asset_mode=asset_mode,
+    )
+    return renderer, submit_url
+
+
+def _normalize_validation_errors(
+    errors: Optional[Union[Dict[str, str], SchemaFormValidationError]],
+) -> Optional[Dict[str, str]]:
     if isinstance(errors, SchemaFormValidationError):
-        error_dict = {err.get("name", ""): err.get("message", "") for err in errors.errors}
-        errors = error_dict
+        return {err.get("name", ""): err.get("message", "") for err in errors.errors}
+    return errors
 
-    if framework == "material":
-        from pydantic_schemaforms.simple_material_renderer import SimpleMaterialRenderer
 
-        renderer = SimpleMaterialRenderer()
+def render_form_html(
+    form_model_cls: Type[FormModel],
+    form_data: Optional[Dict[str, Any]] = None,
+    errors: Optional[Union[Dict[str, str], SchemaFormValidationError]] = None,
+    framework: str = "bootstrap",
+    layout: str = "vertical",
+    debug: bool = False,
+    show_timing: bool = False,
+    enable_logging: bool = False,
+    *,
+    include_html_markers: bool = True,
+    **kwargs,
+) -> str:
+    """Convenience wrapper mirroring the legacy helper."""
+
+    recorder = begin_render(form_model_cls, "render_form_html", framework=framework, layout=layout)
+    with recorder.activate():
+        renderer, submit_url = _resolve_form_html_renderer(framework, kwargs)
         html = renderer.render_form_from_model(
             form_model_cls,
             data=form_data,
-            errors=errors,
+            errors=_normalize_validation_errors(errors),
             submit_url=submit_url,
             layout=layout,
             debug=debug,
@@ -775,25 +973,40 @@ def render_form_html(
             enable_logging=enable_logging,
             **kwargs,
         )
-        return wrap_with_schemaforms_markers(html, enabled=include_html_markers)
+    html = wrap_with_schemaforms_markers(html, enabled=include_html_markers)
+    recorder.mark(PHASE_MARKERS)
+    recorder.finish(html)
+    return html
 
-    renderer = EnhancedFormRenderer(
-        framework=framework,
-        include_framework_assets=include_framework_assets,
-        asset_mode=asset_mode,
-    )
-    html = renderer.render_form_from_model(
-        form_model_cls,
-        data=form_data,
-        errors=errors,
-        submit_url=submit_url,
-        layout=layout,
-        debug=debug,
-        show_timing=show_timing,
-        enable_logging=enable_logging,
-        **kwargs,
-    )
-    return wrap_with_schemaforms_markers(html, enabled=include_html_markers)
+
+def iter_form_html(
+    form_model_cls: Type[FormModel],
+    form_data: Optional[Dict[str, Any]] = None,
+    errors: Optional[Union[Dict[str, str], SchemaFormValidationError]] = None,
+    framework: str = "bootstrap",
+    layout: str = "vertical",
+    show_timing: bool = False,
+    enable_logging: bool = False,
+    *,
+    include_html_markers: bool = True,
+    **kwargs,
+) -> Iterator[str]:
+    """Streaming counterpart of :func:`render_form_html` yielding HTML fragments in order."""
+
+    recorder = begin_render(form_model_cls, "iter_form_html", streamed=True, framework=framework, layout=layout)
+    with recorder.activate():
+        renderer, submit_url = _resolve_form_html_renderer(framework, kwargs)
+        fragments = renderer.iter_form_from_model(
+            form_model_cls,
+            data=form_data,
+            errors=_normalize_validation_errors(errors),
+            submit_url=submit_url,
+            layout=layout,
+            show_timing=show_timing,
+            enable_logging=enable_logging,
+            **kwargs,
+        )
+    return recorder.track(iter_with_schemaforms_markers(fragments, enabled=include_html_markers))
 
 
 async def render_form_html_async(
@@ -11,15 +11,102 @@ Server-side validation expects the corresponding nested Python shape:
 - ``{"pets": [{"name": "..."}]}``
 
 These helpers are intentionally framework-agnostic (FastAPI/Flask/etc.).
+
+Submissions come from untrusted clients, so parsing is bounded by
+:class:`FormDataLimits` (largest list index, nesting depth, key count and value
+size). A limit violation raises :class:`FormDataLimitError` before any large
+allocation happens.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Iterable, Mapping, MutableMapping
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import RLock
+from typing import Any, Callable, Collection, Dict, FrozenSet, Iterable, List, Mapping, MutableMapping, Optional
 
 
 _FORM_PATH_TOKEN_RE = re.compile(r"([^\.\[\]]+)|\[(\d+)\]")
+_PATH_SEPARATORS = frozenset(".[]")
+
+# Keys longer than this are tokenised without caching so hostile keys cannot pin memory.
+_MAX_CACHED_PATH_LENGTH = 256
+# Index tokens with more digits than this are clamped so ``int()`` stays cheap.
+_MAX_INDEX_DIGITS = 18
+_INDEX_OVERFLOW = 10**_MAX_INDEX_DIGITS
+
+
+@dataclass(frozen=True)
+class FormDataLimits:
+    """Upper bounds applied by :func:`parse_nested_form_data`; ``None`` disables a limit.
+
+    Attributes:
+        max_index: Largest list index accepted in a key such as ``pets[12].name``.
+        max_depth: Most path segments in one key (``pets[0].name`` has three).
+        max_keys: Most keys in one submission.
+        max_value_bytes: Largest UTF-8 size of a single string/bytes value.
+    """
+
+    max_index: Optional[int] = 1_000
+    max_depth: Optional[int] = 32
+    max_keys: Optional[int] = 10_000
+    max_value_bytes: Optional[int] = None
+
+    @classmethod
+    def unbounded(cls) -> "FormDataLimits":
+        """Limits that accept anything (only for trusted input)."""
+
+        return cls(max_index=None, max_depth=None, max_keys=None, max_value_bytes=None)
+
+
+DEFAULT_FORM_DATA_LIMITS = FormDataLimits()
+
+
+class FormDataLimitError(ValueError):
+    """Raised when a submission exceeds one of the :class:`FormDataLimits`.
+
+    ``limit`` names the exceeded limit (``"max_index"``, ``"max_depth"``,
+    ``"max_keys"`` or ``"max_value_bytes"``), ``key`` the offending form key,
+    ``value`` the measured size and ``maximum`` the configured bound. ``errors``
+    holds the same information in the ``[{"name", "message", "type"}]`` shape used
+    for other form errors.
+    """
+
+    def __init__(self, limit: str, key: str, value: int, maximum: int):
+        self.limit = limit
+        self.key = key
+        self.value = value
+        self.maximum = maximum
+        message = f"Form data exceeds {limit}={maximum} (got {value})"
+        self.errors: List[Dict[str, Any]] = [
+            {"name": key, "message": message, "type": f"form_data_{limit}"}
+        ]
+        super().__init__(f"{message} for key {key!r}")
+
+
+class FormDataShapeError(ValueError):
+    """Raised when form keys use one path with conflicting shapes.
+
+    For example ``a[0]`` and ``a.b`` treat ``a`` as both a list and a mapping, and ``a``
+    with ``a.b`` as both a value and a mapping. ``key`` is the form key that hit the
+    conflict and ``path`` the conflicting prefix. ``errors`` uses the
+    ``[{"name", "message", "type"}]`` shape of :class:`FormDataLimitError`.
+    """
+
+    def __init__(self, key: str, path: str):
+        self.key = key
+        self.path = path
+        message = f"Form data uses {path!r} with conflicting shapes"
+        self.errors: List[Dict[str, Any]] = [
+            {"name": key, "message": message, "type": "form_data_shape"}
+        ]
+        super().__init__(f"{message} (key {key!r})")
+
+
+class _SparseList(dict):
+    """Index -> value mapping standing in for a list until parsing finishes."""
 
 
 def coerce_form_value(value: Any) -> Any:
@@ -32,27 +119,37 @@ def coerce_form_value(value: Any) -> Any:
     - "on"/"off"/"yes"/"no"/"1"/"0" -> bool
     """
 
-    if isinstance(value, str):
-        lowered = value.lower()
-        if lowered in {"true", "on", "yes", "1"}:
-            return True
-        if lowered in {"false", "off", "no", "0"}:
-            return False
-    return value
+    return _coerce_bool(value)
 
 
-def _tokenize_form_path(path: str) -> list[str | int]:
+def _scan_form_path(path: str) -> tuple[str | int, ...]:
     tokens: list[str | int] = []
     for name_token, index_token in _FORM_PATH_TOKEN_RE.findall(path):
         if name_token:
             tokens.append(name_token)
         elif index_token:
-            tokens.append(int(index_token))
-    return tokens
+            if len(index_token) > _MAX_INDEX_DIGITS:
+                tokens.append(_INDEX_OVERFLOW)
+            else:
+                tokens.append(int(index_token))
+    return tuple(tokens)
+
+
+_scan_form_path_cached = lru_cache(maxsize=2048)(_scan_form_path)
 
 
-def _new_container(next_token: str | int | None) -> dict[str, Any] | list[Any]:
-    return [] if isinstance(next_token, int) else {}
+def _tokenize_form_path(path: str) -> tuple[str | int, ...]:
+    """Split ``pets[0].name`` into ``("pets", 0, "name")``; results are LRU cached."""
+
+    if len(path) > _MAX_CACHED_PATH_LENGTH:
+        return _scan_form_path(path)
+    return _scan_form_path_cached(path)
+
+
+def _new_container(next_token: str | int | None, sparse: bool = False) -> dict[str, Any] | list[Any]:
+    if isinstance(next_token, int):
+        return _SparseList() if sparse else []
+    return {}
 
 
 def _assign_mapping_token(
@@ -62,13 +159,14 @@ def _assign_mapping_token(
     is_last: bool,
     next_token: str | int | None,
     value: Any,
+    sparse: bool = False,
 ) -> Any:
     if is_last:
         current[token] = value
         return None
 
     if token not in current or current[token] is None:
-        current[token] = _new_container(next_token)
+        current[token] = _new_container(next_token, sparse)
     return current[token]
 
 
@@ -76,14 +174,16 @@ def _coerce_to_list(
     current: Any,
     tokens: list[str | int],
     idx: int,
-) -> list[Any]:
-    if isinstance(current, list):
+    sparse: bool = False,
+) -> Any:
+    list_type = _SparseList if sparse else list
+    if isinstance(current, list_type):
         return current
 
     # If the data shape is inconsistent (e.g. a key used as both dict
     # and list), prefer overwriting with a list to match the path.
     current_parent = current
-    list_value: list[Any] = []
+    list_value = list_type()
     if idx > 0 and isinstance(tokens[idx - 1], str):
         current_parent[tokens[idx - 1]] = list_value
     return list_value
@@ -103,8 +203,17 @@ def _assign_list_token(
     is_last: bool,
     next_token: str | int | None,
     value: Any,
+    sparse: bool = False,
 ) -> Any:
-    current_list = _coerce_to_list(current, tokens, idx)
+    current_list = _coerce_to_list(current, tokens, idx, sparse)
+    if sparse:
+        if is_last:
+            current_list[token] = value
+            return None
+        if current_list.get(token) is None:
+            current_list[token] = _new_container(next_token, sparse)
+        return current_list[token]
+
     _ensure_list_index(current_list, token)
 
     if is_last:
@@ -116,13 +225,43 @@ def _assign_list_token(
     return current_list[token]
 
 
-def _assign_nested(container: MutableMapping[str, Any], tokens: list[str | int], value: Any) -> None:
+def _format_form_path(tokens: tuple[str | int, ...] | list[str | int]) -> str:
+    path = ""
+    for token in tokens:
+        if isinstance(token, int):
+            path += f"[{token}]"
+        else:
+            path += f".{token}" if path else token
+    return path
+
+
+def _assign_nested(
+    container: MutableMapping[str, Any],
+    tokens: tuple[str | int, ...] | list[str | int],
+    value: Any,
+    sparse: bool = False,
+    key: str | None = None,
+) -> None:
     current: Any = container
+    list_type = _SparseList if sparse else list
 
     for idx, token in enumerate(tokens):
         is_last = idx == len(tokens) - 1
         next_token = tokens[idx + 1] if not is_last else None
 
+        # An earlier key gave this path another shape (``a[0]`` vs ``a.b``, ``a`` vs ``a.b``,
+        # ``a.b`` vs ``a[0]``); only the root mapping may meet a leading index.
+        is_mapping = isinstance(current, dict) and not isinstance(current, _SparseList)
+        if isinstance(token, int):
+            shape_ok = isinstance(current, list_type) or (is_mapping and idx == 0)
+        else:
+            shape_ok = is_mapping
+        if not shape_ok:
+            raise FormDataShapeError(
+                key if key is not None else _format_form_path(tokens),
+                _format_form_path(tokens[:idx]),
+            )
+
         if isinstance(token, str):
             next_current = _assign_mapping_token(
                 current,
@@ -130,6 +269,7 @@ def _assign_nested(container: MutableMapping[str, Any], tokens: list[str | int],
                 is_last=is_last,
                 next_token=next_token,
                 value=value,
+                sparse=sparse,
             )
         else:
             next_current = _assign_list_token(
@@ -140,6 +280,7 @@ def _assign_nested(container: MutableMapping[str, Any], tokens: list[str | int],
                 is_last=is_last,
                 next_token=next_token,
                 value=value,
+                sparse=sparse,
             )
 
         if is_last:
@@ -148,39 +289,345 @@ def _assign_nested(container: MutableMapping[str, Any], tokens: list[str | int],
         current = next_current
 
 
+def _compact_sparse(value: Any) -> Any:
+    """Replace every ``_SparseList`` in ``value`` with a dense list ordered by index."""
+
+    if isinstance(value, _SparseList):
+        return [_compact_sparse(value[index]) for index in sorted(value)]
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, dict):
+                value[key] = _compact_sparse(item)
+    return value
+
+
+def _value_size_exceeds(value: Any, maximum: int) -> int:
+    """Return the UTF-8 size of ``value`` when it is over ``maximum``, else 0.
+
+    Lists and tuples (repeated multi-dict values) are checked item by item.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return next((size for size in (_value_size_exceeds(item, maximum) for item in value) if size), 0)
+    if isinstance(value, str):
+        # A str needs at most 4 bytes per character; skip encoding short values.
+        if len(value) * 4 <= maximum:
+            return 0
+        size = len(value.encode("utf-8"))
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+    else:
+        return 0
+    return size if size > maximum else 0
+
+
+def _check_path_limits(key: str, tokens: tuple[str | int, ...], limits: FormDataLimits) -> None:
+    if limits.max_depth is not None and len(tokens) > limits.max_depth:
+        raise FormDataLimitError("max_depth", key, len(tokens), limits.max_depth)
+    if limits.max_index is not None:
+        for token in tokens:
+            if isinstance(token, int) and token > limits.max_index:
+                raise FormDataLimitError("max_index", key, token, limits.max_index)
+
+
+def multi_value_fields(model_cls: Any) -> FrozenSet[str]:
+    """Names of ``model_cls`` fields that submit repeated keys (multiselect, checkbox groups, tags).
+
+    Read from the cached schema metadata, so repeated calls are cheap.
+    """
+
+    if model_cls is None or not hasattr(model_cls, "model_json_schema"):
+        return frozenset()
+    from .rendering.schema_parser import build_schema_metadata
+
+    try:
+        return build_schema_metadata(model_cls).array_fields
+    except Exception:  # pragma: no cover - models without a JSON schema keep scalar parsing
+        return frozenset()
+
+
+_TRUE_STRINGS = frozenset({"true", "on", "yes", "1"})
+_FALSE_STRINGS = frozenset({"false", "off", "no", "0"})
+# Nested model schemas are followed this many levels deep (guards recursive models).
+_MAX_COERCER_DEPTH = 8
+
+
+def _coerce_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    return value
+
+
+def _coerce_optional_bool(value: Any) -> Any:
+    return None if value == "" else _coerce_bool(value)
+
+
+def _empty_to_none(value: Any) -> Any:
+    return None if value == "" else value
+
+
+def _keep(value: Any) -> Any:
+    return value
+
+
+class FormCoercer:
+    """Per-model converters for raw submission values, compiled from ``SchemaMetadata``.
+
+    Unlike :func:`coerce_form_value`, which turns ``"1"``/``"on"``/``"no"`` into booleans
+    for every field, each known field path gets the conversion its schema calls for:
+
+    - boolean fields: ``"true"``/``"on"``/``"yes"``/``"1"`` and their opposites -> ``bool``
+    - optional numeric (and boolean) fields: ``""`` -> ``None``
+    - array fields (``array_fields``): collected as lists by the parsers
+    - every other field: left for pydantic
+
+    Paths are keyed with list indexes wildcarded (``("pets", None, "name")``). Paths the
+    schema does not describe keep the legacy :func:`coerce_form_value` behaviour.
+    """
+
+    def __init__(self, metadata: Any) -> None:
+        self.array_fields: FrozenSet[str] = metadata.array_fields
+        self._paths: Dict[tuple, Any] = {}
+        self._compile(metadata.fields, (), metadata.schema_defs, 0)
+        self._top_level: Dict[str, Any] = {
+            path[0]: converter for path, converter in self._paths.items() if len(path) == 1
+        }
+
+    def _compile(
+        self,
+        fields: Iterable[tuple[str, Dict[str, Any]]],
+        prefix: tuple,
+        defs: Dict[str, Any],
+        depth: int,
+    ) -> None:
+        for field_name, field_schema in fields:
+            self._compile_field(prefix + (field_name,), field_schema, defs, depth)
+
+    def _compile_field(
+        self, path: tuple, field_schema: Dict[str, Any], defs: Dict[str, Any], depth: int
+    ) -> None:
+        variants = [field_schema, *field_schema.get("anyOf", ())]
+        nullable = any(variant.get("type") == "null" for variant in variants)
+        types = {variant.get("type") for variant in variants} - {None, "null"}
+
+        for variant in variants:
+            nested = self._resolve_ref(variant, defs)
+            if nested is not None and depth < _MAX_COERCER_DEPTH:
+                self._compile(nested.get("properties", {}).items(), path, defs, depth + 1)
+            if variant.get("type") == "array":
+                items = variant.get("items") or {}
+                if isinstance(items, dict):
+                    self._compile_field(path + (None,), items, defs, depth + 1)
+
+        if types == {"boolean"}:
+            self._paths[path] = _coerce_optional_bool if nullable else _coerce_bool
+        elif types and types <= {"integer", "number"} and nullable:
+            self._paths[path] = _empty_to_none
+        else:
+            self._paths[path] = _keep
+
+    @staticmethod
+    def _resolve_ref(variant: Dict[str, Any], defs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        ref = variant.get("$ref")
+        if not isinstance(ref, str) or not ref.startswith("#/$defs/"):
+            return None
+        return defs.get(ref[len("#/$defs/"):])
+
+    def converter_for(self, key: str) -> Optional[Callable[[Any], Any]]:
+        """Converter for the flat form ``key`` (``None`` if the schema does not know it)."""
+
+        converter = self._top_level.get(key)
+        if converter is None and not _PATH_SEPARATORS.isdisjoint(key):
+            tokens = _tokenize_form_path(key)
+            pattern = tuple(None if isinstance(token, int) else token for token in tokens)
+            converter = self._paths.get(pattern)
+        return converter
+
+    def coerce(self, key: str, value: Any) -> Any:
+        """Convert the raw ``value`` submitted under the flat form ``key``."""
+
+        converter = self.converter_for(key)
+        if converter is None:
+            return coerce_form_value(value)
+        return converter(value)
+
+
+_FORM_COERCER_CACHE_MAX = 256
+_form_coercer_cache: "OrderedDict[type, tuple[Any, FormCoercer]]" = OrderedDict()
+_form_coercer_cache_lock = RLock()
+
+
+def form_coercer(model_cls: Any) -> Optional[FormCoercer]:
+    """Return the compiled :class:`FormCoercer` for ``model_cls`` (``None`` without a schema).
+
+    Rebuilt whenever the model's cached schema metadata is rebuilt.
+    """
+
+    if model_cls is None or not hasattr(model_cls, "model_json_schema"):
+        return None
+    from .rendering.schema_parser import build_schema_metadata
+
+    try:
+        metadata = build_schema_metadata(model_cls)
+    except Exception:  # pragma: no cover - models without a JSON schema keep legacy coercion
+        return None
+
+    with _form_coercer_cache_lock:
+        entry = _form_coercer_cache.get(model_cls)
+        if entry is not None and entry[0] is metadata:
+            _form_coercer_cache.move_to_end(model_cls)
+            return entry[1]
+        coercer = FormCoercer(metadata)
+        _form_coercer_cache[model_cls] = (metadata, coercer)
+        _form_coercer_cache.move_to_end(model_cls)
+        if len(_form_coercer_cache) > _FORM_COERCER_CACHE_MAX:
+            _form_coercer_cache.popitem(last=False)
+        return coercer
+
+
+def reset_form_coercer_cache() -> None:
+    """Clear the compiled coercers (used in tests or hot reload)."""
+
+    with _form_coercer_cache_lock:
+        _form_coercer_cache.clear()
+
+
+def iter_form_items(form_data: Any, *, multi: bool = False) -> Iterable[tuple[Any, Any]]:
+    """Return ``(key, value)`` pairs of a submission.
+
+    With ``multi=True`` multi-dicts yield every value of a repeated key: Starlette
+    ``FormData.multi_items()`` and Werkzeug ``MultiDict.items(multi=True)`` are used
+    when available. Otherwise one pair per key is returned, as ``Mapping.items()`` does.
+    """
+
+    if multi:
+        multi_items = getattr(form_data, "multi_items", None)
+        if callable(multi_items):
+            return multi_items()
+        if isinstance(form_data, Mapping) and callable(getattr(form_data, "getlist", None)):
+            try:
+                return form_data.items(multi=True)  # type: ignore[call-arg]
+            except TypeError:
+                pass
+    return form_data.items() if isinstance(form_data, Mapping) else form_data
+
+
 def parse_nested_form_data(
     form_data: Mapping[str, Any] | Iterable[tuple[str, Any]],
     *,
     coerce_values: bool = True,
+    limits: FormDataLimits | None = None,
+    sparse_indices: bool = False,
+    model: Any = None,
+    multi_value_keys: Collection[str] | None = None,
 ) -> Dict[str, Any]:
     """Convert flat form keys into nested dict/list structures.
 
     Accepts either a mapping (``dict``/Starlette ``FormData``/etc.) or an
     iterable of ``(key, value)`` pairs.
 
+    Keys named by ``multi_value_keys`` - or, when ``model`` is given, its array fields
+    (multiselect, checkbox groups, tags, ``list[...]`` of scalars) - always become lists
+    holding every submitted value, read from multi-dicts in the same pass. Their items
+    are not passed through :func:`coerce_form_value` (they are option values, not
+    checkbox states).
+
+    With ``model`` given, values are converted by the model's compiled
+    :class:`FormCoercer`: booleans only for boolean fields and ``""`` -> ``None`` for
+    optional numbers, so a string field submitted as ``"1"`` stays ``"1"``.
+
+    Args:
+        form_data: The flat submission.
+        coerce_values: Convert values (see above); ``False`` keeps the raw strings.
+        limits: Bounds for the submission; defaults to ``DEFAULT_FORM_DATA_LIMITS``.
+            Use ``FormDataLimits.unbounded()`` only for trusted input.
+        sparse_indices: Collect list items by index and compact them into dense lists
+            once parsing finishes (``a[0]``, ``a[7]`` -> two items) instead of padding
+            gaps with ``None``. Memory then grows with the number of submitted items,
+            not with the largest index.
+        model: FormModel whose array fields should be collected as lists.
+        multi_value_keys: Explicit keys to collect as lists (added to ``model``'s).
+
+    Raises:
+        FormDataLimitError: If the submission exceeds one of the limits.
+        FormDataShapeError: If keys use one path with conflicting shapes (``a[0]`` and
+            ``a.b``).
+
     Example:
         ``{"pets[0].name": "Fido"}`` -> ``{"pets": [{"name": "Fido"}]}``
     """
 
-    items = form_data.items() if isinstance(form_data, Mapping) else form_data
+    limits = DEFAULT_FORM_DATA_LIMITS if limits is None else limits
+    max_keys = limits.max_keys
+    max_value_bytes = limits.max_value_bytes
+    check_paths = limits.max_depth is not None or limits.max_index is not None
+
+    coercer = form_coercer(model) if coerce_values else None
+    list_keys = coercer.array_fields if coercer is not None else multi_value_fields(model)
+    if multi_value_keys:
+        list_keys = list_keys.union(multi_value_keys)
+    buckets: Dict[str, List[Any]] = {}
 
     result: Dict[str, Any] = {}
 
-    for key, raw_value in items:
-        value = coerce_form_value(raw_value) if coerce_values else raw_value
-        tokens = _tokenize_form_path(str(key))
+    for count, (key, raw_value) in enumerate(iter_form_items(form_data, multi=bool(list_keys)), 1):
+        if max_keys is not None and count > max_keys:
+            raise FormDataLimitError("max_keys", str(key), count, max_keys)
+        if max_value_bytes is not None:
+            size = _value_size_exceeds(raw_value, max_value_bytes)
+            if size:
+                raise FormDataLimitError("max_value_bytes", str(key), size, max_value_bytes)
+
+        key = str(key)
+        if key in list_keys:
+            values = list(raw_value) if isinstance(raw_value, (list, tuple)) else [raw_value]
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.extend(values)
+                continue
+            value = buckets[key] = values
+        elif coercer is not None:
+            value = coercer.coerce(key, raw_value)
+        else:
+            value = coerce_form_value(raw_value) if coerce_values else raw_value
+
+        if _PATH_SEPARATORS.isdisjoint(key):
+            result[key] = value
+            continue
+
+        tokens = _tokenize_form_path(key)
 
         if not tokens:
-            result[str(key)] = value
+            result[key] = value
             continue
 
         if len(tokens) == 1 and isinstance(tokens[0], str):
             result[tokens[0]] = value
             continue
 
-        _assign_nested(result, tokens, value)
+        if check_paths:
+            _check_path_limits(key, tokens, limits)
+        _assign_nested(result, tokens, value, sparse_indices, key)
 
+    if sparse_indices:
+        _compact_sparse(result)
     return result
 
 
-__all__ = ["parse_nested_form_data", "coerce_form_value"]
+__all__ = [
+    "DEFAULT_FORM_DATA_LIMITS",
+    "FormCoercer",
+    "FormDataLimitError",
+    "FormDataLimits",
+    "FormDataShapeError",
+    "iter_form_items",
+    "multi_value_fields",
+    "parse_nested_form_data",
+    "coerce_form_value",
+    "form_coercer",
+    "reset_form_coercer_cache",
+]
@@ -9,12 +9,54 @@ the last line of the returned HTML string.
 
 from __future__ import annotations
 
+from typing import Iterable, Iterator
+
 # Keep these markers stable and dependency-free.
 # Importing from pydantic_schemaforms.__init__ would create circular imports.
 START_MARKER = "<!--- Start Pydantic-SchemaForms -->"
 END_MARKER = "<!--- End Pydantic-SchemaForms -->"
 
 
+# Line boundaries recognised by str.splitlines().
+_LINE_BREAKS = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+def _content_bounds(html: str) -> tuple[int, int]:
+    """Return [start, end) of ``html`` without surrounding whitespace or existing markers.
+
+    Only the edges of the document are inspected, so the cost does not depend on the
+    size of the HTML in between (no strip/splitlines copies of the whole string).
+    """
+
+    start, end = 0, len(html)
+    while start < end and html[start].isspace():
+        start += 1
+    while end > start and html[end - 1].isspace():
+        end -= 1
+
+    # A start marker counts only when it is alone on the first line.
+    if html.startswith(START_MARKER, start, end):
+        cursor = start + len(START_MARKER)
+        while cursor < end and html[cursor].isspace() and html[cursor] not in _LINE_BREAKS:
+            cursor += 1
+        if cursor == end or html[cursor] in _LINE_BREAKS:
+            start = cursor
+            while start < end and html[start].isspace():
+                start += 1
+
+    # Likewise the end marker must be alone on the last line.
+    if html.endswith(END_MARKER, start, end):
+        cursor = end - len(END_MARKER)
+        while cursor > start and html[cursor - 1].isspace() and html[cursor - 1] not in _LINE_BREAKS:
+            cursor -= 1
+        if cursor == start or html[cursor - 1] in _LINE_BREAKS:
+            end = cursor
+            while end > start and html[end - 1].isspace():
+                end -= 1
+
+    return start, end
+
+
 def wrap_with_schemaforms_markers(html: str, *, enabled: bool = True) -> str:
     """Wrap HTML with SchemaForms start/end markers.
 
@@ -33,18 +75,48 @@ def wrap_with_schemaforms_markers(html: str, *, enabled: bool = True) -> str:
     if not enabled:
         return html
 
-    # Normalize whitespace so our markers become true first/last lines.
-    normalized = (html or "").lstrip().rstrip()
+    html = html or ""
+    start, end = _content_bounds(html)
+    if start == end:
+        return f"{START_MARKER}\n{END_MARKER}"
+
+    # Slicing the full range returns ``html`` itself, so the common case copies once.
+    return "".join((START_MARKER, "\n", html[start:end], "\n", END_MARKER))
+
+
+def iter_with_schemaforms_markers(fragments: Iterable[str], *, enabled: bool = True) -> Iterator[str]:
+    """Streaming counterpart of :func:`wrap_with_schemaforms_markers`.
+
+    Yields the start marker immediately, then the fragments with leading/trailing
+    whitespace of the whole document trimmed, then the end marker. Only the most
+    recent fragment is held back (to trim trailing whitespace), so the document is
+    never assembled in memory.
+    """
+
+    if not enabled:
+        yield from fragments
+        return
 
-    # Strip existing markers if present (so we can reliably enforce first/last).
-    lines = normalized.splitlines()
-    if lines and lines[0].strip() == START_MARKER:
-        lines = lines[1:]
-    if lines and lines[-1].strip() == END_MARKER:
-        lines = lines[:-1]
+    yield START_MARKER
+    yield "\n"
 
-    inner = "\n".join(lines).strip()
-    if inner:
-        return f"{START_MARKER}\n{inner}\n{END_MARKER}"
+    held = ""
+    for fragment in fragments:
+        if not fragment:
+            continue
+        if not held:
+            fragment = fragment.lstrip()
+            if fragment:
+                held = fragment
+            continue
+        if fragment.strip():
+            yield held
+            held = fragment
+        else:
+            # Whitespace-only fragments may turn out to be trailing whitespace.
+            held += fragment
 
-    return f"{START_MARKER}\n{END_MARKER}"
+    if held:
+        yield held.rstrip()
+        yield "\n"
+    yield END_MARKER
@@ -37,6 +37,8 @@ class BaseInput(ABC):
 
     ui_element: Optional[str] = None
     ui_element_aliases: Tuple[str, ...] = ()
+    # Identical arguments always yield identical markup, so render plans may cache it.
+    static_markup: bool = True
     valid_attributes: List[str] = [
         "name",
         "id",
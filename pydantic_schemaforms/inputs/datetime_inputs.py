@@ -78,6 +78,7 @@ class DatetimeInput(FormInput):
 
     ui_element = "datetime"
     ui_element_aliases = ("datetime-local",)
+    static_markup = False
 
     template = """<input type="datetime-local" ${attributes} />"""
 
@@ -402,6 +403,8 @@ class TimeRangeInput:
 class BirthdateInput(DateInput):
     """Specialized date input for birthdays with age calculation."""
 
+    static_markup = False
+
     def render(self, show_age: bool = True, **kwargs) -> str:
         """Render birthdate input with optional age display."""
         # Set reasonable constraints for birthdates
@@ -0,0 +1,614 @@
+"""Opt-in render instrumentation.
+
+Rendering is not instrumented by default. Instrumentation switches on while at least one
+:class:`RenderObserver` is registered (process wide) or a :func:`collect_render_metrics`
+block is active (context local, so it is safe with threads and asyncio tasks). Each
+top-level render then produces one :class:`RenderMetrics` with:
+
+- per-phase timings (schema metadata, render plan, default materialisation, field
+  rendering, layouts, theme wrapper, asset emission, marker wrapping),
+- per-field-type counts and render time,
+- output size in UTF-8 bytes,
+- hit/miss counts for the schema metadata, render plan and renderer pool caches.
+
+Exporters for logging, Prometheus text format and OpenTelemetry-shaped spans are
+included; none of them require third-party packages (``OpenTelemetryObserver`` uses the
+OpenTelemetry API only if it is installed).
+
+Example::
+
+    from pydantic_schemaforms.instrumentation import collect_render_metrics
+
+    with collect_render_metrics() as collector:
+        html = render_form_html(MyForm, submit_url="/submit")
+    print(collector.renders[0].phases)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+PHASE_SCHEMA_METADATA = "schema_metadata"
+PHASE_RENDER_PLAN = "render_plan"
+PHASE_DEFAULTS = "defaults"
+PHASE_FIELDS = "fields"
+PHASE_LAYOUT = "layout"
+PHASE_WRAPPER = "wrapper"
+PHASE_ASSETS = "assets"
+PHASE_MARKERS = "markers"
+
+CACHE_SCHEMA_METADATA = "schema_metadata"
+CACHE_RENDER_PLAN = "render_plan"
+CACHE_RENDERER_POOL = "renderer_pool"
+
+
+@dataclass
+class RenderMetrics:
+    """Measurements for one top-level render call."""
+
+    model: str
+    entry_point: str
+    framework: str = ""
+    layout: str = ""
+    streamed: bool = False
+    start_time_unix_nano: int = 0
+    duration: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    phase_offsets: Dict[str, float] = field(default_factory=dict)
+    field_types: Dict[str, int] = field(default_factory=dict)
+    field_type_seconds: Dict[str, float] = field(default_factory=dict)
+    output_bytes: int = 0
+    cache: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def field_count(self) -> int:
+        return sum(self.field_types.values())
+
+    @property
+    def end_time_unix_nano(self) -> int:
+        return self.start_time_unix_nano + int(self.duration * 1e9)
+
+
+class RenderObserver:
+    """Base class for render observers; override the callbacks you need.
+
+    Callbacks run synchronously on the rendering thread, so keep them cheap.
+    """
+
+    def on_render_start(self, metrics: RenderMetrics) -> None:
+        """Called when a top-level render begins (only identity fields are set)."""
+
+    def on_render_end(self, metrics: RenderMetrics) -> None:
+        """Called with the completed metrics once the render has finished."""
+
+
+class RenderMetricsCollector:
+    """Accumulates metrics for renders inside a :func:`collect_render_metrics` block."""
+
+    def __init__(self) -> None:
+        self.renders: List[RenderMetrics] = []
+
+    def clear(self) -> None:
+        self.renders.clear()
+
+
+_observers: Tuple[RenderObserver, ...] = ()
+_observers_lock = Lock()
+_active_collectors: ContextVar[Tuple[RenderMetricsCollector, ...]] = ContextVar(
+    "schemaforms_render_collectors", default=()
+)
+_active_recorder: ContextVar[Optional["RenderRecorder"]] = ContextVar(
+    "schemaforms_render_recorder", default=None
+)
+
+
+def add_render_observer(observer: RenderObserver) -> RenderObserver:
+    """Register a process-wide observer (enables instrumentation for every render)."""
+
+    global _observers
+    with _observers_lock:
+        if observer not in _observers:
+            _observers = _observers + (observer,)
+    return observer
+
+
+def remove_render_observer(observer: RenderObserver) -> None:
+    """Unregister an observer added with :func:`add_render_observer`."""
+
+    global _observers
+    with _observers_lock:
+        _observers = tuple(existing for existing in _observers if existing is not observer)
+
+
+@contextmanager
+def collect_render_metrics() -> Iterator[RenderMetricsCollector]:
+    """Collect metrics for every render started inside the block (context local)."""
+
+    collector = RenderMetricsCollector()
+    token = _active_collectors.set(_active_collectors.get() + (collector,))
+    try:
+        yield collector
+    finally:
+        _active_collectors.reset(token)
+
+
+def _field_type(field_schema: Dict[str, Any]) -> str:
+    """Declared UI element of a schema field, else the element its JSON type renders as."""
+
+    from .rendering.schema_parser import resolve_ui_element
+
+    if (field_schema.get("ui", {}) or field_schema).get("hidden"):
+        return "hidden"
+    declared = resolve_ui_element(field_schema)
+    if declared:
+        return declared
+    json_type = field_schema.get("type", "string")
+    if json_type in ("integer", "number"):
+        return "number"
+    if json_type == "boolean":
+        return "checkbox"
+    return "text"
+
+
+class _NullRecorder:
+    """Recorder used when instrumentation is off; every method is a no-op."""
+
+    enabled = False
+    _activation = nullcontext()
+
+    def activate(self) -> Any:
+        return self._activation
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def mark_field(self, field_type: Optional[str]) -> None:
+        pass
+
+    def mark_schema_field(self, field_schema: Dict[str, Any]) -> None:
+        pass
+
+    def observe_fields(self, metadata: Any) -> None:
+        pass
+
+    def describe(self, **_details: Any) -> None:
+        pass
+
+    def track(self, fragments: Iterator[str]) -> Iterator[str]:
+        return fragments
+
+    def finish(self, output: Optional[str] = None) -> None:
+        pass
+
+
+NULL_RECORDER = _NullRecorder()
+
+
+class RenderRecorder:
+    """Collects measurements for one top-level render; nested renders join it."""
+
+    enabled = True
+
+    def __init__(
+        self,
+        metrics: RenderMetrics,
+        observers: Tuple[RenderObserver, ...],
+        collectors: Tuple[RenderMetricsCollector, ...],
+    ) -> None:
+        self.metrics = metrics
+        self._observers = observers
+        self._collectors = collectors
+        self._started = time.perf_counter()
+        self._last = self._started
+        self._depth = 1
+        self._tracking = False
+
+    @contextmanager
+    def activate(self) -> Iterator["RenderRecorder"]:
+        """Make this recorder current so nested renders and caches report into it."""
+
+        token = _active_recorder.set(self)
+        try:
+            yield self
+        finally:
+            _active_recorder.reset(token)
+
+    def mark(self, phase: str) -> None:
+        """Attribute the time since the previous mark to ``phase``."""
+
+        now = time.perf_counter()
+        phases = self.metrics.phases
+        if phase not in phases:
+            phases[phase] = 0.0
+            self.metrics.phase_offsets[phase] = self._last - self._started
+        phases[phase] += now - self._last
+        self._last = now
+
+    def mark_field(self, field_type: Optional[str]) -> None:
+        """Attribute the time since the previous mark to one rendered field."""
+
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self.mark(PHASE_FIELDS)
+        key = field_type or "text"
+        seconds = self.metrics.field_type_seconds
+        seconds[key] = seconds.get(key, 0.0) + elapsed
+
+    def mark_schema_field(self, field_schema: Dict[str, Any]) -> None:
+        """Like :meth:`mark_field` for a field known only by its JSON schema."""
+
+        self.mark_field(_field_type(field_schema))
+
+    def observe_fields(self, metadata: Any) -> None:
+        """Count the fields of ``metadata`` by UI element (first model seen wins)."""
+
+        if self.metrics.field_types:
+            return
+        counts = self.metrics.field_types
+        for _name, field_schema in metadata.fields:
+            key = _field_type(field_schema)
+            counts[key] = counts.get(key, 0) + 1
+
+    def describe(self, **details: Any) -> None:
+        """Fill identity fields (framework, layout, ...) that are still empty."""
+
+        for key, value in details.items():
+            if value and not getattr(self.metrics, key):
+                setattr(self.metrics, key, value)
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        counts = self.metrics.cache.setdefault(cache, {"hit": 0, "miss": 0})
+        counts["hit" if hit else "miss"] += 1
+
+    def track(self, fragments: Iterator[str]) -> Iterator[str]:
+        """Wrap a fragment generator so it runs with this recorder active.
+
+        Time the consumer spends between fragments is not attributed to any phase.
+        """
+
+        return self._tracked(fragments)
+
+    def _tracked(self, fragments: Iterator[str]) -> Iterator[str]:
+        # Only the outermost tracked stream counts bytes; nested streams feed into it.
+        owner = not self._tracking
+        self._tracking = True
+        size = 0
+        try:
+            while True:
+                token = _active_recorder.set(self)
+                self._last = time.perf_counter()
+                try:
+                    fragment = next(fragments)
+                except StopIteration:
+                    break
+                finally:
+                    _active_recorder.reset(token)
+                if owner:
+                    size += len(fragment.encode("utf-8"))
+                yield fragment
+        finally:
+            if owner:
+                self.metrics.output_bytes = size
+            self.finish()
+
+    def nested(self) -> "RenderRecorder":
+        self._depth += 1
+        return self
+
+    def finish(self, output: Optional[str] = None) -> None:
+        """Close one level of nesting; the outermost call publishes the metrics."""
+
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        if output is not None:
+            self.metrics.output_bytes = len(output.encode("utf-8"))
+        self.metrics.duration = time.perf_counter() - self._started
+
+        for collector in self._collectors:
+            collector.renders.append(self.metrics)
+        for observer in self._observers:
+            try:
+                observer.on_render_end(self.metrics)
+            except Exception:  # pragma: no cover - observers must not break rendering
+                logger.exception("Render observer %r failed", observer)
+
+
+def begin_render(
+    model_cls: Any,
+    entry_point: str,
+    *,
+    streamed: bool = False,
+    **details: Any,
+) -> Any:
+    """Start (or join) instrumentation for a render; returns a no-op recorder when off."""
+
+    current = _active_recorder.get()
+    if current is not None:
+        current.describe(**details)
+        return current.nested()
+
+    observers = _observers
+    collectors = _active_collectors.get()
+    if not observers and not collectors:
+        return NULL_RECORDER
+
+    metrics = RenderMetrics(
+        model=getattr(model_cls, "__name__", str(model_cls)),
+        entry_point=entry_point,
+        streamed=streamed,
+        start_time_unix_nano=time.time_ns(),
+    )
+    recorder = RenderRecorder(metrics, observers, collectors)
+    recorder.describe(**details)
+    for observer in observers:
+        try:
+            observer.on_render_start(metrics)
+        except Exception:  # pragma: no cover - observers must not break rendering
+            logger.exception("Render observer %r failed", observer)
+    return recorder
+
+
+def current_recorder() -> Optional[RenderRecorder]:
+    """Return the recorder of the render running in this context, if any."""
+
+    return _active_recorder.get()
+
+
+def record_cache_event(cache: str, hit: bool) -> None:
+    """Report a cache lookup to the active render (no-op when not instrumented)."""
+
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        recorder.record_cache(cache, hit)
+
+
+# --- Exporters --------------------------------------------------------------------------
+
+
+class LoggingObserver(RenderObserver):
+    """Log one summary line per render."""
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.INFO) -> None:
+        self.log = log or logger
+        self.level = level
+
+    def on_render_end(self, metrics: RenderMetrics) -> None:
+        if not self.log.isEnabledFor(self.level):
+            return
+        phases = " ".join(f"{name}={seconds * 1e3:.2f}ms" for name, seconds in metrics.phases.items())
+        caches = " ".join(
+            f"{name}={counts['hit']}/{counts['hit'] + counts['miss']}" for name, counts in metrics.cache.items()
+        )
+        self.log.log(
+            self.level,
+            "Rendered %s via %s (%s, %s) in %.2fms: %d fields, %d bytes; phases: %s; cache hits: %s",
+            metrics.model,
+            metrics.entry_point,
+            metrics.framework or "-",
+            metrics.layout or "-",
+            metrics.duration * 1e3,
+            metrics.field_count,
+            metrics.output_bytes,
+            phases or "-",
+            caches or "-",
+        )
+
+
+def _label_text(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in sorted(labels.items())
+    )
+    return "{" + rendered + "}"
+
+
+class PrometheusObserver(RenderObserver):
+    """Aggregate render metrics as Prometheus counters.
+
+    ``as_dict()`` maps ``metric{labels}`` to values; ``render_text()`` returns the
+    exposition format, ready to append to an existing ``/metrics`` response.
+    """
+
+    _HELP = {
+        "schemaforms_renders_total": ("counter", "Completed form renders."),
+        "schemaforms_render_seconds_total": ("counter", "Total render time in seconds."),
+        "schemaforms_render_phase_seconds_total": ("counter", "Render time per phase in seconds."),
+        "schemaforms_rendered_fields_total": ("counter", "Rendered fields by UI element."),
+        "schemaforms_render_output_bytes_total": ("counter", "Rendered output size in UTF-8 bytes."),
+        "schemaforms_cache_requests_total": ("counter", "Cache lookups made while rendering."),
+    }
+
+    def __init__(self, *, per_model: bool = True) -> None:
+        self.per_model = per_model
+        self._values: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._lock = Lock()
+
+    def _add(self, name: str, labels: Dict[str, str], value: float) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        self._values[key] = self._values.get(key, 0.0) + value
+
+    def on_render_end(self, metrics: RenderMetrics) -> None:
+        base = {"framework": metrics.framework or "unknown"}
+        if self.per_model:
+            base["model"] = metrics.model
+        with self._lock:
+            self._add("schemaforms_renders_total", base, 1)
+            self._add("schemaforms_render_seconds_total", base, metrics.duration)
+            self._add("schemaforms_render_output_bytes_total", base, metrics.output_bytes)
+            for phase, seconds in metrics.phases.items():
+                self._add("schemaforms_render_phase_seconds_total", {**base, "phase": phase}, seconds)
+            for field_type, count in metrics.field_types.items():
+                self._add("schemaforms_rendered_fields_total", {**base, "type": field_type}, count)
+            for cache, counts in metrics.cache.items():
+                for result, count in counts.items():
+                    if count:
+                        self._add("schemaforms_cache_requests_total", {"cache": cache, "result": result}, count)
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return {f"{name}{_label_text(dict(labels))}": value for (name, labels), value in items}
+
+    def render_text(self) -> str:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines: List[str] = []
+        current = None
+        for (name, labels), value in items:
+            if name != current:
+                metric_type, help_text = self._HELP[name]
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                current = name
+            lines.append(f"{name}{_label_text(dict(labels))} {value:g}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+def to_otel_spans(metrics: RenderMetrics, *, trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Convert metrics to OpenTelemetry-shaped span dicts (root span + one per phase).
+
+    Phase spans start where the phase first ran and last for its accumulated time, so
+    phases that ran in several slices (e.g. streamed fields) appear as one span.
+    """
+
+    trace_id = trace_id or os.urandom(16).hex()
+    root_id = os.urandom(8).hex()
+    start = metrics.start_time_unix_nano
+    attributes: Dict[str, Any] = {
+        "schemaforms.model": metrics.model,
+        "schemaforms.entry_point": metrics.entry_point,
+        "schemaforms.framework": metrics.framework,
+        "schemaforms.layout": metrics.layout,
+        "schemaforms.streamed": metrics.streamed,
+        "schemaforms.field_count": metrics.field_count,
+        "schemaforms.output_bytes": metrics.output_bytes,
+    }
+    for field_type, count in metrics.field_types.items():
+        attributes[f"schemaforms.fields.{field_type}"] = count
+    for cache, counts in metrics.cache.items():
+        attributes[f"schemaforms.cache.{cache}.hits"] = counts["hit"]
+        attributes[f"schemaforms.cache.{cache}.misses"] = counts["miss"]
+
+    spans = [
+        {
+            "name": "schemaforms.render",
+            "trace_id": trace_id,
+            "span_id": root_id,
+            "parent_span_id": None,
+            "start_time_unix_nano": start,
+            "end_time_unix_nano": metrics.end_time_unix_nano,
+            "attributes": attributes,
+        }
+    ]
+    for phase, seconds in metrics.phases.items():
+        phase_start = start + int(metrics.phase_offsets.get(phase, 0.0) * 1e9)
+        spans.append(
+            {
+                "name": f"schemaforms.render.{phase}",
+                "trace_id": trace_id,
+                "span_id": os.urandom(8).hex(),
+                "parent_span_id": root_id,
+                "start_time_unix_nano": phase_start,
+                "end_time_unix_nano": phase_start + int(seconds * 1e9),
+                "attributes": {"schemaforms.phase": phase},
+            }
+        )
+    return spans
+
+
+class SpanCollectorObserver(RenderObserver):
+    """Keep OpenTelemetry-shaped span dicts for each render (e.g. to ship as OTLP JSON)."""
+
+    def __init__(self, max_renders: int = 1000) -> None:
+        self.max_renders = max_renders
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = Lock()
+
+    def on_render_end(self, metrics: RenderMetrics) -> None:
+        spans = to_otel_spans(metrics)
+        with self._lock:
+            self.spans.extend(spans)
+            overflow = len(self.spans) - self.max_renders * (len(metrics.phases) + 1)
+            if overflow > 0:
+                del self.spans[:overflow]
+
+
+class OpenTelemetryObserver(RenderObserver):
+    """Emit real spans through the OpenTelemetry API (requires ``opentelemetry-api``)."""
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:  # pragma: no cover - depends on optional package
+            raise ImportError(
+                "OpenTelemetryObserver requires the 'opentelemetry-api' package; "
+                "use SpanCollectorObserver/to_otel_spans for dependency-free spans."
+            ) from exc
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("pydantic_schemaforms")
+
+    def on_render_end(self, metrics: RenderMetrics) -> None:
+        spans = to_otel_spans(metrics)
+        root_dict, phase_dicts = spans[0], spans[1:]
+        root = self.tracer.start_span(
+            root_dict["name"],
+            start_time=root_dict["start_time_unix_nano"],
+            attributes=root_dict["attributes"],
+        )
+        context = self._trace.set_span_in_context(root)
+        for phase in phase_dicts:
+            child = self.tracer.start_span(
+                phase["name"],
+                context=context,
+                start_time=phase["start_time_unix_nano"],
+                attributes=phase["attributes"],
+            )
+            child.end(end_time=phase["end_time_unix_nano"])
+        root.end(end_time=root_dict["end_time_unix_nano"])
+
+
+__all__ = [
+    "CACHE_RENDERER_POOL",
+    "CACHE_RENDER_PLAN",
+    "CACHE_SCHEMA_METADATA",
+    "LoggingObserver",
+    "NULL_RECORDER",
+    "OpenTelemetryObserver",
+    "PHASE_ASSETS",
+    "PHASE_DEFAULTS",
+    "PHASE_FIELDS",
+    "PHASE_LAYOUT",
+    "PHASE_MARKERS",
+    "PHASE_RENDER_PLAN",
+    "PHASE_SCHEMA_METADATA",
+    "PHASE_WRAPPER",
+    "PrometheusObserver",
+    "RenderMetrics",
+    "RenderMetricsCollector",
+    "RenderObserver",
+    "SpanCollectorObserver",
+    "add_render_observer",
+    "begin_render",
+    "collect_render_metrics",
+    "current_recorder",
+    "record_cache_event",
+    "remove_render_observer",
+    "to_otel_spans",
+]
@@ -16,11 +16,19 @@ async def handle_async_form(
     *,
     initial_data: Optional[Dict[str, Any]] = None,
     render_on_error: bool = True,
+    max_concurrency: int = 10,
+    rule_timeout: Optional[float] = None,
 ) -> FormResult:
-    """Validate and render forms for async frameworks (FastAPI, Litestar, etc.)."""
+    """Validate and render forms for async frameworks (FastAPI, Litestar, etc.).
+
+    Async validation rules are awaited concurrently (at most ``max_concurrency`` fields
+    at once, each rule limited to ``rule_timeout`` seconds) instead of blocking the loop.
+    """
     if submitted_data is not None:
-        normalized = normalize_form_data(submitted_data)
-        is_valid, errors = form_builder.validate_data(normalized)
+        normalized = normalize_form_data(submitted_data, model=form_builder.model)
+        is_valid, errors = await form_builder.avalidate_data(
+            normalized, max_concurrency=max_concurrency, rule_timeout=rule_timeout
+        )
         if is_valid:
             return {"success": True, "data": normalized}
 
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from ..modern_renderer import FormDefinition, FormField, FormSection, ModernFormRenderer
 from ..assets.runtime import framework_css_tag, framework_js_tag
+from ..client_validation import client_validation_tags
 from ..validation import create_validator
 
 
@@ -213,8 +214,22 @@ class FormBuilder:
             return self.validator.validate_pydantic_model(self.model, data)
         return self.validator.validate(data)
 
-    def get_validation_script(self) -> str:
-        return self.validator.generate_client_validation_script()
+    async def avalidate_data(
+        self,
+        data: Dict[str, Any],
+        *,
+        max_concurrency: int = 10,
+        rule_timeout: Optional[float] = None,
+    ) -> tuple[bool, Dict[str, List[str]]]:
+        """Validate like :meth:`validate_data`, awaiting async rules concurrently."""
+
+        if self.model:
+            # Pydantic validation is CPU-bound and runs inline.
+            return self.validator.validate_pydantic_model(self.model, data)
+        return await self.validator.avalidate(data, max_concurrency=max_concurrency, rule_timeout=rule_timeout)
+
+    def get_validation_script(self, *, asset_mode: str = "vendored") -> str:
+        return client_validation_tags(self.model, validator=self.validator, asset_mode=asset_mode)
 
 
 class AutoFormBuilder(FormBuilder):
@@ -396,7 +411,7 @@ def render_form_page(
     include_html_markers: bool = True,
 ) -> str:
     form_html = form_builder.render(data or {}, errors or {})
-    validation_script = form_builder.get_validation_script()
+    validation_script = form_builder.get_validation_script(asset_mode=asset_mode)
     template_data = {
         "title": title,
         "form_html": form_html,
@@ -2,20 +2,45 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Collection, Dict, Optional
 
+from ..form_data import form_coercer, iter_form_items
 from .builder import FormBuilder
 
 FormResult = Dict[str, Any]
 
 
-def normalize_form_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize raw request payloads (e.g. checkbox "on" values)."""
+def normalize_form_data(
+    data: Dict[str, Any],
+    *,
+    array_fields: Collection[str] = (),
+    model: Any = None,
+) -> Dict[str, Any]:
+    """Normalize raw request payloads (e.g. checkbox "on" values).
+
+    Keys in ``array_fields`` keep every submitted value as a list; multi-dicts
+    (Starlette ``FormData``, Werkzeug ``MultiDict``) are read with all their values.
+    With ``model`` given, its array fields are added and known fields are converted by
+    the model's compiled :class:`~pydantic_schemaforms.form_data.FormCoercer` (booleans
+    only for boolean fields, ``""`` -> ``None`` for optional numbers).
+    """
+    coercer = form_coercer(model)
+    if coercer is not None and coercer.array_fields:
+        array_fields = coercer.array_fields.union(array_fields)
+
     normalized: Dict[str, Any] = {}
-    for key, value in data.items():
+    for key, value in iter_form_items(data, multi=bool(array_fields)):
+        if key in array_fields:
+            values = normalized.setdefault(key, [])
+            values.extend(value if isinstance(value, (list, tuple)) else (value,))
+            continue
         if isinstance(value, (list, tuple)):
             if len(value) == 1:
                 value = value[0]
+        converter = coercer.converter_for(key) if coercer is not None else None
+        if converter is not None:
+            normalized[key] = converter(value)
+            continue
         if isinstance(value, str):
             lowered = value.lower()
             if lowered == "on":
@@ -37,7 +62,7 @@ def handle_sync_form(
 ) -> FormResult:
     """Validate and render forms for synchronous frameworks."""
     if submitted_data is not None:
-        normalized = normalize_form_data(submitted_data)
+        normalized = normalize_form_data(submitted_data, model=form_builder.model)
         is_valid, errors = form_builder.validate_data(normalized)
         if is_valid:
             return {"success": True, "data": normalized}
@@ -7,15 +7,23 @@ allowing complex validation rules that can't be handled client-side.
 Requires: Python 3.14+ (uses native template strings)
 """
 
+import asyncio
+import html
+import inspect
 import json
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from threading import RLock
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Dict, Hashable, List, Mapping, Optional, Set, Tuple
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from .templates import TemplateString
 from .validation import (
     ValidationResponse,
+    resolve_sync,
     create_email_validator,
     create_password_strength_validator,
 )
@@ -24,6 +32,217 @@ if TYPE_CHECKING:  # pragma: no cover
     from .validation import FieldValidator, ValidationSchema
 
 
+class _ModelFieldAdapters:
+    """Per-field ``TypeAdapter`` instances for one model, compiled on first use.
+
+    Validating a single field through its own adapter costs the same regardless of how many
+    fields the model has, and does not report the other required fields as missing. Fields
+    with ``@field_validator`` hooks, models with ``mode="before"``/``"wrap"``
+    ``@model_validator`` hooks (both need the model) and annotations that cannot be compiled
+    on their own map to ``None`` and are validated through the whole model.
+    """
+
+    def __init__(self, model_class: type[BaseModel]) -> None:
+        self.model_class = model_class
+        self._adapters: Dict[str, Optional[TypeAdapter]] = {}
+        self._lock = RLock()
+
+    def get(self, field_name: str) -> Optional[TypeAdapter]:
+        with self._lock:
+            if field_name not in self._adapters:
+                self._adapters[field_name] = self._compile(field_name)
+            return self._adapters[field_name]
+
+    def _compile(self, field_name: str) -> Optional[TypeAdapter]:
+        field_info = self.model_class.model_fields.get(field_name)
+        if field_info is None or self._has_field_validators(field_name):
+            return None
+
+        # Only the type and its constraints: alias, exclude, title etc. describe the model
+        # field and make pydantic warn when given to a standalone adapter.
+        annotated = (
+            Annotated[(field_info.annotation, *field_info.metadata)]
+            if field_info.metadata
+            else field_info.annotation
+        )
+        config = getattr(self.model_class, "model_config", None) or None
+        try:
+            return TypeAdapter(annotated, config=config)
+        except Exception:
+            try:
+                return TypeAdapter(annotated)
+            except Exception:
+                return None
+
+    def _has_field_validators(self, field_name: str) -> bool:
+        decorators = getattr(self.model_class, "__pydantic_decorators__", None)
+        if decorators is None:
+            return False
+        # "before"/"wrap" model validators may rewrite the input a field adapter would see.
+        for decorator in decorators.model_validators.values():
+            if decorator.info.mode in ("before", "wrap"):
+                return True
+        for decorator in decorators.field_validators.values():
+            fields = decorator.info.fields
+            if field_name in fields or "*" in fields:
+                return True
+        return False
+
+
+_FIELD_ADAPTER_CACHE_MAX = 256
+_field_adapter_cache: "OrderedDict[type, Tuple[int, _ModelFieldAdapters]]" = OrderedDict()
+_field_adapter_cache_lock = RLock()
+
+
+def get_field_adapters(model_class: type[BaseModel]) -> _ModelFieldAdapters:
+    """Return the cached per-field adapters for ``model_class``.
+
+    Entries are stamped with ``FormModel.schema_version()`` so fields registered at runtime
+    are picked up.
+    """
+
+    schema_version = getattr(model_class, "schema_version", None)
+    version = schema_version() if schema_version is not None else 0
+    with _field_adapter_cache_lock:
+        entry = _field_adapter_cache.get(model_class)
+        if entry is not None and entry[0] == version:
+            _field_adapter_cache.move_to_end(model_class)
+            return entry[1]
+        adapters = _ModelFieldAdapters(model_class)
+        _field_adapter_cache[model_class] = (version, adapters)
+        _field_adapter_cache.move_to_end(model_class)
+        if len(_field_adapter_cache) > _FIELD_ADAPTER_CACHE_MAX:
+            _field_adapter_cache.popitem(last=False)
+        return adapters
+
+
+def reset_field_adapter_cache() -> None:
+    """Clear the per-model field adapter cache (used in tests or hot reload)."""
+
+    with _field_adapter_cache_lock:
+        _field_adapter_cache.clear()
+
+
+def _error_messages(error: ValidationError, field_name: Optional[str] = None) -> List[str]:
+    if field_name is None:
+        return [item["msg"] for item in error.errors()]
+    return [item["msg"] for item in error.errors() if item["loc"] == (field_name,)]
+
+
+@dataclass(frozen=True)
+class ValidationCacheInfo:
+    """Counters for a LiveValidator result cache (see ``LiveValidator.result_cache_info``)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    current_bytes: int
+    maxsize: int
+    max_bytes: int
+    ttl: Optional[float]
+
+
+def _normalize_cache_value(value: Any) -> Optional[Hashable]:
+    """Hashable, type-tagged form of a submitted value (``None`` if it cannot be cached).
+
+    The type tag keeps ``1``, ``1.0``, ``True`` and ``"1"`` apart; lists and dicts from
+    multi-value or JSON submissions become tuples.
+    """
+
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return (type(value).__name__, value)
+    if isinstance(value, (list, tuple)):
+        items = tuple(_normalize_cache_value(item) for item in value)
+        return None if None in items else ("list", items)
+    if isinstance(value, dict):
+        try:
+            pairs = sorted((str(key), _normalize_cache_value(item)) for key, item in value.items())
+        except TypeError:
+            return None
+        return None if any(item is None for _, item in pairs) else ("dict", tuple(pairs))
+    return None
+
+
+def _estimate_entry_bytes(value: Any, response: ValidationResponse) -> int:
+    messages = [*response.errors, *response.warnings, *response.suggestions]
+    return (
+        sys.getsizeof(response)
+        + sys.getsizeof(value)
+        + sum(sys.getsizeof(message) for message in messages)
+        + len(repr(value))
+    )
+
+
+class _ValidationResultCache:
+    """LRU of validation responses with per-entry TTL and an approximate byte budget."""
+
+    def __init__(self, maxsize: int, max_bytes: int, ttl: Optional[float]) -> None:
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], int, ValidationResponse]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[ValidationResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: Hashable, value: Any, response: ValidationResponse) -> None:
+        size = _estimate_entry_bytes(value, response)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, size, response)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def info(self) -> ValidationCacheInfo:
+        with self._lock:
+            return ValidationCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                currsize=len(self._entries),
+                current_bytes=self._bytes,
+                maxsize=self.maxsize,
+                max_bytes=self.max_bytes,
+                ttl=self.ttl,
+            )
+
+
 @dataclass
 class HTMXValidationConfig:
     """Configuration for HTMX validation behavior."""
@@ -71,11 +290,16 @@ class LiveValidator:
         self.validators: Dict[str, Callable] = {}
         self.field_configs: Dict[str, Dict[str, Any]] = {}
 
+        # Opt-in memoization of validator results (see enable_result_cache)
+        self._result_cache: Optional[_ValidationResultCache] = None
+        self._cached_fields: Optional[Set[str]] = None
+        self._validator_versions: Dict[str, int] = {}
+
         # Template for validation responses
         self.validation_template = TemplateString(
             """
 <div class="validation-feedback ${feedback_class}"
-     id="${field_name}-feedback">
+     id="${field_name}-feedback"${extra_attributes}>
     ${feedback_content}
 </div>
 """
@@ -228,7 +452,12 @@ document.addEventListener('DOMContentLoaded', function() {
             field_name: Name of the field to validate
             validator: Function that takes a value and returns ValidationResponse
         """
+        self._set_validator(field_name, validator)
+
+    def _set_validator(self, field_name: str, validator: Callable[[Any], ValidationResponse]) -> None:
         self.validators[field_name] = validator
+        # Cached results of the previous validator no longer apply.
+        self._validator_versions[field_name] = self._validator_versions.get(field_name, 0) + 1
 
     def register_field_validator(self, field_validator: "FieldValidator") -> None:
         """Register a FieldValidator for live use."""
@@ -242,7 +471,18 @@ document.addEventListener('DOMContentLoaded', function() {
                 value=value,
             )
 
-        self.validators[field_validator.field_name] = _runner
+        async def _async_runner(value: Any) -> ValidationResponse:
+            is_valid, errors = await field_validator.avalidate(value)
+            return ValidationResponse(
+                field_name=field_validator.field_name,
+                is_valid=is_valid,
+                errors=errors,
+                value=value,
+            )
+
+        _runner.avalidate = _async_runner
+        _runner.field_validator = field_validator
+        self._set_validator(field_validator.field_name, _runner)
         existing = self.field_configs.get(field_validator.field_name, {})
         self.field_configs[field_validator.field_name] = {
             **existing,
@@ -259,34 +499,40 @@ document.addEventListener('DOMContentLoaded', function() {
         """
         Register validators for all fields in a Pydantic model.
 
+        Each field is validated through its own cached ``TypeAdapter`` (see
+        :func:`get_field_adapters`), so one call costs the same whatever the model size.
+
         Args:
             model_class: Pydantic model class
         """
-        model_fields = model_class.model_fields
-
-        for field_name, field_info in model_fields.items():
+        for field_name in model_class.model_fields:
 
-            def create_model_validator(fname: str, finfo: Any):
+            def create_model_validator(fname: str):
                 def validator(value: Any) -> ValidationResponse:
+                    adapter = get_field_adapters(model_class).get(fname)
                     try:
-                        # Create a partial model instance for validation
-                        test_data = {fname: value}
-                        model_class.model_validate(test_data, strict=False)
+                        if adapter is not None:
+                            adapter.validate_python(value, strict=False)
+                        else:
+                            # Field validators need the model; validate a partial instance.
+                            model_class.model_validate({fname: value}, strict=False)
 
                         return ValidationResponse(field_name=fname, is_valid=True, value=value)
                     except ValidationError as e:
-                        errors = []
-                        for error in e.errors():
-                            if error["loc"] == (fname,):
-                                errors.append(error["msg"])
-
+                        if adapter is not None:
+                            errors = _error_messages(e)
+                        else:
+                            # Errors for the other (missing) fields are not this field's.
+                            errors = _error_messages(e, fname)
+                            if not errors:
+                                return ValidationResponse(field_name=fname, is_valid=True, value=value)
                         return ValidationResponse(
                             field_name=fname, is_valid=False, errors=errors, value=value
                         )
 
                 return validator
 
-            self.validators[field_name] = create_model_validator(field_name, field_info)
+            self._set_validator(field_name, create_model_validator(field_name))
 
     def validate_field(self, field_name: str, value: Any) -> ValidationResponse:
         """
@@ -307,8 +553,275 @@ document.addEventListener('DOMContentLoaded', function() {
                 value=value,
             )
 
+        return self._run_validator(field_name, value)
+
+    def validate_fields(self, values: Mapping[str, Any]) -> Dict[str, ValidationResponse]:
+        """
+        Validate several fields in one call.
+
+        Fields without a registered validator are skipped, so a whole form (or the diff
+        of changed fields) can be passed as-is.
+
+        Args:
+            values: Mapping of field names to submitted values
+
+        Returns:
+            Mapping of field names to ValidationResponse, in submission order
+        """
+        if any(
+            self._is_async_validator(self.validators[field_name])
+            for field_name in values
+            if field_name in self.validators
+        ):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # Await every async validator in one event loop rather than one per field.
+                return asyncio.run(self.avalidate_fields(values))
+
+        return {
+            field_name: self._run_validator(field_name, value)
+            for field_name, value in values.items()
+            if field_name in self.validators
+        }
+
+    @staticmethod
+    def _is_async_validator(validator: Callable) -> bool:
+        field_validator = getattr(validator, "field_validator", None)
+        if field_validator is not None:
+            return field_validator.is_async
+        return inspect.iscoroutinefunction(validator)
+
+    def _cache_key(self, field_name: str, validator: Callable, value: Any) -> Optional[Hashable]:
+        if self._result_cache is None:
+            return None
+        if self._cached_fields is not None and field_name not in self._cached_fields:
+            return None
+        normalized = _normalize_cache_value(value)
+        if normalized is None:
+            return None
+        return (field_name, self._validator_versions.get(field_name, 0), id(validator), normalized)
+
+    @staticmethod
+    def _copy_response(cached: ValidationResponse, value: Any) -> ValidationResponse:
+        # Hand out a copy so callers may mutate the response.
+        return replace(
+            cached,
+            errors=list(cached.errors),
+            warnings=list(cached.warnings),
+            suggestions=list(cached.suggestions),
+            value=value,
+        )
+
+    def _run_validator(self, field_name: str, value: Any) -> ValidationResponse:
+        validator = self.validators[field_name]
+        key = self._cache_key(field_name, validator, value)
+        if key is None:
+            return resolve_sync(validator(value))
+
+        cache = self._result_cache
+        cached = cache.get(key)
+        if cached is None:
+            cached = resolve_sync(validator(value))
+            cache.put(key, value, cached)
+        return self._copy_response(cached, value)
+
+    async def _arun_validator(
+        self, field_name: str, value: Any, timeout: Optional[float]
+    ) -> ValidationResponse:
         validator = self.validators[field_name]
-        return validator(value)
+        key = self._cache_key(field_name, validator, value)
+        cache = self._result_cache
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return self._copy_response(cached, value)
+
+        runner = getattr(validator, "avalidate", validator)
+        try:
+            result = runner(value)
+            if inspect.isawaitable(result):
+                result = await (asyncio.wait_for(result, timeout) if timeout is not None else result)
+        except asyncio.TimeoutError:
+            # Timeouts are not cached; the next attempt may succeed.
+            return ValidationResponse(
+                field_name=field_name, is_valid=False, errors=["Validation timed out"], value=value
+            )
+
+        if key is not None:
+            cache.put(key, value, result)
+            return self._copy_response(result, value)
+        return result
+
+    async def avalidate_field(
+        self, field_name: str, value: Any, *, timeout: Optional[float] = None
+    ) -> ValidationResponse:
+        """
+        Validate a single field value without blocking the event loop.
+
+        ``async def`` validators (registered directly or through async rules of a
+        FieldValidator) are awaited; synchronous validators run inline.
+
+        Args:
+            field_name: Name of the field
+            value: Value to validate
+            timeout: Seconds the validator may take before the field fails
+
+        Returns:
+            ValidationResponse with validation results
+        """
+        if field_name not in self.validators:
+            return self.validate_field(field_name, value)
+        return await self._arun_validator(field_name, value, timeout)
+
+    async def avalidate_fields(
+        self,
+        values: Mapping[str, Any],
+        *,
+        max_concurrency: int = 10,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, ValidationResponse]:
+        """
+        Validate several fields concurrently (see :meth:`validate_fields`).
+
+        Args:
+            values: Mapping of field names to submitted values
+            max_concurrency: Maximum number of validators awaited at once for this call
+            timeout: Per-field timeout in seconds
+
+        Returns:
+            Mapping of field names to ValidationResponse, in submission order
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _validate(field_name: str, value: Any) -> ValidationResponse:
+            async with semaphore:
+                return await self._arun_validator(field_name, value, timeout)
+
+        names = [field_name for field_name in values if field_name in self.validators]
+        responses = await asyncio.gather(*(_validate(name, values[name]) for name in names))
+        return dict(zip(names, responses, strict=True))
+
+    def enable_result_cache(
+        self,
+        *field_names: str,
+        ttl: Optional[float] = 60.0,
+        maxsize: int = 1024,
+        max_bytes: int = 1_048_576,
+    ) -> None:
+        """
+        Memoize validator results for repeated values (opt-in).
+
+        Results are keyed by (field, value, validator version); registering a new
+        validator for a field retires its cached results. Only enable this for
+        validators whose outcome depends on the value alone (or may be stale for ``ttl``
+        seconds, e.g. a username availability lookup).
+
+        Args:
+            *field_names: Fields to cache; all fields when omitted. Calling again replaces
+                the configuration and drops cached results.
+            ttl: Seconds a result stays valid (``None`` for no expiry)
+            maxsize: Maximum number of cached results (least recently used go first)
+            max_bytes: Approximate memory budget for cached values and responses
+        """
+        if maxsize < 1 or max_bytes < 1:
+            raise ValueError("maxsize and max_bytes must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive or None")
+
+        self._result_cache = _ValidationResultCache(maxsize, max_bytes, ttl)
+        self._cached_fields = set(field_names) if field_names else None
+
+    def disable_result_cache(self, *field_names: str) -> None:
+        """Stop memoizing the given fields, or all fields when called without arguments."""
+
+        if not field_names:
+            self._result_cache = None
+            self._cached_fields = None
+            return
+        if self._cached_fields is None:
+            self._cached_fields = set(self.validators)
+        self._cached_fields -= set(field_names)
+
+    def clear_result_cache(self) -> None:
+        """Drop all memoized results and reset the statistics."""
+
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def result_cache_info(self) -> Optional[ValidationCacheInfo]:
+        """Return hit/miss/eviction/expiry counters, or ``None`` if caching is disabled."""
+
+        return self._result_cache.info() if self._result_cache is not None else None
+
+    def render_validation_feedback(self, response: ValidationResponse, *, oob: bool = False) -> str:
+        """
+        Render the ``#<field>-feedback`` element for a validation response.
+
+        Args:
+            response: Result of validating one field
+            oob: Mark the element as an HTMX out-of-band swap
+
+        Returns:
+            HTML string for the feedback element
+        """
+        messages: List[Tuple[str, str]] = [("error", message) for message in response.errors]
+        if self.config.show_warnings:
+            messages.extend(("warning", message) for message in response.warnings)
+        if self.config.show_suggestions:
+            messages.extend(("suggestion", message) for message in response.suggestions)
+
+        if not response.is_valid:
+            feedback_class = self.config.error_class
+        elif response.warnings and self.config.show_warnings:
+            feedback_class = self.config.warning_class
+        elif self.config.show_success_indicators:
+            feedback_class = self.config.success_class
+        else:
+            feedback_class = ""
+
+        return self.validation_template.render(
+            feedback_class=feedback_class,
+            field_name=html.escape(response.field_name, quote=True),
+            extra_attributes=' hx-swap-oob="true"' if oob else "",
+            feedback_content="".join(
+                f'<div class="validation-{kind}">{html.escape(message)}</div>'
+                for kind, message in messages
+            ),
+        ).strip()
+
+    def batch_validation_attributes(self, endpoint: str) -> str:
+        """
+        Return HTMX attributes that validate a whole form through one batched endpoint.
+
+        Place them on the ``<form>`` element. Changed fields are posted together; a newer
+        request replaces one still in flight (``hx-sync``), and the per-field feedback
+        arrives as out-of-band swaps.
+
+        Args:
+            endpoint: URL of the handler from ``create_asgi_validation_app`` /
+                ``create_wsgi_validation_app``
+
+        Returns:
+            Attribute string for the form element, or ``""`` when no live trigger (input,
+            change or blur) is enabled: posting on submit would swallow the real submission.
+        """
+        if self.config.validate_on_input:
+            trigger = f"input delay:{self.config.debounce_ms}ms"
+        elif self.config.validate_on_change or self.config.validate_on_blur:
+            trigger = "change"
+        else:
+            return ""
+        return " ".join(
+            [
+                f'hx-post="{html.escape(endpoint, quote=True)}"',
+                f'hx-trigger="{trigger}"',
+                'hx-sync="this:replace"',
+                'hx-swap="none"',
+            ]
+        )
 
     def generate_validation_endpoint_code(self, framework: str = "flask") -> str:
         """
@@ -486,6 +999,7 @@ __all__ = [
     "ValidationResponse",
     "HTMXValidationConfig",
     "LiveValidator",
+    "ValidationCacheInfo",
     "create_email_validator",
     "create_password_strength_validator",
 ]
@@ -0,0 +1,405 @@
+"""Mountable batched live-validation endpoint.
+
+``LiveValidator.validate_field`` answers one field per HTTP request. The handler below
+validates a whole batch - every changed field of a form, or the full form - in one
+request and answers with per-field feedback:
+
+    live = LiveValidator()
+    live.register_model_validator(OnboardingForm)
+
+    # FastAPI / Starlette
+    app.mount("/validate", create_asgi_validation_app(live))
+
+    # Flask
+    app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {"/validate": create_wsgi_validation_app(live)})
+
+and in the template::
+
+    <form {{ live.batch_validation_attributes("/validate") }}> ... </form>
+
+Requests are ``application/x-www-form-urlencoded`` (what HTMX posts) or a JSON object,
+either flat (``{"email": "a@b"}``) or wrapped (``{"fields": {...}, "seq": 3}``). HTMX
+requests (``HX-Request`` header) receive the ``#<field>-feedback`` elements as
+out-of-band swaps; other clients receive JSON. ``?format=json`` / ``?format=html``
+overrides the choice.
+
+Stale results are dropped on both ends: ``hx-sync="this:replace"`` aborts a request
+still in flight when the form changes again, and clients that send an increasing
+sequence number (``seq`` / ``_validation_seq``) with an ``X-Validation-Client`` id get
+``204 No Content`` for a request that arrives after a newer one was answered.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qs, parse_qsl
+
+from .live_validation import LiveValidator
+from .validation import ValidationResponse
+
+DEFAULT_MAX_BODY_BYTES = 256 * 1024
+
+SEQUENCE_FIELD = "_validation_seq"
+CLIENT_HEADER = "x-validation-client"
+
+
+@dataclass(frozen=True)
+class ValidationEndpointResponse:
+    """Framework-agnostic response produced by :func:`handle_validation_request`."""
+
+    status: int
+    headers: Tuple[Tuple[str, str], ...]
+    body: bytes = b""
+
+    @property
+    def status_line(self) -> str:
+        return {
+            200: "200 OK",
+            204: "204 No Content",
+            400: "400 Bad Request",
+            405: "405 Method Not Allowed",
+            413: "413 Payload Too Large",
+            415: "415 Unsupported Media Type",
+        }[self.status]
+
+
+class UnsupportedMediaTypeError(ValueError):
+    """The request body is neither JSON nor an urlencoded form."""
+
+
+class StaleRequestGuard:
+    """Remember the newest sequence number answered per client (bounded LRU)."""
+
+    def __init__(self, max_clients: int = 10_000) -> None:
+        self.max_clients = max_clients
+        self._latest: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = Lock()
+
+    def accept(self, client: str, sequence: int) -> bool:
+        """Record ``sequence`` for ``client``; ``False`` if a newer one was already seen."""
+
+        with self._lock:
+            latest = self._latest.get(client)
+            if latest is not None and sequence < latest:
+                return False
+            self._latest[client] = sequence
+            self._latest.move_to_end(client)
+            while len(self._latest) > self.max_clients:
+                self._latest.popitem(last=False)
+            return True
+
+
+def _simple_response(status: int, message: str, *extra: Tuple[str, str]) -> ValidationEndpointResponse:
+    body = message.encode("utf-8")
+    headers = (("content-type", "text/plain; charset=utf-8"), ("content-length", str(len(body))), *extra)
+    return ValidationEndpointResponse(status, headers, body)
+
+
+def _parse_form_body(body: bytes) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+    for key, value in parse_qsl(body.decode("utf-8"), keep_blank_values=True):
+        if key in values:
+            existing = values[key]
+            values[key] = existing + [value] if isinstance(existing, list) else [existing, value]
+        else:
+            values[key] = value
+    return values
+
+
+def parse_validation_request(body: bytes, content_type: Optional[str]) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Return the submitted ``{field: value}`` batch and the optional sequence number.
+
+    Raises:
+        UnsupportedMediaTypeError: ``content_type`` is not JSON or urlencoded.
+        ValueError: The body does not parse as a JSON object.
+    """
+
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type == "application/json":
+        payload = json.loads(body.decode("utf-8") or "{}")
+        if not isinstance(payload, dict):
+            raise ValueError("JSON body must be an object")
+        sequence = payload.get("seq")
+        fields = payload.get("fields", payload)
+        if not isinstance(fields, dict):
+            raise ValueError("'fields' must be an object")
+        if fields is payload:
+            fields = {key: value for key, value in payload.items() if key != "seq"}
+    elif media_type in ("", "application/x-www-form-urlencoded"):
+        fields = _parse_form_body(body)
+        sequence = fields.pop(SEQUENCE_FIELD, None)
+    else:
+        raise UnsupportedMediaTypeError(media_type)
+
+    fields.pop(SEQUENCE_FIELD, None)
+    try:
+        sequence = int(sequence) if sequence is not None and not isinstance(sequence, list) else None
+    except (TypeError, ValueError):
+        sequence = None
+    return fields, sequence
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _wants_html(headers: Mapping[str, str], query: Mapping[str, List[str]]) -> bool:
+    requested = (query.get("format") or [""])[0].lower()
+    if requested in ("html", "json"):
+        return requested == "html"
+    if headers.get("hx-request", "").lower() == "true":
+        return True
+    accept = headers.get("accept", "")
+    return "text/html" in accept and "application/json" not in accept
+
+
+def render_validation_results(
+    validator: LiveValidator,
+    results: Mapping[str, ValidationResponse],
+    *,
+    as_html: bool,
+) -> Tuple[str, bytes]:
+    """Return ``(content_type, body)`` for a batch of results."""
+
+    if as_html:
+        fragments = [validator.render_validation_feedback(response, oob=True) for response in results.values()]
+        return "text/html; charset=utf-8", "\n".join(fragments).encode("utf-8")
+
+    payload = {
+        "is_valid": all(response.is_valid for response in results.values()),
+        "fields": {field_name: response.to_dict() for field_name, response in results.items()},
+    }
+    return "application/json", json.dumps(payload, default=str).encode("utf-8")
+
+
+def _prepare_request(
+    method: str,
+    body: bytes,
+    content_type: Optional[str],
+    headers: Mapping[str, str],
+    skip_blank: bool,
+    guard: Optional[StaleRequestGuard],
+    max_body_bytes: int,
+) -> Union[ValidationEndpointResponse, Dict[str, Any]]:
+    """Return the fields to validate, or the response that ends the request early."""
+
+    if method != "POST":
+        return _simple_response(405, "Method Not Allowed", ("allow", "POST"))
+    if len(body) > max_body_bytes:
+        return _simple_response(413, "Payload Too Large")
+
+    try:
+        fields, sequence = parse_validation_request(body, content_type)
+    except UnsupportedMediaTypeError:
+        return _simple_response(415, "Unsupported Media Type")
+    except (ValueError, UnicodeDecodeError):
+        return _simple_response(400, "Bad Request")
+
+    client = headers.get(CLIENT_HEADER)
+    if guard is not None and client and sequence is not None and not guard.accept(client, sequence):
+        return ValidationEndpointResponse(204, (("content-length", "0"),))
+
+    if skip_blank:
+        trigger = headers.get("hx-trigger-name")
+        fields = {name: value for name, value in fields.items() if name == trigger or not _is_blank(value)}
+    return fields
+
+
+def _results_response(
+    validator: LiveValidator,
+    results: Mapping[str, ValidationResponse],
+    headers: Mapping[str, str],
+    query_string: str,
+) -> ValidationEndpointResponse:
+    response_type, response_body = render_validation_results(
+        validator,
+        results,
+        as_html=_wants_html(headers, parse_qs(query_string)),
+    )
+    response_headers = (
+        ("content-type", response_type),
+        ("content-length", str(len(response_body))),
+        ("cache-control", "no-store"),
+        ("vary", "HX-Request, Accept"),
+    )
+    return ValidationEndpointResponse(200, response_headers, response_body)
+
+
+def handle_validation_request(
+    validator: LiveValidator,
+    *,
+    method: str,
+    body: bytes,
+    content_type: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    query_string: str = "",
+    skip_blank: bool = True,
+    guard: Optional[StaleRequestGuard] = None,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+) -> ValidationEndpointResponse:
+    """Validate one batched request.
+
+    Args:
+        validator: LiveValidator holding the field validators.
+        method: HTTP method; only POST is allowed.
+        body: Raw request body.
+        content_type: Value of the ``Content-Type`` header.
+        headers: Request headers with lower-case names.
+        query_string: Raw query string (``format=json|html``).
+        skip_blank: Do not report on empty fields the user has not reached yet. The
+            field that triggered an HTMX request (``HX-Trigger-Name``) is always validated.
+        guard: Tracks sequence numbers to drop stale requests.
+        max_body_bytes: Larger bodies are rejected with 413.
+    """
+
+    headers = headers or {}
+    fields = _prepare_request(method, body, content_type, headers, skip_blank, guard, max_body_bytes)
+    if isinstance(fields, ValidationEndpointResponse):
+        return fields
+    return _results_response(validator, validator.validate_fields(fields), headers, query_string)
+
+
+async def ahandle_validation_request(
+    validator: LiveValidator,
+    *,
+    method: str,
+    body: bytes,
+    content_type: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    query_string: str = "",
+    skip_blank: bool = True,
+    guard: Optional[StaleRequestGuard] = None,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    max_concurrency: int = 10,
+    timeout: Optional[float] = None,
+) -> ValidationEndpointResponse:
+    """Async variant of :func:`handle_validation_request`.
+
+    Validators run through ``LiveValidator.avalidate_fields``, so ``async def`` checks are
+    awaited concurrently (``max_concurrency`` at a time, each limited to ``timeout``).
+    """
+
+    headers = headers or {}
+    fields = _prepare_request(method, body, content_type, headers, skip_blank, guard, max_body_bytes)
+    if isinstance(fields, ValidationEndpointResponse):
+        return fields
+    results = await validator.avalidate_fields(fields, max_concurrency=max_concurrency, timeout=timeout)
+    return _results_response(validator, results, headers, query_string)
+
+
+def create_asgi_validation_app(
+    validator: LiveValidator,
+    *,
+    skip_blank: bool = True,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    max_concurrency: int = 10,
+    timeout: Optional[float] = None,
+) -> Callable[..., Awaitable[None]]:
+    """Return an ASGI app answering batched validation requests (mount it anywhere).
+
+    Async validators are awaited concurrently, ``max_concurrency`` per request, each
+    limited to ``timeout`` seconds.
+    """
+
+    guard = StaleRequestGuard()
+
+    async def app(scope: Mapping[str, Any], receive: Callable[..., Awaitable[Any]], send: Callable[..., Awaitable[None]]) -> None:
+        if scope.get("type") != "http":
+            return
+
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope.get("headers") or []}
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message.get("type") == "http.disconnect":
+                # The client gave up (e.g. hx-sync replaced the request); nothing to answer.
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size <= max_body_bytes:
+                chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        if size > max_body_bytes:
+            response = _simple_response(413, "Payload Too Large")
+        else:
+            response = await ahandle_validation_request(
+                validator,
+                method=scope.get("method", "GET"),
+                body=b"".join(chunks),
+                content_type=headers.get("content-type"),
+                headers=headers,
+                query_string=(scope.get("query_string") or b"").decode("latin-1"),
+                skip_blank=skip_blank,
+                guard=guard,
+                max_body_bytes=max_body_bytes,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+            )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in response.headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+    return app
+
+
+def create_wsgi_validation_app(
+    validator: LiveValidator,
+    *,
+    skip_blank: bool = True,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+) -> Callable[[Dict[str, Any], Callable[..., Any]], Iterable[bytes]]:
+    """Return a WSGI app answering batched validation requests (mount it anywhere)."""
+
+    guard = StaleRequestGuard()
+
+    def app(environ: Dict[str, Any], start_response: Callable[..., Any]) -> List[bytes]:
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length > max_body_bytes:
+            response = _simple_response(413, "Payload Too Large")
+        else:
+            headers = {
+                key[5:].replace("_", "-").lower(): value for key, value in environ.items() if key.startswith("HTTP_")
+            }
+            response = handle_validation_request(
+                validator,
+                method=environ.get("REQUEST_METHOD", "GET"),
+                body=environ["wsgi.input"].read(length) if length > 0 else b"",
+                content_type=environ.get("CONTENT_TYPE"),
+                headers=headers,
+                query_string=environ.get("QUERY_STRING", ""),
+                skip_blank=skip_blank,
+                guard=guard,
+                max_body_bytes=max_body_bytes,
+            )
+        start_response(response.status_line, list(response.headers))
+        return [response.body]
+
+    return app
+
+
+__all__ = [
+    "StaleRequestGuard",
+    "UnsupportedMediaTypeError",
+    "ValidationEndpointResponse",
+    "ahandle_validation_request",
+    "create_asgi_validation_app",
+    "create_wsgi_validation_app",
+    "handle_validation_request",
+    "parse_validation_request",
+    "render_validation_results",
+]
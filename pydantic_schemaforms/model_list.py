@@ -17,6 +17,8 @@ Features:
 from typing import Any, Dict, List, Optional, Type
 
 from pydantic_schemaforms.rendering.context import RenderContext
+from pydantic_schemaforms.rendering.renderer_pool import get_pooled_renderer
+from pydantic_schemaforms.rendering.schema_parser import build_schema_metadata
 from pydantic_schemaforms.rendering.themes import RendererTheme, get_theme_for_framework
 from pydantic_schemaforms.schema_form import FormModel
 
@@ -233,11 +235,9 @@ class ModelListRenderer:
     ) -> str:
         """Render a single Bootstrap list item."""
 
-        from pydantic_schemaforms.enhanced_renderer import EnhancedFormRenderer
+        renderer = get_pooled_renderer("bootstrap")
 
-        renderer = EnhancedFormRenderer(framework="bootstrap")
-
-        schema = model_class.model_json_schema()
+        schema = build_schema_metadata(model_class).schema
         schema_defs = schema.get("$defs") or schema.get("definitions", {}) or {}
         nested_context = RenderContext(form_data=item_data or {}, schema_defs=schema_defs)
         required_fields = schema.get("required", [])
@@ -289,11 +289,9 @@ class ModelListRenderer:
     ) -> str:
         """Render a single Material Design list item."""
 
-        from pydantic_schemaforms.simple_material_renderer import SimpleMaterialRenderer
-
-        renderer = SimpleMaterialRenderer()
+        renderer = get_pooled_renderer("material")
 
-        schema = model_class.model_json_schema()
+        schema = build_schema_metadata(model_class).schema
         schema_defs = schema.get("$defs") or schema.get("definitions", {}) or {}
         nested_context = RenderContext(form_data=item_data or {}, schema_defs=schema_defs)
         required_fields = schema.get("required", [])
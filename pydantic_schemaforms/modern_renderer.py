@@ -9,7 +9,11 @@ lived in this file and keeps all framework-specific markup in one place.
 
 from __future__ import annotations
 
+import hashlib
 import re
+import weakref
+from collections import OrderedDict
+from threading import RLock
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from pydantic import create_model
@@ -54,6 +58,42 @@ _FIELD_TYPE_ANNOTATIONS: Dict[str, Any] = {
 
 _HONEYPOT_FIELD_NAME = "honeypot_trap"
 
+# Generated FormModel classes keyed by FormDefinition.fingerprint(). The LRU keeps the
+# most recent models alive; the weak map still finds evicted models that are referenced
+# elsewhere, so one fingerprint never maps to two live classes.
+_GENERATED_MODEL_CACHE_MAX = 128
+_generated_models: "OrderedDict[str, Type[FormModel]]" = OrderedDict()
+_generated_models_weak: "weakref.WeakValueDictionary[str, Type[FormModel]]" = weakref.WeakValueDictionary()
+_generated_models_lock = RLock()
+
+
+def _freeze(value: Any) -> Any:
+    """Reduce ``value`` to a hashable, order-stable structure for fingerprinting."""
+
+    if isinstance(value, dict):
+        return tuple(sorted(((str(key), _freeze(item)) for key, item in value.items()), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_freeze(item) for item in value), key=repr))
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return (type(value).__qualname__, repr(value))
+
+
+def reset_generated_model_cache() -> None:
+    """Forget every FormModel generated from a FormDefinition."""
+
+    with _generated_models_lock:
+        _generated_models.clear()
+        _generated_models_weak.clear()
+
+
+def generated_model_cache_size() -> int:
+    """Number of generated models currently held by the LRU."""
+
+    return len(_generated_models)
+
 
 def _resolve_annotation(field_type: str) -> Any:
     return _FIELD_TYPE_ANNOTATIONS.get(field_type, str)
@@ -234,10 +274,60 @@ class FormDefinition:
                 ordered.append((field, section.title))
         return ordered
 
+    def fingerprint(self) -> str:
+        """Digest of everything that shapes the generated model (title, sections, fields).
+
+        Two definitions with the same fingerprint generate identical FormModel classes,
+        so :meth:`to_form_model_class` shares one class (and its cached schema metadata
+        and render plans) between them.
+        """
+
+        field_parts = [
+            (
+                section_title,
+                field.name,
+                field.field_type,
+                field.label,
+                field.required,
+                field.placeholder,
+                field.help_text,
+                _freeze(field.value),
+                _freeze(field.options),
+                _freeze(field.attributes),
+                field.ui_section,
+                _freeze(field.order),
+                _freeze(field.extra_attrs),
+            )
+            for field, section_title in self._iter_fields()
+        ]
+        structure = (self.title, bool(self.honeypot_protection), tuple(field_parts))
+        return hashlib.sha256(repr(structure).encode("utf-8")).hexdigest()
+
     def to_form_model_class(self) -> Type[FormModel]:
         if self._model_cache is not None:
             return self._model_cache
 
+        fingerprint = self.fingerprint()
+        with _generated_models_lock:
+            model_cls = _generated_models.get(fingerprint) or _generated_models_weak.get(fingerprint)
+            if model_cls is not None:
+                _generated_models[fingerprint] = model_cls
+                _generated_models.move_to_end(fingerprint)
+                self._model_cache = model_cls
+                return model_cls
+
+        model_cls = self._create_model_class()
+        with _generated_models_lock:
+            # Another thread may have generated the same model meanwhile; keep the first.
+            model_cls = _generated_models_weak.setdefault(fingerprint, model_cls)
+            _generated_models[fingerprint] = model_cls
+            _generated_models.move_to_end(fingerprint)
+            while len(_generated_models) > _GENERATED_MODEL_CACHE_MAX:
+                _generated_models.popitem(last=False)
+        self._model_cache = model_cls
+        return model_cls
+
+    def _create_model_class(self) -> Type[FormModel]:
         field_defs: Dict[str, Tuple[Type[Any], Any]] = {}
         for order, (field, section_title) in enumerate(self._iter_fields()):
             annotation, model_field = field.as_model_field(order, section_title)
@@ -256,9 +346,7 @@ class FormDefinition:
         if not field_defs:
             raise ValueError("FormDefinition must define at least one field")
 
-        model_name = self._model_name()
-        self._model_cache = create_model(model_name, __base__=FormModel, **field_defs)
-        return self._model_cache
+        return create_model(self._model_name(), __base__=FormModel, **field_defs)
 
     def _model_name(self) -> str:
         sanitized = re.sub(r"[^0-9a-zA-Z]+", "", self.title) or "Form"
@@ -307,7 +395,7 @@ class ModernFormRenderer(EnhancedFormRenderer):
         )
 
         if form_def.live_validation:
-            html = f"{html}\n{self._client_validation_script()}"
+            html = f"{html}\n{self._client_validation_script(model_cls)}"
 
         return html
 
@@ -335,7 +423,7 @@ class ModernFormRenderer(EnhancedFormRenderer):
         )
 
         if form_def.live_validation:
-            html = f"{html}\n{self._client_validation_script()}"
+            html = f"{html}\n{self._client_validation_script(model_cls)}"
 
         return html
 
@@ -421,32 +509,10 @@ class ModernFormRenderer(EnhancedFormRenderer):
         layout = resolved.pop("layout", form_def.layout)
         return layout, resolved
 
-    def _client_validation_script(self) -> str:
-        return """
-<script>
-document.addEventListener('DOMContentLoaded', function() {
-    const form = document.getElementById('main-form');
-    if (!form) {
-        return;
-    }
-
-    form.addEventListener('submit', function(event) {
-        if (!form.checkValidity()) {
-            event.preventDefault();
-            event.stopPropagation();
-        }
-        form.classList.add('was-validated');
-    });
+    def _client_validation_script(self, model_cls: Type[FormModel]) -> str:
+        from .client_validation import client_validation_tags
 
-    const inputs = form.querySelectorAll('input, select, textarea');
-    inputs.forEach(function(input) {
-        input.addEventListener('blur', function() {
-            this.classList.add('was-validated');
-        });
-    });
-});
-</script>
-""".strip()
+        return client_validation_tags(model_cls, asset_mode=self.asset_mode)
 
 
 __all__ = [
@@ -454,4 +520,6 @@ __all__ = [
     "FormSection",
     "FormDefinition",
     "ModernFormRenderer",
+    "generated_model_cache_size",
+    "reset_generated_model_cache",
 ]
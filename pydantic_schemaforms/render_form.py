@@ -6,11 +6,13 @@ This module maintains compatibility with existing code while using the enhanced
 import asyncio
 import logging
 import time
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Type, Union
 
 from .enhanced_renderer import SchemaFormValidationError
+from .enhanced_renderer import iter_form_html as _core_iter_form_html
 from .enhanced_renderer import render_form_html as _core_render_form_html
 from .assets.runtime import htmx_script_tag, imask_script_tag
+from .instrumentation import PHASE_ASSETS, PHASE_MARKERS, begin_render
 from .schema_form import FormModel
 
 logger = logging.getLogger(__name__)
@@ -61,28 +63,34 @@ def render_form_html(
     render_kwargs.setdefault("action", submit_url)
     render_kwargs.setdefault("method", "POST")
 
-    form_html = _core_render_form_html(
-        form_model_cls,
-        form_data=form_data,
-        errors=errors,
-        framework=framework,
-        debug=debug,
-        show_timing=show_timing,
-        include_html_markers=False,
-        **render_kwargs,
-    )
+    recorder = begin_render(form_model_cls, "render_form_html", framework=framework, layout=kwargs.get("layout"))
+    with recorder.activate():
+        form_html = _core_render_form_html(
+            form_model_cls,
+            form_data=form_data,
+            errors=errors,
+            framework=framework,
+            debug=debug,
+            show_timing=show_timing,
+            include_html_markers=False,
+            **render_kwargs,
+        )
 
     # Add HTMX response container and scripts for backward compatibility.
     # Default is offline-by-default: vendored HTMX is inlined unless asset_mode="cdn".
-    form_html += '\n<div id="form-response"></div>'
+    # Collect the pieces and join once; the vendored scripts are large.
+    parts = [form_html, '\n<div id="form-response"></div>']
     htmx_tag = htmx_script_tag(asset_mode=asset_mode)
     if htmx_tag:
-        form_html += f"\n{htmx_tag}"
+        parts.extend(("\n", htmx_tag))
 
     if include_imask:
         imask_tag = imask_script_tag(asset_mode=asset_mode)
         if imask_tag:
-            form_html += f"\n{imask_tag}"
+            parts.extend(("\n", imask_tag))
+    recorder.mark(PHASE_ASSETS)
+
+    form_html = "".join(parts)
 
     # Calculate and log render time
     render_time = time.perf_counter() - start_time
@@ -91,7 +99,10 @@ def render_form_html(
 
     from .html_markers import wrap_with_schemaforms_markers
 
-    return wrap_with_schemaforms_markers(form_html, enabled=include_html_markers)
+    form_html = wrap_with_schemaforms_markers(form_html, enabled=include_html_markers)
+    recorder.mark(PHASE_MARKERS)
+    recorder.finish(form_html)
+    return form_html
 
 
 async def render_form_html_async(
@@ -133,3 +144,130 @@ async def render_form_html_async(
         loop = asyncio.get_event_loop()
 
     return await loop.run_in_executor(None, render_callable)
+
+
+def iter_render_form(
+    form_model_cls: Type[FormModel],
+    form_data: Optional[Dict[str, Any]] = None,
+    errors: Optional[Union[Dict[str, str], SchemaFormValidationError]] = None,
+    framework: str = "bootstrap",
+    *,
+    submit_url: str,
+    asset_mode: str = "vendored",
+    include_imask: bool = False,
+    show_timing: bool = False,
+    enable_logging: bool = False,
+    include_html_markers: bool = True,
+    **kwargs,
+) -> Iterator[str]:
+    """
+    Render the same HTML as render_form_html, yielded as fragments while it is produced.
+
+    Fragments come out in document order: start marker, layout styles, the form open
+    tag, each field, the submit button and closing tag, then scripts and the end
+    marker. Pass the iterator straight to a streaming response, e.g. Starlette's
+    ``StreamingResponse(iter_render_form(...), media_type="text/html")`` or Flask's
+    ``Response(stream_with_context(iter_render_form(...)))``.
+
+    ``"".join(iter_render_form(...))`` equals ``render_form_html(...)`` for the same
+    arguments. Debug panels need the complete document and are not supported here.
+    """
+    from .html_markers import iter_with_schemaforms_markers
+
+    render_kwargs: Dict[str, Any] = dict(kwargs)
+    render_kwargs["submit_url"] = submit_url
+    render_kwargs.setdefault("action", submit_url)
+    render_kwargs.setdefault("method", "POST")
+
+    recorder = begin_render(
+        form_model_cls,
+        "iter_render_form",
+        streamed=True,
+        framework=framework,
+        layout=kwargs.get("layout"),
+    )
+    with recorder.activate():
+        form_fragments = _core_iter_form_html(
+            form_model_cls,
+            form_data=form_data,
+            errors=errors,
+            framework=framework,
+            show_timing=show_timing,
+            include_html_markers=False,
+            **render_kwargs,
+        )
+
+    def fragments() -> Iterator[str]:
+        start_time = time.perf_counter()
+        yield from form_fragments
+
+        # Same HTMX response container and scripts as render_form_html.
+        yield '\n<div id="form-response"></div>'
+        htmx_tag = htmx_script_tag(asset_mode=asset_mode)
+        recorder.mark(PHASE_ASSETS)
+        if htmx_tag:
+            yield f"\n{htmx_tag}"
+
+        if include_imask:
+            imask_tag = imask_script_tag(asset_mode=asset_mode)
+            recorder.mark(PHASE_ASSETS)
+            if imask_tag:
+                yield f"\n{imask_tag}"
+
+        if enable_logging:
+            render_time = time.perf_counter() - start_time
+            logger.debug(f"Form streamed in {render_time:.3f} seconds (model: {form_model_cls.__name__})")
+
+    return recorder.track(iter_with_schemaforms_markers(fragments(), enabled=include_html_markers))
+
+
+async def aiter_render_form(
+    form_model_cls: Type[FormModel],
+    form_data: Optional[Dict[str, Any]] = None,
+    errors: Optional[Union[Dict[str, str], SchemaFormValidationError]] = None,
+    framework: str = "bootstrap",
+    *,
+    submit_url: str,
+    asset_mode: str = "vendored",
+    include_imask: bool = False,
+    show_timing: bool = False,
+    enable_logging: bool = False,
+    include_html_markers: bool = True,
+    batch_size: int = 64,
+    **kwargs,
+) -> AsyncIterator[str]:
+    """
+    Async counterpart to iter_render_form that avoids blocking the event loop.
+
+    Fragments are produced in a worker thread ``batch_size`` at a time, so large forms
+    neither stall the loop nor pay a thread hop per field.
+    """
+    fragments = iter_render_form(
+        form_model_cls,
+        form_data=form_data,
+        errors=errors,
+        framework=framework,
+        submit_url=submit_url,
+        asset_mode=asset_mode,
+        include_imask=include_imask,
+        show_timing=show_timing,
+        enable_logging=enable_logging,
+        include_html_markers=include_html_markers,
+        **kwargs,
+    )
+
+    def next_batch() -> List[str]:
+        batch: List[str] = []
+        for fragment in fragments:
+            batch.append(fragment)
+            if len(batch) >= batch_size:
+                break
+        return batch
+
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = await loop.run_in_executor(None, next_batch)
+        if not batch:
+            return
+        for fragment in batch:
+            yield fragment
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from html import escape
 import re
 from typing import Any, Dict, List, Optional
@@ -10,6 +11,7 @@ from ..icon_mapping import map_icon_for_framework
 from ..inputs import HiddenInput
 from ..rendering.context import RenderContext
 from ..rendering.frameworks import get_input_component
+from .render_plan import FieldPlan
 from .themes import RendererTheme
 
 
@@ -46,10 +48,31 @@ class FieldRenderer:
         if context is None:
             raise ValueError("RenderContext is required for field rendering")
 
+        plan = self.compile_field(field_name, field_schema, required_fields)
+        return self.render_compiled_field(plan, value, error, context, all_errors)
+
+    def compile_field(
+        self,
+        field_name: str,
+        field_schema: Dict[str, Any],
+        required_fields: Optional[List[str]] = None,
+        *,
+        precompute_markup: bool = False,
+    ) -> FieldPlan:
+        """Resolve everything about a field that does not depend on request data."""
+
         ui_info = field_schema.get("ui", {}) or field_schema
+        is_required = field_name in (required_fields or [])
 
         if ui_info.get("hidden"):
-            return self._render_hidden_field(field_name, value)
+            return FieldPlan(
+                name=field_name,
+                schema=field_schema,
+                ui_info=ui_info,
+                ui_element="hidden",
+                kind="hidden",
+                required=is_required,
+            )
 
         ui_element = (
             ui_info.get("element")
@@ -59,29 +82,17 @@ class FieldRenderer:
             or self._infer_ui_element(field_schema)
         )
 
-        if ui_element == "layout":
-            return self._renderer._render_layout_field(  # noqa: SLF001
-                field_name,
-                field_schema,
-                value,
-                error,
-                ui_info,
-                context,
-            )
-
-        if ui_element == "model_list":
-            return self._render_model_list_field(
-                field_name,
-                field_schema,
-                value,
-                error,
-                required_fields,
-                ui_info,
-                context,
-                all_errors,
+        if ui_element in ("layout", "model_list"):
+            return FieldPlan(
+                name=field_name,
+                schema=field_schema,
+                ui_info=ui_info,
+                ui_element=ui_element,
+                kind=ui_element,
+                required=is_required,
             )
 
-        input_component = get_input_component(ui_element)()
+        component_cls = get_input_component(ui_element)
 
         field_attrs = {
             "name": field_name,
@@ -89,18 +100,7 @@ class FieldRenderer:
             "class": self._get_input_class(ui_element),
         }
 
-        if value is not None and ui_element != "password":
-            if ui_element == "checkbox":
-                if value is True or value == "true" or value == "1" or value == "on":
-                    field_attrs["checked"] = True
-                field_attrs["value"] = "1"
-            else:
-                field_attrs["value"] = value
-        elif value is not None and ui_element == "password":
-            field_attrs["value"] = value
-
-        resolved_required = required_fields or []
-        if field_name in resolved_required:
+        if is_required:
             field_attrs["required"] = True
 
         if "minLength" in field_schema:
@@ -137,47 +137,139 @@ class FieldRenderer:
         if icon:
             icon = map_icon_for_framework(icon, self.framework)
 
+        selection_options: Optional[List[Any]] = None
+        if ui_element in ("select", "radio", "multiselect"):
+            selection_options = ui_options_list or []
+            if not selection_options and "enum" in field_schema:
+                selection_options = field_schema["enum"]
+            if (
+                not selection_options
+                and isinstance(field_schema.get("items"), dict)
+                and "enum" in field_schema.get("items", {})
+            ):
+                selection_options = field_schema["items"]["enum"]
+
+        wrapper_class = ""
+        if self.theme:
+            wrapper_class = self.theme.field_wrapper_class() or ""
+        if not wrapper_class:
+            wrapper_class = self.config.get("field_wrapper_class", "")
+
+        # Submitted values are spliced in between the identity attributes
+        # (name/id/class) and the rest so attribute order matches a full render.
+        head_keys = ("name", "id", "class")
+        plan = FieldPlan(
+            name=field_name,
+            schema=field_schema,
+            ui_info=ui_info,
+            ui_element=ui_element,
+            kind="input",
+            required=is_required,
+            component_cls=component_cls,
+            head_attrs={key: field_attrs[key] for key in head_keys},
+            tail_attrs={key: val for key, val in field_attrs.items() if key not in head_keys},
+            label=label_text,
+            help_text=help_text,
+            icon=icon,
+            selection_options=selection_options,
+            wrapper_class=wrapper_class,
+        )
+
+        if precompute_markup and getattr(component_cls, "static_markup", False):
+            plan = replace(plan, pristine_html=self._render_input(plan, None, None))
+
+        return plan
+
+    def render_compiled_field(
+        self,
+        plan: FieldPlan,
+        value: Any = None,
+        error: Optional[str] = None,
+        context: Optional[RenderContext] = None,
+        all_errors: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Render a compiled field, splicing in the request-specific value and error."""
+
+        if context is None:
+            raise ValueError("RenderContext is required for field rendering")
+
+        if plan.kind == "hidden":
+            return self._render_hidden_field(plan.name, value)
+
+        if plan.kind == "layout":
+            return self._renderer._render_layout_field(  # noqa: SLF001
+                plan.name,
+                plan.schema,
+                value,
+                error,
+                plan.ui_info,
+                context,
+            )
+
+        if plan.kind == "model_list":
+            return self._render_model_list_field(
+                plan.name,
+                plan.schema,
+                value,
+                error,
+                [plan.name] if plan.required else [],
+                plan.ui_info,
+                context,
+                all_errors,
+            )
+
+        if value is None and not error and plan.pristine_html is not None:
+            return plan.pristine_html
+
+        return self._render_input(plan, value, error)
+
+    def _render_input(self, plan: FieldPlan, value: Any, error: Optional[str]) -> str:
+        ui_element = plan.ui_element
+        field_attrs = dict(plan.head_attrs or {})
+
+        if value is not None:
+            if ui_element == "checkbox":
+                if value is True or value == "true" or value == "1" or value == "on":
+                    field_attrs["checked"] = True
+                field_attrs["value"] = "1"
+            else:
+                field_attrs["value"] = value
+
+        field_attrs.update(plan.tail_attrs or {})
+
+        input_component = plan.component_cls()
+
         try:
-            if ui_element in ("select", "radio", "multiselect"):
-                selection_options = ui_options_list or []
-                if not selection_options and "enum" in field_schema:
-                    selection_options = field_schema["enum"]
-                if (
-                    not selection_options
-                    and isinstance(field_schema.get("items"), dict)
-                    and "enum" in field_schema.get("items", {})
-                ):
-                    selection_options = field_schema["items"]["enum"]
-
-                formatted_options = self._normalize_options(selection_options, value)
+            if plan.selection_options is not None:
+                formatted_options = self._normalize_options(plan.selection_options, value)
 
                 if not formatted_options:
                     input_html = (
-                        f"<!-- Warning: No options provided for {ui_element} field '{field_name}' -->"
+                        f"<!-- Warning: No options provided for {ui_element} field '{plan.name}' -->"
                     )
                 else:
                     field_attrs.pop("value", None)
                     if ui_element == "radio":
-                        field_attrs.setdefault("group_name", field_name)
-                        field_attrs.setdefault("legend", label_text)
+                        field_attrs.setdefault("group_name", plan.name)
+                        field_attrs.setdefault("legend", plan.label)
                     if ui_element == "multiselect":
                         field_attrs["multiple"] = True
 
                     input_html = input_component.render_with_label(
-                        label=label_text,
-                        help_text=help_text,
+                        label=plan.label,
+                        help_text=plan.help_text,
                         error=error,
-                        icon=icon,
+                        icon=plan.icon,
                         framework=self.framework,
                         options=formatted_options,
                         **field_attrs,
                     )
             else:
                 input_html = input_component.render_with_label(
-                    label=label_text,
-                    help_text=help_text,
+                    label=plan.label,
+                    help_text=plan.help_text,
                     error=error,
-                    icon=icon,
+                    icon=plan.icon,
                     framework=self.framework,
                     **field_attrs,
                 )
@@ -187,13 +279,8 @@ class FieldRenderer:
         except Exception as exc:  # pragma: no cover - defensive fallback
             input_html = f"<!-- Error rendering {ui_element}: {str(exc)} -->"
 
-        wrapper_class = ""
-        if self.theme:
-            wrapper_class = self.theme.field_wrapper_class() or ""
-        if not wrapper_class:
-            wrapper_class = self.config.get("field_wrapper_class", "")
-        if wrapper_class:
-            return f'<div class="{wrapper_class}">{input_html}</div>'
+        if plan.wrapper_class:
+            return f'<div class="{plan.wrapper_class}">{input_html}</div>'
         return input_html
 
     def _render_model_list_field(
@@ -460,7 +460,11 @@ def _parse_framework_variant(framework: str, variant: str | None = None) -> Tupl
 def register_form_style(style: FormStyle) -> None:
     """Register or override a `FormStyle` for a framework/variant pair."""
 
+    from .renderer_pool import invalidate_renderer_pool
+
     _FORM_STYLE_REGISTRY[style.key()] = style
+    # Pooled themes captured the previous style when they were constructed.
+    invalidate_renderer_pool()
 
 
 def get_form_style(framework: str, variant: str | None = None) -> FormStyle:
@@ -0,0 +1,287 @@
+"""Optional on-disk cache of model schemas for fast worker cold starts.
+
+Every worker process normally calls ``model_json_schema()`` for each form model on its
+first render. With a persistent cache enabled, the finished schema (including fields
+registered at runtime) is written to a local directory as compact JSON and later
+workers load it instead of regenerating it::
+
+    from pydantic_schemaforms.rendering.persistent_cache import enable_persistent_schema_cache
+
+    enable_persistent_schema_cache("/var/cache/myapp/schemaforms")
+
+Entries are keyed by the model's qualified name plus a fingerprint of its field
+definitions (recursively including nested models and enum members), the source of the
+modules defining them, the library version and the pydantic version. Files are read lazily, one per model on its first render. Anything unexpected -
+a missing, corrupt or mismatched file, a read-only directory, a schema that does not
+survive a JSON round trip - falls back to generating the schema as usual.
+
+Render plans hold live component classes and theme objects, so they are rebuilt from the
+loaded schema rather than persisted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import typing
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Optional, Set, Type, Union
+
+from pydantic.fields import FieldInfo
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+CACHE_FORMAT_VERSION = 1
+
+_FILENAME_UNSAFE_RE = re.compile(r"[^0-9A-Za-z_.-]+")
+
+
+def _library_version() -> str:
+    from .. import __version__
+
+    return __version__
+
+
+def _pydantic_version() -> str:
+    import pydantic
+
+    return str(getattr(pydantic, "VERSION", ""))
+
+
+def model_qualname(model_cls: Type[Any]) -> str:
+    return f"{model_cls.__module__}.{model_cls.__qualname__}"
+
+
+def _referenced_classes(annotation: Any) -> list:
+    """Classes referenced by an annotation such as ``Optional[List[PetModel]]``."""
+
+    if isinstance(annotation, type):
+        return [annotation]
+    found = []
+    for argument in typing.get_args(annotation):
+        found.extend(_referenced_classes(argument))
+    return found
+
+
+def _source_digest(module_name: str) -> str:
+    """sha256 of a module's source file (``""`` if it has none), cached per file version."""
+
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if not path:
+        return ""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ""
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=512)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _describe_class(cls: Type[Any], seen: Set[Type[Any]]) -> Any:
+    if hasattr(cls, "model_fields"):
+        return _describe_model(cls, seen)
+    if issubclass(cls, Enum):
+        # The repr of an Enum class does not change when members are added or renamed.
+        members = [(member.name, repr(member.value)) for member in cls]
+        return (model_qualname(cls), members, _source_digest(cls.__module__))
+    if hasattr(cls, "__get_pydantic_json_schema__") or hasattr(cls, "__get_pydantic_core_schema__"):
+        return (model_qualname(cls), _source_digest(cls.__module__))
+    return None
+
+
+def _describe_model(model_cls: Type[Any], seen: Set[Type[Any]]) -> list:
+    if model_cls in seen:
+        return [model_qualname(model_cls)]
+    seen.add(model_cls)
+
+    # The source digest covers anything the schema reads from the defining module, e.g.
+    # option lists or json_schema_extra callables.
+    description: list = [
+        model_qualname(model_cls),
+        _source_digest(model_cls.__module__),
+        repr(getattr(model_cls, "model_config", None)),
+    ]
+    for name, field_info in getattr(model_cls, "model_fields", {}).items():
+        description.append((name, repr(field_info.annotation), repr(field_info)))
+        for referenced in _referenced_classes(field_info.annotation):
+            described = _describe_class(referenced, seen)
+            if described is not None:
+                description.append(described)
+        extra = field_info.json_schema_extra
+        if callable(extra) and getattr(extra, "__module__", None):
+            description.append(("json_schema_extra", _source_digest(extra.__module__)))
+    # Fields assigned after class creation only exist in the class namespace.
+    for name, value in vars(model_cls).items():
+        if isinstance(value, FieldInfo):
+            description.append(("dynamic", name, repr(value)))
+    return description
+
+
+def model_fingerprint(model_cls: Type[Any]) -> str:
+    """Digest of the field definitions of ``model_cls`` and of the models it nests.
+
+    Enum members, Literal values and the source of the modules defining the model and
+    its enum or custom field types are included, so a deploy that changes any of them
+    misses the cache.
+    Field reprs that embed memory addresses (e.g. lambdas as default factories) make
+    the fingerprint differ between processes; such models simply miss the cache.
+    """
+
+    description = [
+        CACHE_FORMAT_VERSION,
+        _library_version(),
+        _pydantic_version(),
+        _describe_model(model_cls, set()),
+    ]
+    return hashlib.sha256(repr(description).encode("utf-8")).hexdigest()
+
+
+class PersistentSchemaCache:
+    """Directory of ``<model>.<fingerprint>.json`` schema files."""
+
+    def __init__(self, directory: Union[str, os.PathLike]) -> None:
+        self.directory = Path(directory)
+        self.loads = 0
+        self.stores = 0
+        self.misses = 0
+        self.errors = 0
+        self._lock = RLock()
+
+    def path_for(self, model_cls: Type[Any], fingerprint: Optional[str] = None) -> Path:
+        fingerprint = fingerprint or model_fingerprint(model_cls)
+        name = _FILENAME_UNSAFE_RE.sub("_", model_qualname(model_cls))
+        return self.directory / f"{name}.{fingerprint[:24]}.json"
+
+    def load(self, model_cls: Type[Any]) -> Optional[Dict[str, Any]]:
+        """Return the stored schema for ``model_cls``, or ``None`` to regenerate it."""
+
+        try:
+            fingerprint = model_fingerprint(model_cls)
+            path = self.path_for(model_cls, fingerprint)
+            if not path.is_file():
+                with self._lock:
+                    self.misses += 1
+                return None
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                payload.get("format") != CACHE_FORMAT_VERSION
+                or payload.get("model") != model_qualname(model_cls)
+                or payload.get("fingerprint") != fingerprint
+                or not isinstance(payload.get("schema"), dict)
+            ):
+                with self._lock:
+                    self.misses += 1
+                return None
+        except Exception as exc:  # corrupt file, permissions, ... -> regenerate
+            logger.debug("Ignoring persistent schema cache entry for %s: %s", model_cls, exc)
+            with self._lock:
+                self.errors += 1
+            return None
+
+        with self._lock:
+            self.loads += 1
+        return payload["schema"]
+
+    def store(self, model_cls: Type[Any], schema: Dict[str, Any]) -> bool:
+        """Write ``schema`` for ``model_cls``; returns ``False`` if it was not persisted."""
+
+        try:
+            encoded = json.dumps(schema, separators=(",", ":"), ensure_ascii=False)
+            # Only persist schemas that load back identically (no tuples, non-str keys, ...).
+            if json.loads(encoded) != schema:
+                return False
+            fingerprint = model_fingerprint(model_cls)
+            payload = json.dumps(
+                {
+                    "format": CACHE_FORMAT_VERSION,
+                    "model": model_qualname(model_cls),
+                    "fingerprint": fingerprint,
+                    "library_version": _library_version(),
+                    "schema": json.loads(encoded),
+                },
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+            path = self.path_for(model_cls, fingerprint)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent workers never read a partial file.
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=".schema-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    handle.write(payload)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except Exception as exc:
+            logger.debug("Could not persist schema for %s: %s", model_cls, exc)
+            with self._lock:
+                self.errors += 1
+            return False
+
+        with self._lock:
+            self.stores += 1
+        return True
+
+    def clear(self) -> int:
+        """Delete every cached schema file; returns the number removed."""
+
+        removed = 0
+        if not self.directory.is_dir():
+            return removed
+        for path in self.directory.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:  # pragma: no cover - concurrent cleanup
+                continue
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"loads": self.loads, "stores": self.stores, "misses": self.misses, "errors": self.errors}
+
+
+_persistent_cache: Optional[PersistentSchemaCache] = None
+
+
+def enable_persistent_schema_cache(directory: Union[str, os.PathLike]) -> PersistentSchemaCache:
+    """Load and store model schemas under ``directory`` from now on."""
+
+    global _persistent_cache
+    _persistent_cache = PersistentSchemaCache(directory)
+    return _persistent_cache
+
+
+def disable_persistent_schema_cache() -> None:
+    global _persistent_cache
+    _persistent_cache = None
+
+
+def get_persistent_schema_cache() -> Optional[PersistentSchemaCache]:
+    return _persistent_cache
+
+
+__all__ = [
+    "PersistentSchemaCache",
+    "disable_persistent_schema_cache",
+    "enable_persistent_schema_cache",
+    "get_persistent_schema_cache",
+    "model_fingerprint",
+]
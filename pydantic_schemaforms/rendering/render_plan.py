@@ -0,0 +1,170 @@
+"""Compiled render plans for schema-driven forms.
+
+A render plan captures everything about a form that depends only on the model class,
+the renderer/theme combination and the requested layout: the resolved UI element and
+input component for every field, the theme-derived classes, static attribute dicts,
+option lists and - for inputs whose markup is deterministic - the pristine HTML of
+the field when no value or error is present. Per-request rendering then only splices
+in submitted values, errors and CSRF markup.
+
+Plans are cached alongside the schema metadata cache: a plan is only reused while the
+``SchemaMetadata`` it was compiled from is still the one returned by
+``build_schema_metadata``, so anything that invalidates a model's metadata (a field
+registered on it, ``invalidate_schema_metadata``, ``reset_schema_metadata_cache``) also
+invalidates its plans.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple, Type
+
+from ..instrumentation import CACHE_RENDER_PLAN, record_cache_event
+
+if TYPE_CHECKING:  # pragma: no cover - import-time only for type hints
+    from .schema_parser import SchemaMetadata
+
+_RENDER_PLAN_CACHE_MAX = 256
+_render_plan_cache: "OrderedDict[Hashable, RenderPlan]" = OrderedDict()
+_render_plan_cache_lock = RLock()
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """Precomputed, request-independent rendering data for a single field."""
+
+    name: str
+    schema: Dict[str, Any]
+    ui_info: Dict[str, Any]
+    ui_element: str
+    kind: str
+    required: bool = False
+    component_cls: Optional[Type[Any]] = None
+    head_attrs: Optional[Dict[str, Any]] = None
+    tail_attrs: Optional[Dict[str, Any]] = None
+    label: str = ""
+    help_text: Optional[str] = None
+    icon: Optional[str] = None
+    selection_options: Optional[List[Any]] = None
+    wrapper_class: str = ""
+    pristine_html: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """Compiled form plan reused across renders of the same model/renderer/layout."""
+
+    model_cls: Type[Any]
+    framework: str
+    layout: str
+    metadata: "SchemaMetadata"
+    fields: Tuple[FieldPlan, ...]
+    layout_defaults: Tuple[Tuple[str, Any], ...]
+    has_model_list_fields: bool
+
+
+def _plan_cache_key(renderer: Any, model_cls: Type[Any], layout: str) -> Hashable:
+    # Plans bake in theme classes, so themes are keyed by configuration, not just type.
+    theme = getattr(renderer, "theme", None)
+    fingerprint = getattr(theme, "plan_fingerprint", None)
+    theme_key = fingerprint() if fingerprint is not None else type(theme)
+    return (
+        model_cls,
+        type(renderer),
+        renderer.framework,
+        theme_key,
+        layout,
+        renderer._compiles_field_plans(),  # noqa: SLF001
+    )
+
+
+def get_render_plan(
+    renderer: Any,
+    model_cls: Type[Any],
+    metadata: "SchemaMetadata",
+    layout: str = "vertical",
+) -> RenderPlan:
+    """Return the cached render plan for ``model_cls``, compiling it on first use."""
+
+    key = _plan_cache_key(renderer, model_cls, layout)
+    with _render_plan_cache_lock:
+        plan = _render_plan_cache.get(key)
+        if plan is not None and plan.metadata is metadata:
+            _render_plan_cache.move_to_end(key)
+            record_cache_event(CACHE_RENDER_PLAN, True)
+            return plan
+
+    record_cache_event(CACHE_RENDER_PLAN, False)
+    plan = compile_render_plan(renderer, model_cls, metadata, layout)
+
+    with _render_plan_cache_lock:
+        _render_plan_cache[key] = plan
+        _render_plan_cache.move_to_end(key)
+        if len(_render_plan_cache) > _RENDER_PLAN_CACHE_MAX:
+            _render_plan_cache.popitem(last=False)
+    return plan
+
+
+def compile_render_plan(
+    renderer: Any,
+    model_cls: Type[Any],
+    metadata: "SchemaMetadata",
+    layout: str = "vertical",
+) -> RenderPlan:
+    """Build a fresh (uncached) render plan for ``model_cls``."""
+
+    from .schema_parser import resolve_ui_element
+
+    fields: Tuple[FieldPlan, ...] = ()
+    # Renderers that override per-field rendering (e.g. the Material renderer) only
+    # benefit from the form-level parts of the plan.
+    if renderer._compiles_field_plans():  # noqa: SLF001
+        field_renderer = renderer._field_renderer  # noqa: SLF001
+        fields = tuple(
+            field_renderer.compile_field(
+                field_name,
+                field_schema,
+                metadata.required_fields,
+                precompute_markup=True,
+            )
+            for field_name, field_schema in metadata.fields
+        )
+
+    model_fields = getattr(model_cls, "model_fields", {}) or {}
+    layout_defaults = tuple(
+        (field_name, model_fields[field_name])
+        for field_name, _field_schema in metadata.layout_fields
+        if model_fields.get(field_name)
+    )
+
+    has_model_list_fields = any(
+        resolve_ui_element(field_schema) == "model_list" for _name, field_schema in metadata.fields
+    )
+
+    return RenderPlan(
+        model_cls=model_cls,
+        framework=renderer.framework,
+        layout=layout,
+        metadata=metadata,
+        fields=fields,
+        layout_defaults=layout_defaults,
+        has_model_list_fields=has_model_list_fields,
+    )
+
+
+def reset_render_plan_cache() -> None:
+    """Drop every cached render plan (used in tests or hot reload)."""
+
+    with _render_plan_cache_lock:
+        _render_plan_cache.clear()
+
+
+__all__ = [
+    "FieldPlan",
+    "RenderPlan",
+    "compile_render_plan",
+    "get_render_plan",
+    "reset_render_plan_cache",
+]
@@ -0,0 +1,147 @@
+"""Process-wide pool of reusable renderer/theme instances.
+
+Renderers and themes are stateless once constructed, but constructing them is not free:
+``MaterialEmbeddedTheme`` assembles several hundred lines of CSS/JS, and every
+``EnhancedFormRenderer`` builds its own theme, ``LayoutEngine`` and ``FieldRenderer``.
+Convenience helpers such as ``render_form_html`` therefore borrow shared instances from
+this pool instead of building new ones per request.
+
+Pooled instances are keyed by ``(framework, include_framework_assets, asset_mode,
+theme class)``. Call :func:`invalidate_renderer_pool` after re-registering themes or
+form styles so the next render picks up the new definitions; ``register_form_style``
+does this automatically.
+
+This module intentionally avoids importing renderers at module import time because
+``rendering.form_style`` notifies it while it is still being imported.
+"""
+
+from __future__ import annotations
+
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+
+from ..instrumentation import CACHE_RENDERER_POOL, record_cache_event
+
+if TYPE_CHECKING:  # pragma: no cover - import-time only for type hints
+    from ..enhanced_renderer import EnhancedFormRenderer
+    from .themes import RendererTheme
+
+PoolKey = Tuple[str, bool, str, Type[Any]]
+
+_renderer_pool: Dict[PoolKey, "EnhancedFormRenderer"] = {}
+_renderer_pool_lock = RLock()
+
+
+def _normalized_asset_mode(asset_mode: Optional[str]) -> str:
+    return (asset_mode or "vendored").strip().lower()
+
+
+def _default_theme_class(framework: str) -> Type["RendererTheme"]:
+    from .themes import MaterialEmbeddedTheme, get_theme_class_for_framework
+
+    if framework == "material":
+        # render_form_html renders Material through the self-contained renderer.
+        return MaterialEmbeddedTheme
+    return get_theme_class_for_framework(framework)
+
+
+def _build_renderer(
+    framework: str,
+    include_framework_assets: bool,
+    asset_mode: str,
+    theme_cls: Type["RendererTheme"],
+) -> "EnhancedFormRenderer":
+    from ..enhanced_renderer import EnhancedFormRenderer
+    from .themes import FrameworkTheme, MaterialEmbeddedTheme
+
+    if theme_cls is MaterialEmbeddedTheme:
+        from ..simple_material_renderer import SimpleMaterialRenderer
+
+        return SimpleMaterialRenderer()
+
+    if theme_cls is FrameworkTheme:
+        theme = FrameworkTheme(
+            framework,
+            include_assets=include_framework_assets,
+            asset_mode=asset_mode,
+        )
+    elif issubclass(theme_cls, FrameworkTheme):
+        theme = theme_cls(include_assets=include_framework_assets, asset_mode=asset_mode)
+    else:
+        theme = theme_cls()
+
+    return EnhancedFormRenderer(
+        framework=framework,
+        theme=theme,
+        include_framework_assets=include_framework_assets,
+        asset_mode=asset_mode,
+    )
+
+
+def get_pooled_renderer(
+    framework: str = "bootstrap",
+    *,
+    include_framework_assets: bool = False,
+    asset_mode: str = "vendored",
+    theme_cls: Optional[Type["RendererTheme"]] = None,
+) -> "EnhancedFormRenderer":
+    """Return a shared renderer for the given configuration, creating it on first use.
+
+    Pooled renderers must be treated as read-only: do not monkeypatch or reconfigure them.
+    """
+
+    mode = _normalized_asset_mode(asset_mode)
+    resolved_theme_cls = theme_cls or _default_theme_class(framework)
+    key: PoolKey = (framework, bool(include_framework_assets), mode, resolved_theme_cls)
+
+    renderer = _renderer_pool.get(key)
+    if renderer is not None:
+        record_cache_event(CACHE_RENDERER_POOL, True)
+        return renderer
+
+    record_cache_event(CACHE_RENDERER_POOL, False)
+    with _renderer_pool_lock:
+        renderer = _renderer_pool.get(key)
+        if renderer is None:
+            renderer = _build_renderer(
+                framework,
+                bool(include_framework_assets),
+                mode,
+                resolved_theme_cls,
+            )
+            _renderer_pool[key] = renderer
+        return renderer
+
+
+def invalidate_renderer_pool(framework: Optional[str] = None) -> int:
+    """Drop pooled renderers (optionally only for one framework).
+
+    Also clears compiled render plans, which embed theme-derived markup.
+
+    Returns:
+        Number of pooled renderers that were discarded.
+    """
+
+    with _renderer_pool_lock:
+        if framework is None:
+            removed = len(_renderer_pool)
+            _renderer_pool.clear()
+        else:
+            stale = [key for key in _renderer_pool if key[0] == framework]
+            for key in stale:
+                del _renderer_pool[key]
+            removed = len(stale)
+
+    from .render_plan import reset_render_plan_cache
+
+    reset_render_plan_cache()
+    return removed
+
+
+def renderer_pool_size() -> int:
+    """Return the number of pooled renderer instances."""
+
+    return len(_renderer_pool)
+
+
+__all__ = ["get_pooled_renderer", "invalidate_renderer_pool", "renderer_pool_size"]
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple, Type
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import RLock
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
 
 from pydantic.fields import FieldInfo
 
+from ..instrumentation import CACHE_SCHEMA_METADATA, record_cache_event
 from ..schema_form import FormModel
 
 
@@ -21,6 +23,12 @@ class SchemaMetadata:
     layout_fields: List[Tuple[str, Dict[str, Any]]]
     non_layout_fields: List[Tuple[str, Dict[str, Any]]]
     schema_defs: Dict[str, Any]
+    # Fields that submit several values under one key (multiselect, checkbox groups, tags).
+    array_fields: FrozenSet[str] = field(default_factory=frozenset)
+
+
+# UI elements whose submissions repeat the field name once per selected value.
+MULTI_VALUE_UI_ELEMENTS = frozenset({"multiselect", "checkbox_group", "tags"})
 
 
 def resolve_ui_element(field_schema: Dict[str, Any]) -> Optional[str]:
@@ -35,29 +43,167 @@ def resolve_ui_element(field_schema: Dict[str, Any]) -> Optional[str]:
     )
 
 
+@dataclass(frozen=True)
+class SchemaMetadataCacheInfo:
+    """Counters for the schema metadata cache (see :func:`schema_metadata_cache_info`)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    currsize: int
+    maxsize: int
+
+
+class _SchemaMetadataCache:
+    """LRU of ``SchemaMetadata`` per model class, stamped with the class's schema version.
+
+    An entry is only served while the class's ``schema_version()`` matches the stamp, so
+    registering a field on one model rebuilds that model alone.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Type[Any], Tuple[int, SchemaMetadata]]" = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, model_cls: Type[Any], version: int) -> Tuple[SchemaMetadata, bool]:
+        with self._lock:
+            entry = self._entries.get(model_cls)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(model_cls)
+                self.hits += 1
+                return entry[1], True
+            self.misses += 1
+            if entry is not None:
+                self.invalidations += 1
+
+        metadata = _compute_schema_metadata(model_cls)
+
+        with self._lock:
+            self._entries[model_cls] = (version, metadata)
+            self._entries.move_to_end(model_cls)
+            self._evict()
+        return metadata, False
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, model_cls: Type[Any]) -> bool:
+        with self._lock:
+            if self._entries.pop(model_cls, None) is None:
+                return False
+            self.invalidations += 1
+            return True
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def info(self) -> SchemaMetadataCacheInfo:
+        with self._lock:
+            return SchemaMetadataCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                invalidations=self.invalidations,
+                currsize=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+
+_schema_metadata_cache = _SchemaMetadataCache()
+
+
 def build_schema_metadata(model_cls: Type[FormModel]) -> SchemaMetadata:
     """Collect (cached) schema data along with sorted fields and layout groupings."""
 
-    if hasattr(model_cls, "ensure_dynamic_fields") and model_cls.ensure_dynamic_fields():
-        reset_schema_metadata_cache()
+    ensure_dynamic_fields = getattr(model_cls, "ensure_dynamic_fields", None)
+    if ensure_dynamic_fields is not None:
+        ensure_dynamic_fields()
+    schema_version = getattr(model_cls, "schema_version", None)
+    version = schema_version() if schema_version is not None else 0
+
+    metadata, hit = _schema_metadata_cache.get(model_cls, version)
+    record_cache_event(CACHE_SCHEMA_METADATA, hit)
+    return metadata
+
+
+def invalidate_schema_metadata(model_cls: Type[Any]) -> bool:
+    """Drop the cached metadata (and with it the render plans) of one model class.
+
+    Returns ``True`` if an entry was cached. Field changes made through
+    ``register_field`` or attribute assignment are picked up without calling this.
+    """
+
+    return _schema_metadata_cache.invalidate(model_cls)
+
+
+def configure_schema_metadata_cache(maxsize: int) -> None:
+    """Set how many model classes keep cached metadata (least recently used go first)."""
+
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    _schema_metadata_cache.resize(maxsize)
+
 
-    return _compute_schema_metadata(model_cls)
+def schema_metadata_cache_info() -> SchemaMetadataCacheInfo:
+    """Return hit/miss/eviction/invalidation counters and the current size."""
+
+    return _schema_metadata_cache.info()
 
 
 def reset_schema_metadata_cache() -> None:
-    """Clear the cached schema metadata (used in tests or hot reload)."""
+    """Clear the cached schema metadata and its counters (used in tests or hot reload)."""
+
+    from .render_plan import reset_render_plan_cache
 
-    _compute_schema_metadata.cache_clear()
+    _schema_metadata_cache.clear()
+    reset_render_plan_cache()
 
 
-@lru_cache(maxsize=128)
 def _compute_schema_metadata(model_cls: Type[FormModel]) -> SchemaMetadata:
+    from .persistent_cache import get_persistent_schema_cache
+
+    persistent_cache = get_persistent_schema_cache()
+    if persistent_cache is not None:
+        schema = persistent_cache.load(model_cls)
+        if schema is not None:
+            return schema_metadata_from_schema(schema)
+
+    schema = _generate_schema(model_cls)
+    if persistent_cache is not None:
+        persistent_cache.store(model_cls, schema)
+    return schema_metadata_from_schema(schema)
+
+
+def _generate_schema(model_cls: Type[FormModel]) -> Dict[str, Any]:
     schema = model_cls.model_json_schema()
     properties = schema.setdefault("properties", {})
     required_fields = schema.get("required", []) or []
 
     _inject_dynamic_fields(model_cls, properties, required_fields)
     schema["required"] = required_fields
+    return schema
+
+
+def schema_metadata_from_schema(schema: Dict[str, Any]) -> SchemaMetadata:
+    """Build ``SchemaMetadata`` from a model schema that already includes dynamic fields."""
+
+    properties = schema.setdefault("properties", {})
+    required_fields = schema.setdefault("required", [])
 
     fields: List[Tuple[str, Dict[str, Any]]] = list(properties.items())
 
@@ -86,9 +232,24 @@ def _compute_schema_metadata(model_cls: Type[FormModel]) -> SchemaMetadata:
         layout_fields=layout_fields,
         non_layout_fields=non_layout_fields,
         schema_defs=schema_defs,
+        array_fields=frozenset(
+            field_name for field_name, field_schema in non_layout_fields if _is_multi_value_field(field_schema)
+        ),
     )
 
 
+def _is_multi_value_field(field_schema: Dict[str, Any]) -> bool:
+    """Whether a field posts its value as repeated keys (``tags=a&tags=b``)."""
+
+    ui_element = resolve_ui_element(field_schema)
+    if ui_element in MULTI_VALUE_UI_ELEMENTS:
+        return True
+    if ui_element == "model_list":
+        return False
+    variants = [field_schema, *field_schema.get("anyOf", ())]
+    return any(variant.get("type") == "array" and "$ref" not in variant.get("items", {}) for variant in variants)
+
+
 def _inject_dynamic_fields(
     model_cls: Type[FormModel],
     properties: Dict[str, Dict[str, Any]],
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from html import escape
-from typing import Dict, Optional, Type
+from typing import Any, Dict, Hashable, Optional, Type
 
 from ..templates import TemplateString
 from ..assets.runtime import framework_css_tag, framework_js_tag
@@ -19,10 +19,24 @@ __all__ = [
     "MaterialTheme",
     "PlainTheme",
     "MaterialEmbeddedTheme",
+    "get_theme_class_for_framework",
     "get_theme_for_framework",
 ]
 
 
+def _freeze(value: Any) -> Hashable:
+    """Hashable copy of ``value``; raises ``TypeError`` for values that cannot be hashed."""
+
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
 class RendererTheme:
     """Lightweight hook points for wrapping rendered forms per framework."""
 
@@ -34,6 +48,18 @@ class RendererTheme:
         self.form_style: FormStyle = get_form_style("default", "default")
         self._load_form_style(self.name, self.style_variant)
 
+    def plan_fingerprint(self) -> Hashable:
+        """Key for compiled render plans: themes with equal class and attributes share plans.
+
+        Themes whose markup depends on state outside their instance attributes should
+        override this. Attributes that cannot be hashed tie plans to this instance.
+        """
+
+        try:
+            return (type(self), _freeze(vars(self)))
+        except TypeError:
+            return (type(self), self)
+
     def _load_form_style(self, framework: str, variant: str | None = None) -> None:
         try:
             self.form_style = get_form_style(framework, variant)
@@ -1532,6 +1558,12 @@ _THEME_MAP: Dict[str, Type[RendererTheme]] = {
 }
 
 
+def get_theme_class_for_framework(framework: str) -> Type[RendererTheme]:
+    """Return the RendererTheme class used for the requested framework."""
+
+    return _THEME_MAP.get(framework.lower(), FrameworkTheme)
+
+
 def get_theme_for_framework(
     framework: str,
     *,
@@ -1540,7 +1572,7 @@ def get_theme_for_framework(
 ) -> RendererTheme:
     """Return a RendererTheme instance that matches the requested framework."""
 
-    theme_cls = _THEME_MAP.get(framework.lower())
-    if theme_cls is None:
+    theme_cls = get_theme_class_for_framework(framework)
+    if theme_cls is FrameworkTheme:
         return FrameworkTheme(framework, include_assets=include_assets, asset_mode=asset_mode)
     return theme_cls(include_assets=include_assets, asset_mode=asset_mode)
@@ -145,7 +145,29 @@ def Field(
     )
 
 
-class FormModel(BaseModel):
+class _FormModelMetaclass(type(BaseModel)):
+    """Bump a class's schema version whenever a field is assigned or deleted on it.
+
+    Cached schema metadata is stamped with that version, so only the changed class is
+    rebuilt and nothing needs to rescan ``cls.__dict__`` on every render.
+    """
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if isinstance(value, FieldInfo):
+            cls._bump_schema_version()
+
+    def __delattr__(cls, name: str) -> None:
+        was_field = isinstance(cls.__dict__.get(name), FieldInfo)
+        super().__delattr__(name)
+        if was_field:
+            cls._bump_schema_version()
+
+    def _bump_schema_version(cls) -> None:
+        type.__setattr__(cls, "__schema_version__", cls.__dict__.get("__schema_version__", 0) + 1)
+
+
+class FormModel(BaseModel, metaclass=_FormModelMetaclass):
     """
     Enhanced base class for form models with UI element support.
     Supports UI element specifications through field annotations and generates
@@ -162,6 +184,12 @@ class FormModel(BaseModel):
         cls.__runtime_model_cache__ = None
         cls._dynamic_field_names = set()
 
+    @classmethod
+    def schema_version(cls) -> int:
+        """Counter bumped each time a field is assigned to (or removed from) this class."""
+
+        return cls.__dict__.get("__schema_version__", 0)
+
     @classmethod
     def get_json_schema(cls) -> Dict[str, Any]:
         """Get JSON schema with UI element information extracted from field annotations."""
@@ -320,21 +348,21 @@ class FormModel(BaseModel):
         runtime_fields[field_name] = (annotation or Any, field_info)
         cls.__runtime_fields__ = runtime_fields
         cls.__runtime_model_cache__ = None
+        # The setattr above bumped the schema version, which retires only this class's
+        # cached schema metadata and render plans.
         cls.ensure_dynamic_fields()
 
-        try:  # Reset schema cache so renderers pick up new field definitions
-            from .rendering.schema_parser import reset_schema_metadata_cache
-
-            reset_schema_metadata_cache()
-        except Exception:  # pragma: no cover - best effort in loose import situations
-            pass
-
         return field_info
 
     @classmethod
     def ensure_dynamic_fields(cls) -> bool:
         """Detect FieldInfo attributes assigned after class creation."""
 
+        version = cls.schema_version()
+        if cls.__dict__.get("_dynamic_fields_version") == version:
+            return False
+        cls._dynamic_fields_version = version
+
         processed: set[str] = set(getattr(cls, "_dynamic_field_names", set()))
         new_fields: List[str] = []
         runtime_fields = dict(getattr(cls, "__runtime_fields__", {}))
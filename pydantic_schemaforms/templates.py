@@ -633,14 +633,14 @@ def validate_template_variables(template: TemplateString, **kwargs: Any) -> Dict
 
 # Performance utilities
 def precompile_templates():
-    """Precompile all form templates for optimal performance."""
+    """Precompile all form templates for optimal performance.
+
+    Templates compile on first render, so this is only needed to pay that cost up front
+    (see :func:`pydantic_schemaforms.warmup`).
+    """
     for attr_name in dir(FormTemplates):
         if not attr_name.startswith("_"):
             template = getattr(FormTemplates, attr_name)
             if isinstance(template, TemplateString):
                 # Trigger compilation by accessing _compile_template
                 template._compile_template(template.template_str)
-
-
-# Initialize template compilation on import for better performance
-precompile_templates()
@@ -7,19 +7,138 @@ Requires: Python 3.14+ (no backward compatibility)
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import inspect
 import json
 import re
+import textwrap
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from html import escape
 from string import Template
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
-
-from pydantic import ValidationError
+from functools import cached_property, lru_cache
+from threading import RLock
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel, ValidationError
 
 # Import version check to ensure compatibility
 
 
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _is_async_callable(func: Any) -> bool:
+    return inspect.iscoroutinefunction(func) or (
+        callable(func) and inspect.iscoroutinefunction(type(func).__call__)
+    )
+
+
+def resolve_sync(result: Any) -> Any:
+    """Return ``result``, running it to completion first if it is awaitable.
+
+    Lets the synchronous ``validate`` paths accept a single ``async def`` validator outside
+    an event loop. Validators with several async rules do not come through here one rule at
+    a time: their ``validate`` runs ``avalidate`` in one event loop. Inside a running loop
+    the awaitable cannot be waited for; use ``avalidate``.
+    """
+
+    if not inspect.isawaitable(result):
+        return result
+    if not _in_event_loop():
+        async def _await() -> Any:
+            return await result
+
+        return asyncio.run(_await())
+    if inspect.iscoroutine(result):
+        result.close()
+    raise RuntimeError("async validator called synchronously inside an event loop; use avalidate()")
+
+
+async def _await_with_timeout(result: Any, timeout: Optional[float]) -> Any:
+    if not inspect.isawaitable(result):
+        return result
+    if timeout is None:
+        return await result
+    return await asyncio.wait_for(result, timeout)
+
+
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+# Accepts various phone formats
+PHONE_PATTERN = r"^[\+]?[1-9]?[\d\s\-\(\)\.]{10,15}$"
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    """Compiled regex shared by every rule using the same pattern."""
+    return re.compile(pattern, flags)
+
+
+def _parse_iso_date(value: str) -> date:
+    """Parse ``YYYY-MM-DD`` like ``strptime(value, "%Y-%m-%d")``, without its overhead."""
+    if len(value) == 10 and value[4] == "-" and value[7] == "-" and value.isascii():
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+_NOT_A_NUMBER = object()
+
+
+class _Column:
+    """Values of one field across many rows, with derived columns computed once."""
+
+    def __init__(self, values: List[Any]):
+        self.values = values
+
+    @cached_property
+    def strings(self) -> List[str]:
+        return [str(value) for value in self.values]
+
+    @cached_property
+    def lengths(self) -> List[int]:
+        return [len(string) for string in self.strings]
+
+    @cached_property
+    def numbers(self) -> List[Any]:
+        """``float`` per value; ``None`` for blanks, ``_NOT_A_NUMBER`` if unparsable."""
+        numbers: List[Any] = []
+        for value in self.values:
+            if value is None or value == "":
+                numbers.append(None)
+                continue
+            try:
+                numbers.append(float(value))
+            except (ValueError, TypeError):
+                numbers.append(_NOT_A_NUMBER)
+        return numbers
+
+
+# A compiled rule: ``check(value)`` returns the error message or ``None``.
+RuleCheck = Callable[[Any], Optional[str]]
+# A compiled rule over a column: returns ``(row_index, error_message)`` for failing rows.
+ColumnCheck = Callable[[_Column], List[Tuple[int, str]]]
+
+
 @dataclass
 class ValidationResponse:
     """Response from validation (server-side or live HTMX)."""
@@ -53,6 +172,9 @@ class ValidationRule:
     """Base class for validation rules."""
 
     rule_name = "base"
+    # Seconds an async rule may take before it fails (None: no limit)
+    timeout: Optional[float] = None
+    timeout_message = "Validation timed out"
 
     def __init__(self, message: str = "Invalid value", client_side: bool = True):
         self.message = message
@@ -67,6 +189,22 @@ class ValidationRule:
         """
         raise NotImplementedError
 
+    @property
+    def is_async(self) -> bool:
+        """Whether this rule awaits I/O and should run through ``avalidate``."""
+        return False
+
+    async def avalidate(
+        self, value: Any, field_name: str = "", *, timeout: Optional[float] = None
+    ) -> Tuple[bool, str]:
+        """
+        Validate a value without blocking the event loop.
+
+        Synchronous rules are cheap and run inline; async rules override this.
+        ``timeout`` applies when the rule does not define its own.
+        """
+        return self.validate(value, field_name)
+
     def get_client_validation(self, field_name: str) -> str:
         """Generate JavaScript validation code."""
         if not self.client_side:
@@ -91,6 +229,58 @@ class ValidationRule:
     def _descriptor_params(self) -> Dict[str, Any]:
         return {}
 
+    # Subclasses set these to methods building fast checks (see ``compile``).
+    _compile: Optional[Callable[[], RuleCheck]] = None
+    _compile_column: Optional[Callable[[], ColumnCheck]] = None
+
+    def _has_compiler(self, name: str) -> bool:
+        """Whether ``name`` is implemented by the class that also implements ``validate``.
+
+        A subclass overriding ``validate`` without its own compiler falls back to calling
+        ``validate``, so compiled checks never bypass custom logic.
+        """
+        mro = type(self).__mro__
+        compiler_owner = next((cls for cls in mro if cls.__dict__.get(name) is not None), None)
+        if compiler_owner is None:
+            return False
+        validate_owner = next(cls for cls in mro if "validate" in cls.__dict__)
+        return validate_owner is compiler_owner or not issubclass(validate_owner, compiler_owner)
+
+    def compile(self, field_name: str = "") -> RuleCheck:
+        """
+        Return a check equivalent to :meth:`validate`.
+
+        ``check(value)`` returns the error message, or ``None`` when the value is valid.
+        Rule parameters (bounds, patterns, messages) are read once, here.
+        """
+        if self._has_compiler("_compile"):
+            return self._compile()
+
+        validate = self.validate
+
+        def check(value: Any) -> Optional[str]:
+            is_valid, error_message = validate(value, field_name)
+            return None if is_valid else error_message
+
+        return check
+
+    def compile_column(self, field_name: str = "") -> ColumnCheck:
+        """Return a check over a whole column, reporting ``(row_index, message)`` failures."""
+        if self._has_compiler("_compile_column"):
+            return self._compile_column()
+
+        check = self.compile(field_name)
+
+        def column_check(column: _Column) -> List[Tuple[int, str]]:
+            failures = []
+            for index, value in enumerate(column.values):
+                error_message = check(value)
+                if error_message is not None:
+                    failures.append((index, error_message))
+            return failures
+
+        return column_check
+
 
 class RequiredRule(ValidationRule):
     """Validates that a field has a value."""
@@ -105,6 +295,28 @@ class RequiredRule(ValidationRule):
             return False, self.message
         return True, ""
 
+    def _compile(self) -> RuleCheck:
+        message = self.message
+
+        def check(value: Any) -> Optional[str]:
+            if value is None or (isinstance(value, str) and not value.strip()):
+                return message
+            return None
+
+        return check
+
+    def _compile_column(self) -> ColumnCheck:
+        message = self.message
+
+        def column_check(column: _Column) -> List[Tuple[int, str]]:
+            return [
+                (index, message)
+                for index, value in enumerate(column.values)
+                if value is None or (isinstance(value, str) and not value.strip())
+            ]
+
+        return column_check
+
     def _generate_js_validation(self, field_name: str) -> str:
         return f"""
         if (!value || (typeof value === 'string' && !value.trim())) {{
@@ -131,6 +343,28 @@ class MinLengthRule(ValidationRule):
             return False, self.message
         return True, ""
 
+    def _compile(self) -> RuleCheck:
+        min_length, message = self.min_length, self.message
+
+        def check(value: Any) -> Optional[str]:
+            if value is not None and len(str(value)) < min_length:
+                return message
+            return None
+
+        return check
+
+    def _compile_column(self) -> ColumnCheck:
+        min_length, message = self.min_length, self.message
+
+        def column_check(column: _Column) -> List[Tuple[int, str]]:
+            return [
+                (index, message)
+                for index, (value, length) in enumerate(zip(column.values, column.lengths, strict=True))
+                if length < min_length and value is not None
+            ]
+
+        return column_check
+
     def _generate_js_validation(self, field_name: str) -> str:
         return f"""
         if (value && value.length < {self.min_length}) {{
@@ -160,6 +394,28 @@ class MaxLengthRule(ValidationRule):
             return False, self.message
         return True, ""
 
+    def _compile(self) -> RuleCheck:
+        max_length, message = self.max_length, self.message
+
+        def check(value: Any) -> Optional[str]:
+            if value is not None and len(str(value)) > max_length:
+                return message
+            return None
+
+        return check
+
+    def _compile_column(self) -> ColumnCheck:
+        max_length, message = self.max_length, self.message
+
+        def column_check(column: _Column) -> List[Tuple[int, str]]:
+            return [
+                (index, message)
+                for index, (value, length) in enumerate(zip(column.values, column.lengths, strict=True))
+                if length > max_length and value is not None
+            ]
+
+        return column_check
+
     def _generate_js_validation(self, field_name: str) -> str:
         return f"""
         if (value && value.length > {self.max_length}) {{
@@ -178,7 +434,7 @@ class RegexRule(ValidationRule):
 
     def __init__(self, pattern: str, message: str = "Invalid format", flags: int = 0):
         self.pattern = pattern
-        self.regex = re.compile(pattern, flags)
+        self.regex = _compile_pattern(pattern, flags)
         super().__init__(message)
 
     def validate(self, value: Any, field_name: str = "") -> Tuple[bool, str]:
@@ -189,6 +445,28 @@ class RegexRule(ValidationRule):
             return False, self.message
         return True, ""
 
+    def _compile(self) -> RuleCheck:
+        match, message = self.regex.match, self.message
+
+        def check(value: Any) -> Optional[str]:
+            if value is None or value == "" or match(str(value)):
+                return None
+            return message
+
+        return check
+
+    def _compile_column(self) -> ColumnCheck:
+        match, message = self.regex.match, self.message
+
+        def column_check(column: _Column) -> List[Tuple[int, str]]:
+            return [
+                (index, message)
+                for index, (value, string) in enumerate(zip(column.values, column.strings, strict=True))
+                if value is not None and value != "" and not match(string)
+            ]
+
+        return column_check
+
     def _generate_js_validation(self, field_name: str) -> str:
         # Escape the regex pattern for JavaScript
         js_pattern = self.pattern.replace("\\", "\\\\").replace("'", "\\'")
@@ -208,8 +486,7 @@ class EmailRule(RegexRule):
     rule_name = "email"
 
     def __init__(self, message: str = "Please enter a valid email address"):
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        super().__init__(pattern, message)
+        super().__init__(EMAIL_PATTERN, message)
 
 
 class PhoneRule(RegexRule):
@@ -218,9 +495,7 @@ class PhoneRule(RegexRule):
     rule_name = "phone"
 
     def __init__(self, message: str = "Please enter a valid phone number"):
-        # Accepts various phone formats
-        pattern = r"^[\+]?[1-9]?[\d\s\-\(\)\.]{10,15}$"
-        super().__init__(pattern, message)
+        super().__init__(PHONE_PATTERN, message)
 
 
 class NumericRangeRule(ValidationRule):
@@ -266,6 +541,42 @@ class NumericRangeRule(ValidationRule):
         except (ValueError, TypeError):
             return False, "Must be a valid number"
 
+    def _compile(self) -> RuleCheck:
+        min_value, max_value, message = self.min_value, self.max_value, self.message
+
+        def check(value: Any) -> Optional[str]:
+            if value is None or value == "":
+                return None
+            try:
+                num_value = float(value)
+            except (ValueError, TypeError):
+                return "Must be a valid number"
+            if min_value is not None and num_value < min_value:
+                return message
+            if max_value is not None and num_value > max_value:
+                return message
+            return None
+
+        return check
+
+    def _compile_column(self) -> ColumnCheck:
+        min_value, max_value, message = self.min_value, self.max_value, self.message
+
+        def column_check(column: _Column) -> List[Tuple[int, str]]:
+            failures = []
+            for index, number in enumerate(column.numbers):
+                if number is None:
+                    continue
+                if number is _NOT_A_NUMBER:
+                    failures.append((index, "Must be a valid number"))
+                elif (min_value is not None and number < min_value) or (
+                    max_value is not None and number > max_value
+                ):
+                    failures.append((index, message))
+            return failures
+
+        return column_check
+
     def _generate_js_validation(self, field_name: str) -> str:
         checks = []
 
@@ -322,7 +633,7 @@ class DateRangeRule(ValidationRule):
         if isinstance(date_value, date):
             return date_value
         elif isinstance(date_value, str):
-            return datetime.strptime(date_value, "%Y-%m-%d").date()
+            return _parse_iso_date(date_value)
         else:
             raise ValueError(f"Invalid date format: {date_value}")
 
@@ -332,7 +643,7 @@ class DateRangeRule(ValidationRule):
 
         try:
             if isinstance(value, str):
-                check_date = datetime.strptime(value, "%Y-%m-%d").date()
+                check_date = _parse_iso_date(value)
             elif isinstance(value, date):
                 check_date = value
             else:
@@ -348,6 +659,29 @@ class DateRangeRule(ValidationRule):
         except ValueError:
             return False, "Invalid date format"
 
+    def _compile(self) -> RuleCheck:
+        min_date, max_date, message = self.min_date, self.max_date, self.message
+
+        def check(value: Any) -> Optional[str]:
+            if value is None or value == "":
+                return None
+            try:
+                if isinstance(value, str):
+                    check_date = _parse_iso_date(value)
+                elif isinstance(value, date):
+                    check_date = value
+                else:
+                    return "Invalid date format"
+                if min_date and check_date < min_date:
+                    return message
+                if max_date and check_date > max_date:
+                    return message
+                return None
+            except ValueError:
+                return "Invalid date format"
+
+        return check
+
     def _generate_js_validation(self, field_name: str) -> str:
         checks = []
 
@@ -385,23 +719,41 @@ class CustomRule(ValidationRule):
 
     def __init__(
         self,
-        validator_func: Callable[[Any], Union[bool, Tuple[bool, str]]],
+        validator_func: Callable[[Any], Union[bool, Tuple[bool, str], Awaitable[Any]]],
         message: str = "Invalid value",
         client_side: bool = False,
+        timeout: Optional[float] = None,
     ):
         self.validator_func = validator_func
+        self.timeout = timeout
         super().__init__(message, client_side)
 
+    @property
+    def is_async(self) -> bool:
+        return _is_async_callable(self.validator_func)
+
+    def _interpret(self, result: Any) -> Tuple[bool, str]:
+        if isinstance(result, bool):
+            return result, self.message if not result else ""
+        elif isinstance(result, tuple) and len(result) == 2:
+            return result
+        else:
+            return False, "Invalid validation result"
+
     def validate(self, value: Any, field_name: str = "") -> Tuple[bool, str]:
         try:
-            result = self.validator_func(value)
+            return self._interpret(resolve_sync(self.validator_func(value)))
+        except Exception as e:
+            return False, f"Validation error: {str(e)}"
 
-            if isinstance(result, bool):
-                return result, self.message if not result else ""
-            elif isinstance(result, tuple) and len(result) == 2:
-                return result
-            else:
-                return False, "Invalid validation result"
+    async def avalidate(
+        self, value: Any, field_name: str = "", *, timeout: Optional[float] = None
+    ) -> Tuple[bool, str]:
+        try:
+            result = self.validator_func(value)
+            return self._interpret(await _await_with_timeout(result, self.timeout or timeout))
+        except asyncio.TimeoutError:
+            return False, self.timeout_message
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
@@ -412,6 +764,7 @@ class FieldValidator:
     def __init__(self, field_name: str, rules: List[ValidationRule] = None):
         self.field_name = field_name
         self.rules = rules or []
+        self._compiled: Optional[CompiledFieldValidator] = None
 
     def add_rule(self, rule: ValidationRule) -> "FieldValidator":
         """Add a validation rule."""
@@ -468,6 +821,10 @@ class FieldValidator:
         Returns:
             Tuple of (is_valid, list_of_error_messages)
         """
+        if self.is_async and not _in_event_loop():
+            # Await every async rule in one event loop rather than one loop per rule.
+            return asyncio.run(self.avalidate(value))
+
         errors = []
 
         for rule in self.rules:
@@ -477,6 +834,57 @@ class FieldValidator:
 
         return len(errors) == 0, errors
 
+    async def avalidate(self, value: Any, *, timeout: Optional[float] = None) -> Tuple[bool, List[str]]:
+        """
+        Validate a value, awaiting async rules concurrently.
+
+        Args:
+            value: Value to validate
+            timeout: Per-rule timeout in seconds for rules without their own
+
+        Returns:
+            Tuple of (is_valid, list_of_error_messages), errors in rule order
+        """
+        if not any(rule.is_async for rule in self.rules):
+            return self.validate(value)
+
+        results = await asyncio.gather(
+            *(rule.avalidate(value, self.field_name, timeout=timeout) for rule in self.rules)
+        )
+        errors = [error_message for is_valid, error_message in results if not is_valid]
+        return len(errors) == 0, errors
+
+    @property
+    def is_async(self) -> bool:
+        """Whether any rule of this field is asynchronous."""
+        return any(rule.is_async for rule in self.rules)
+
+    def compile(self) -> "CompiledFieldValidator":
+        """
+        Fuse the rule chain into one callable.
+
+        Each rule is compiled once into a closure over its pre-parsed parameters (shared
+        precompiled regexes, parsed date bounds), so validating skips the per-rule method
+        dispatch and attribute lookups. The result is cached and rebuilt when rules are
+        added or removed; changing a rule's attributes in place requires
+        ``compile()`` on a fresh validator.
+        """
+        rules = tuple(self.rules)
+        compiled = self._compiled
+        if compiled is None or compiled.rules != rules:
+            compiled = self._compiled = CompiledFieldValidator(self.field_name, rules)
+        return compiled
+
+    def validate_column(self, values: Iterable[Any]) -> List[Tuple[bool, List[str]]]:
+        """
+        Validate the same field across many rows (bulk imports, mass edits).
+
+        Rules run column by column - one length, range or regex pass over all values -
+        instead of row by row. Returns ``(is_valid, errors)`` per value, in input order,
+        exactly as :meth:`validate` would.
+        """
+        return self.compile().validate_column(values)
+
     def generate_client_validation(self) -> str:
         """Generate JavaScript validation function for this field."""
         js_validations = []
@@ -519,6 +927,39 @@ function validate${field_name_camel}(value) {
         }
 
 
+class CompiledFieldValidator:
+    """A :class:`FieldValidator` rule chain fused into one callable (see ``compile``)."""
+
+    def __init__(self, field_name: str, rules: Tuple[ValidationRule, ...]):
+        self.field_name = field_name
+        self.rules = rules
+        self._checks: Tuple[RuleCheck, ...] = tuple(rule.compile(field_name) for rule in rules)
+        self._column_checks: Optional[Tuple[ColumnCheck, ...]] = None
+
+    def __call__(self, value: Any) -> Tuple[bool, List[str]]:
+        errors = []
+        for check in self._checks:
+            message = check(value)
+            if message is not None:
+                errors.append(message)
+        return not errors, errors
+
+    validate = __call__
+
+    def validate_column(self, values: Iterable[Any]) -> List[Tuple[bool, List[str]]]:
+        """Validate many values; returns ``(is_valid, errors)`` per value, in order."""
+        if self._column_checks is None:
+            self._column_checks = tuple(rule.compile_column(self.field_name) for rule in self.rules)
+
+        column = _Column(values if isinstance(values, list) else list(values))
+        errors: List[List[str]] = [[] for _ in column.values]
+        # Rules run in order, so each row's messages keep the rule order of ``validate``.
+        for column_check in self._column_checks:
+            for index, message in column_check(column):
+                errors[index].append(message)
+        return [(not row_errors, row_errors) for row_errors in errors]
+
+
 class ValidationSchema:
     """Aggregate FieldValidator instances into a reusable schema."""
 
@@ -546,12 +987,141 @@ class ValidationSchema:
         return live_validator
 
 
+def cross_field_rule(*fields: str) -> Callable[[Callable], Callable]:
+    """Declare the fields a cross-field rule reads, for incremental validation.
+
+    Example:
+        @cross_field_rule("country", "postcode")
+        def postcode_matches_country(data): ...
+    """
+
+    def decorate(rule: Callable) -> Callable:
+        rule.depends_on = frozenset(fields)
+        return rule
+
+    return decorate
+
+
+def _infer_rule_fields(rule: Callable) -> Optional[FrozenSet[str]]:
+    """Fields a cross-field rule reads, found in its source; ``None`` if unclear.
+
+    Only rules that access their data argument as ``data["name"]`` or
+    ``data.get("name", ...)`` - with literal names or names bound in the enclosing
+    function or module - can be inferred. Anything else (passing ``data`` on, iterating
+    it, computed keys) means the rule is treated as reading every field.
+    """
+
+    try:
+        source = textwrap.dedent(inspect.getsource(rule))
+        tree = ast.parse(source)
+    except (OSError, TypeError, SyntaxError, IndentationError):
+        return None
+
+    function = next(
+        (
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name == getattr(rule, "__name__", None)
+        ),
+        None,
+    )
+    params = function.args.posonlyargs + function.args.args if function is not None else []
+    if inspect.ismethod(rule):
+        params = params[1:]
+    if not params:
+        return None
+    data_name = params[0].arg
+
+    try:
+        closure = inspect.getclosurevars(rule)
+        bindings = {**closure.globals, **closure.nonlocals}
+    except (TypeError, ValueError):
+        bindings = {}
+
+    def resolve(node: ast.AST) -> Optional[str]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        if isinstance(node, ast.Name) and isinstance(bindings.get(node.id), str):
+            return bindings[node.id]
+        return None
+
+    parents = {
+        child: parent for parent in ast.walk(function) for child in ast.iter_child_nodes(parent)
+    }
+    fields = set()
+    for node in ast.walk(function):
+        if not (isinstance(node, ast.Name) and node.id == data_name):
+            continue
+        parent = parents.get(node)
+        if isinstance(parent, ast.Subscript) and parent.value is node:
+            name = resolve(parent.slice)
+        elif (
+            isinstance(parent, ast.Attribute)
+            and parent.attr == "get"
+            and isinstance(parents.get(parent), ast.Call)
+            and parents[parent].func is parent
+            and parents[parent].args
+        ):
+            name = resolve(parents[parent].args[0])
+        else:
+            name = None
+        if name is None:
+            return None
+        fields.add(name)
+    return frozenset(fields)
+
+
+class _RuleGraph:
+    """Which cross-field rules read which fields."""
+
+    def __init__(self, rules: List[Callable], dependencies: Dict[int, Optional[FrozenSet[str]]]):
+        self.rules = list(rules)
+        self.fields_of: List[Optional[FrozenSet[str]]] = []
+        self.by_field: Dict[str, List[int]] = {}
+        self.unbounded: List[int] = []
+        for index, rule in enumerate(self.rules):
+            if id(rule) in dependencies:
+                fields = dependencies[id(rule)]
+            else:
+                fields = _rule_dependencies(rule)
+            self.fields_of.append(fields)
+            if fields is None:
+                self.unbounded.append(index)
+                continue
+            for field_name in fields:
+                self.by_field.setdefault(field_name, []).append(index)
+
+    def affected_fields(self, changed: Iterable[str]) -> Dict[str, None]:
+        # Insertion-ordered set: the changed fields, then the fields their rules read.
+        scope = dict.fromkeys(changed)
+        for field_name in list(scope):
+            for index in self.by_field.get(field_name, ()):
+                scope.update(dict.fromkeys(sorted(self.fields_of[index])))  # type: ignore[arg-type]
+        return scope
+
+    def rules_for(self, scope: Iterable[str]) -> List[Callable]:
+        indexes = set(self.unbounded)
+        for field_name in scope:
+            indexes.update(self.by_field.get(field_name, ()))
+        return [self.rules[index] for index in sorted(indexes)]
+
+
+def _rule_dependencies(rule: Callable) -> Optional[FrozenSet[str]]:
+    declared = getattr(rule, "depends_on", None)
+    if declared is not None:
+        return frozenset(declared)
+    return _infer_rule_fields(rule)
+
+
 class FormValidator:
     """Validator for entire forms with multiple fields."""
 
     def __init__(self):
         self.field_validators: Dict[str, FieldValidator] = {}
         self.cross_field_rules: List[Callable[[Dict[str, Any]], Tuple[bool, Dict[str, str]]]] = []
+        self._rule_fields: Dict[int, Optional[FrozenSet[str]]] = {}
+        self._rule_graph: Optional[_RuleGraph] = None
 
     def field(self, field_name: str) -> FieldValidator:
         """Get or create a field validator."""
@@ -559,37 +1129,155 @@ class FormValidator:
             self.field_validators[field_name] = FieldValidator(field_name)
         return self.field_validators[field_name]
 
-    def add_cross_field_rule(self, rule: Callable[[Dict[str, Any]], Tuple[bool, Dict[str, str]]]):
-        """Add a cross-field validation rule."""
+    def add_cross_field_rule(
+        self,
+        rule: Callable[[Dict[str, Any]], Tuple[bool, Dict[str, str]]],
+        *,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        """Add a cross-field validation rule.
+
+        ``fields`` names the fields the rule reads. Without it they come from the rule's
+        ``depends_on`` attribute (see :func:`cross_field_rule`; the
+        :class:`CrossFieldRules` helpers set it) or are inferred from its source. Rules
+        whose fields are unknown re-run on every incremental validation.
+        """
         self.cross_field_rules.append(rule)
+        if fields is not None:
+            self._rule_fields[id(rule)] = frozenset(fields)
+        self._rule_graph = None
+
+    def _dependency_graph(self) -> _RuleGraph:
+        graph = self._rule_graph
+        # ``cross_field_rules`` is public; rules appended directly are picked up too.
+        if graph is None or len(graph.rules) != len(self.cross_field_rules):
+            graph = self._rule_graph = _RuleGraph(self.cross_field_rules, self._rule_fields)
+        return graph
+
+    def affected_fields(self, changed: Iterable[str]) -> List[str]:
+        """Fields whose errors can change when ``changed`` fields change.
+
+        These are the changed fields plus every field read by a cross-field rule that
+        reads one of them - the fields whose feedback an incremental validation refreshes.
+        """
+        return list(self._dependency_graph().affected_fields(changed))
+
+    def _plan(
+        self, changed: Optional[Iterable[str]]
+    ) -> Tuple[List[str], List[Callable], Optional[Dict[str, None]]]:
+        if changed is None:
+            return list(self.field_validators), self.cross_field_rules, None
+        graph = self._dependency_graph()
+        scope = graph.affected_fields(changed)
+        field_names = [name for name in scope if name in self.field_validators]
+        return field_names, graph.rules_for(scope), scope
+
+    @staticmethod
+    def _collect_rule_errors(
+        all_errors: Dict[str, List[str]],
+        errors: Dict[str, str],
+        scope: Optional[Dict[str, None]],
+    ) -> None:
+        for field_name, error_message in errors.items():
+            if scope is not None and field_name not in scope and field_name != "general":
+                continue
+            all_errors.setdefault(field_name, []).append(error_message)
 
-    def validate(self, data: Dict[str, Any]) -> Tuple[bool, Dict[str, List[str]]]:
+    def validate(
+        self, data: Dict[str, Any], *, changed: Optional[Iterable[str]] = None
+    ) -> Tuple[bool, Dict[str, List[str]]]:
         """
         Validate form data.
 
+        Args:
+            data: Submitted form data
+            changed: Validate incrementally: only the field validators of the fields in
+                :meth:`affected_fields` and the cross-field rules reading them run, and
+                only errors for those fields are returned.
+
         Returns:
             Tuple of (is_valid, dict_of_field_errors)
         """
+        field_names, rules, scope = self._plan(changed)
+        if not _in_event_loop() and (
+            any(self.field_validators[name].is_async for name in field_names)
+            or any(_is_async_callable(rule) for rule in rules)
+        ):
+            # Await every async rule of the form in one event loop.
+            return asyncio.run(self.avalidate(data, changed=changed))
+
         all_errors = {}
         is_form_valid = True
 
         # Validate individual fields
-        for field_name, validator in self.field_validators.items():
+        for field_name in field_names:
             value = data.get(field_name)
-            is_valid, errors = validator.validate(value)
+            is_valid, errors = self.field_validators[field_name].validate(value)
 
             if not is_valid:
                 all_errors[field_name] = errors
                 is_form_valid = False
 
         # Validate cross-field rules
-        for rule in self.cross_field_rules:
-            is_valid, errors = rule(data)
+        for rule in rules:
+            is_valid, errors = resolve_sync(rule(data))
             if not is_valid:
-                for field_name, error_message in errors.items():
-                    if field_name not in all_errors:
-                        all_errors[field_name] = []
-                    all_errors[field_name].append(error_message)
+                self._collect_rule_errors(all_errors, errors, scope)
+                is_form_valid = False
+
+        return is_form_valid, all_errors
+
+    async def avalidate(
+        self,
+        data: Dict[str, Any],
+        *,
+        max_concurrency: int = 10,
+        rule_timeout: Optional[float] = None,
+        changed: Optional[Iterable[str]] = None,
+    ) -> Tuple[bool, Dict[str, List[str]]]:
+        """
+        Validate form data without blocking the event loop.
+
+        Fields are validated concurrently (at most ``max_concurrency`` at a time for this
+        form), then cross-field rules run; ``async def`` cross-field rules are awaited.
+
+        Args:
+            data: Submitted form data
+            max_concurrency: Maximum number of fields validated at once
+            rule_timeout: Per-rule timeout in seconds for rules without their own
+            changed: Validate incrementally, as in :meth:`validate`
+
+        Returns:
+            Tuple of (is_valid, dict_of_field_errors)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _validate_field(field_name: str, validator: FieldValidator) -> Tuple[bool, List[str]]:
+            if not validator.is_async:
+                return validator.validate(data.get(field_name))
+            async with semaphore:
+                return await validator.avalidate(data.get(field_name), timeout=rule_timeout)
+
+        names, rules, scope = self._plan(changed)
+        results = await asyncio.gather(
+            *(_validate_field(name, self.field_validators[name]) for name in names)
+        )
+        all_errors = {
+            name: errors
+            for name, (is_valid, errors) in zip(names, results, strict=True)
+            if not is_valid
+        }
+        is_form_valid = not all_errors
+
+        for rule in rules:
+            try:
+                is_valid, errors = await _await_with_timeout(rule(data), rule_timeout)
+            except asyncio.TimeoutError:
+                is_valid, errors = False, {"general": ValidationRule.timeout_message}
+            if not is_valid:
+                self._collect_rule_errors(all_errors, errors, scope)
                 is_form_valid = False
 
         return is_form_valid, all_errors
@@ -618,120 +1306,15 @@ class FormValidator:
 
             return False, errors
 
-    def generate_client_validation_script(self) -> str:
-        """Generate complete JavaScript validation script."""
-        field_functions = []
-        field_validations = []
-
-        for field_name, validator in self.field_validators.items():
-            js_function = validator.generate_client_validation()
-            if js_function:
-                field_functions.append(js_function)
-
-                # Convert field name to camelCase
-                field_name_camel = "".join(word.capitalize() for word in field_name.split("_"))
-                field_validations.append(f"    '{field_name}': validate{field_name_camel}")
-
-        template = Template(
-            """
-<script>
-${field_functions}
+    def generate_client_validation_script(self, *, asset_mode: str = "vendored") -> str:
+        """Return the client validation runtime tag plus this validator's rule descriptor.
 
-const formValidators = {
-${field_validations}
-};
-
-function validateField(fieldName, value) {
-    const validator = formValidators[fieldName];
-    if (validator) {
-        return validator(value);
-    }
-    return null;
-}
-
-function validateForm(formElement) {
-    let isValid = true;
-    const errors = {};
-
-    // Clear previous errors
-    formElement.querySelectorAll('.error-message').forEach(el => el.remove());
-    formElement.querySelectorAll('.error').forEach(el => el.classList.remove('error'));
-
-    // Validate each field
-    for (const [fieldName, validator] of Object.entries(formValidators)) {
-        const input = formElement.querySelector(`[name="$${fieldName}"]`);
-        if (input) {
-            const error = validator(input.value);
-            if (error) {
-                errors[fieldName] = error;
-                isValid = false;
-
-                // Show error in UI
-                input.classList.add('error');
-                const errorElement = document.createElement('div');
-                errorElement.className = 'error-message';
-                errorElement.textContent = error;
-                input.parentNode.insertBefore(errorElement, input.nextSibling);
-            }
-        }
-    }
-
-    return { isValid, errors };
-}
-
-// Add live validation on input events
-document.addEventListener('DOMContentLoaded', function() {
-    document.querySelectorAll('form').forEach(form => {
-        form.addEventListener('input', function(e) {
-            const fieldName = e.target.name;
-            if (fieldName && formValidators[fieldName]) {
-                const error = validateField(fieldName, e.target.value);
-
-                // Clear previous error
-                const existingError = e.target.parentNode.querySelector('.error-message');
-                if (existingError) {
-                    existingError.remove();
-                }
-                e.target.classList.remove('error');
-
-                // Show new error if any
-                if (error) {
-                    e.target.classList.add('error');
-                    const errorElement = document.createElement('div');
-                    errorElement.className = 'error-message';
-                    errorElement.textContent = error;
-                    e.target.parentNode.insertBefore(errorElement, e.target.nextSibling);
-                }
-            }
-        });
-
-        form.addEventListener('submit', function(e) {
-            const validation = validateForm(form);
-            if (!validation.isValid) {
-                e.preventDefault();
-            }
-        });
-    });
-});
-</script>
-<style>
-.error {
-    border-color: #dc3545 !important;
-    box-shadow: 0 0 0 0.2rem rgba(220, 53, 69, 0.25) !important;
-}
-.error-message {
-    color: #dc3545;
-    font-size: 0.875rem;
-    margin-top: 0.25rem;
-}
-</style>
+        The runtime is the same static file for every form (see ``client_validation``); only
+        the compact JSON descriptor of the client-side rules differs per form.
         """
-        )
+        from .client_validation import client_validation_tags
 
-        return template.substitute(
-            field_functions="\n\n".join(field_functions),
-            field_validations=",\n".join(field_validations),
-        )
+        return client_validation_tags(validator=self, asset_mode=asset_mode)
 
 
 # Common cross-field validation rules
@@ -755,6 +1338,7 @@ class CrossFieldRules:
 
             return True, {}
 
+        validator.depends_on = frozenset({password_field, confirm_field})
         return validator
 
     @staticmethod
@@ -781,6 +1365,7 @@ class CrossFieldRules:
 
             return True, {}
 
+        validator.depends_on = frozenset({start_field, end_field})
         return validator
 
 
@@ -860,174 +1445,413 @@ def create_password_strength_validator(min_length: int = 8) -> Callable[[str], V
 
 # Validation result class for integration
 class ValidationResult:
-    """Result of form validation."""
+    """Result of form validation.
+
+    ``model`` holds the validated model instance when validation succeeded.
+    """
 
-    def __init__(self, is_valid: bool, data: Dict[str, Any] = None, errors: Dict[str, str] = None):
+    def __init__(
+        self,
+        is_valid: bool,
+        data: Dict[str, Any] = None,
+        errors: Dict[str, str] = None,
+        model: Any = None,
+    ):
         self.is_valid = is_valid
         self.data = data or {}
         self.errors = errors or {}
+        self.model = model
 
 
-def validate_form_data(form_model_class: type, data: Dict[str, Any]) -> ValidationResult:
-    """
-    Validate form data against a Pydantic model.
+@lru_cache(maxsize=2048)
+def _format_error_path(loc: Tuple[Any, ...]) -> str:
+    """Turn a pydantic error location like ``('pets', 0, 'weight')`` into ``pets[0].weight``."""
 
-    Args:
-        form_model_class: The Pydantic model class to validate against
-        data: Dictionary of form data to validate
+    field_path_parts = []
+    for loc_part in loc:
+        if isinstance(loc_part, int):
+            # This is an array index
+            field_path_parts.append(f"[{loc_part}]")
+        else:
+            if field_path_parts:
+                field_path_parts.append(f".{loc_part}")
+            else:
+                field_path_parts.append(str(loc_part))
+    return "".join(field_path_parts)
 
-    Returns:
-        ValidationResult with is_valid, data, and errors
-    """
-    runtime_model = (
-        form_model_class.get_runtime_model()
-        if hasattr(form_model_class, "get_runtime_model")
-        else form_model_class
-    )
 
-    try:
-        # Create instance to validate
-        validated_instance = runtime_model(**data)
+def _constraint_message(ctx_key: str, template: str) -> Callable[[Dict[str, Any]], str]:
+    def format_message(error: Dict[str, Any]) -> str:
+        limit = (error.get("ctx") or {}).get(ctx_key)
+        if limit is None:
+            return error["msg"]
+        return template.format(limit)
 
-        # Convert to dict for consistent return format
-        validated_data = validated_instance.model_dump()
+    return format_message
 
-        model_fields = getattr(runtime_model, "model_fields", {}) or {}
-        layout_field_names = []
-        for field_name, field_info in model_fields.items():
-            extra = getattr(field_info, "json_schema_extra", None) or {}
-            if not isinstance(extra, dict):
-                continue
-            ui_element = extra.get("ui_element") or extra.get("input_type")
-            if ui_element == "layout":
-                layout_field_names.append(field_name)
 
-        if layout_field_names:
-            from .rendering.layout_engine import get_nested_form_data
+def _default_message(error: Dict[str, Any]) -> str:
+    return error["msg"]
 
-            layout_errors: Dict[str, str] = {}
 
-            for layout_field_name in layout_field_names:
-                layout_value = getattr(validated_instance, layout_field_name, None)
-                nested_layout_data = get_nested_form_data(layout_field_name, data, layout_value)
-                if nested_layout_data:
-                    is_nested_payload = any(
-                        isinstance(value, dict) for value in nested_layout_data.values()
-                    )
+# Friendlier messages for constraint errors, matched as substrings of the error type.
+_ERROR_MESSAGE_RULES: Tuple[Tuple[str, Callable[[Dict[str, Any]], str]], ...] = (
+    ("greater_than_equal", _constraint_message("ge", "Must be {} or greater")),
+    ("less_than_equal", _constraint_message("le", "Must be {} or less")),
+    ("min_length", _constraint_message("min_length", "Must be at least {} characters")),
+    ("max_length", _constraint_message("max_length", "Must be no more than {} characters")),
+)
+# Error type -> formatter, filled on first sight of each type.
+_error_message_formatters: Dict[str, Callable[[Dict[str, Any]], str]] = {}
 
-                    # Validate the nested payload against the layout's underlying FormModel(s)
-                    # so constraints like `min_length` and required fields are enforced.
-                    nested_result: Optional[ValidationResult] = None
-
-                    validate_method = getattr(layout_value, "validate", None)
-                    if callable(validate_method):
-                        try:
-                            nested_result = validate_method(nested_layout_data)
-                        except Exception:
-                            nested_result = None
-
-                    # Fallback: validate each nested form class if available.
-                    if nested_result is None and hasattr(layout_value, "_get_forms"):
-                        get_forms = getattr(layout_value, "_get_forms", None)
-                        if callable(get_forms):
-                            combined_data: Dict[str, Any] = {}
-                            combined_errors: Dict[str, str] = {}
-                            is_valid = True
-
-                            try:
-                                for form_cls in get_forms() or []:
-                                    child = validate_form_data(form_cls, nested_layout_data)
-                                    if not child.is_valid:
-                                        is_valid = False
-                                        combined_errors.update(child.errors)
-                                    combined_data.update(child.data)
-                            except Exception:
-                                # If introspection validation fails, fall back to accepting payload.
-                                combined_data = {}
-                                combined_errors = {}
-                                is_valid = True
-
-                            nested_result = ValidationResult(
-                                is_valid=is_valid,
-                                data=combined_data or nested_layout_data,
-                                errors=combined_errors,
-                            )
-
-                    if nested_result is not None:
-                        # Preserve the schema-derived nested payload shape (e.g. tabbed layouts)
-                        # while still preferring coerced values for flat layouts.
-                        validated_data[layout_field_name] = nested_layout_data
-                        if not is_nested_payload and nested_result.data:
-                            validated_data[layout_field_name] = nested_result.data
-                        if not nested_result.is_valid:
-                            layout_errors.update(nested_result.errors)
-                    else:
-                        validated_data[layout_field_name] = nested_layout_data
 
-                    continue
+def _error_message_formatter(error_type: str) -> Callable[[Dict[str, Any]], str]:
+    formatter = _error_message_formatters.get(error_type)
+    if formatter is None:
+        formatter = next(
+            (rule for marker, rule in _ERROR_MESSAGE_RULES if marker in error_type),
+            _default_message,
+        )
+        _error_message_formatters[error_type] = formatter
+    return formatter
 
-                layout_payload = validated_data.get(layout_field_name)
-                if (
-                    isinstance(layout_payload, dict)
-                    and layout_payload.get("layout") is True
-                ):
-                    validated_data.pop(layout_field_name, None)
 
+def _format_error_message(error: Dict[str, Any]) -> str:
+    """Create a more user-friendly message for common constraint errors."""
+
+    return _error_message_formatter(error["type"])(error)
+
+
+def _format_validation_errors(errors: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """Map pydantic errors to ``{field_path: message}`` (``"general"`` for model-level errors)."""
+
+    formatted: Dict[str, str] = {}
+    for error in errors:
+        if error["loc"]:
+            formatted[_format_error_path(error["loc"])] = _format_error_message(error)
+        else:
+            formatted["general"] = error["msg"]
+    return formatted
+
+
+def _layout_field_names(runtime_model: type) -> List[str]:
+    """Names of fields rendered as layouts (``ui_element``/``input_type`` ``"layout"``)."""
+
+    model_fields = getattr(runtime_model, "model_fields", {}) or {}
+    layout_field_names = []
+    for field_name, field_info in model_fields.items():
+        extra = getattr(field_info, "json_schema_extra", None) or {}
+        if not isinstance(extra, dict):
+            continue
+        ui_element = extra.get("ui_element") or extra.get("input_type")
+        if ui_element == "layout":
+            layout_field_names.append(field_name)
+    return layout_field_names
+
+
+class _ValidationPipeline:
+    """Everything :func:`validate_form_data` needs for one model, resolved once.
+
+    Holds the runtime model (including fields registered at runtime), its
+    ``model_validate`` entry point, the layout field names and, for :func:`validate_many`,
+    a ``TypeAdapter(list[Model])``.
+    """
+
+    def __init__(self, form_model_class: type) -> None:
+        self.runtime_model = (
+            form_model_class.get_runtime_model()
+            if hasattr(form_model_class, "get_runtime_model")
+            else form_model_class
+        )
+        # Models with their own ``__init__`` are constructed the way callers build them.
+        self.model_validate = (
+            self.runtime_model.model_validate
+            if getattr(self.runtime_model, "__init__", None) is BaseModel.__init__
+            else None
+        )
+        self.layout_field_names = tuple(_layout_field_names(self.runtime_model))
+        self._list_adapter: Any = None
+
+    def _instantiate(self, data: Any) -> Any:
+        if self.model_validate is not None and type(data) is dict:
+            return self.model_validate(data)
+        return self.runtime_model(**data)
+
+    def validate(self, data: Dict[str, Any], *, dump: bool = True) -> ValidationResult:
+        try:
+            validated_instance = self._instantiate(data)
+
+            if not self.layout_field_names:
+                if not dump:
+                    return ValidationResult(is_valid=True, model=validated_instance)
+                return ValidationResult(
+                    is_valid=True, data=validated_instance.model_dump(), model=validated_instance
+                )
+
+            # Convert to dict for consistent return format
+            validated_data = validated_instance.model_dump()
+            layout_errors = self._validate_layouts(validated_instance, validated_data, data)
             if layout_errors:
                 return ValidationResult(is_valid=False, data=validated_data, errors=layout_errors)
 
-        return ValidationResult(is_valid=True, data=validated_data)
-
-    except ValidationError as e:
-        errors = {}
-        for error in e.errors():
-            # Create more specific field paths for nested data
-            if error["loc"]:
-                # Handle nested field locations like ('pets', 0, 'weight')
-                field_path_parts = []
-                for loc_part in error["loc"]:
-                    if isinstance(loc_part, int):
-                        # This is an array index
-                        field_path_parts.append(f"[{loc_part}]")
-                    else:
-                        if field_path_parts:
-                            field_path_parts.append(f".{loc_part}")
-                        else:
-                            field_path_parts.append(str(loc_part))
-
-                field_name = "".join(field_path_parts)
-
-                # Create more user-friendly error messages
-                error_message = error["msg"]
-                error_type = error["type"]
-
-                # Enhance error messages with context
-                if "greater_than_equal" in error_type:
-                    limit = error.get("ctx", {}).get("ge")
-                    if limit is not None:
-                        error_message = f"Must be {limit} or greater"
-                elif "less_than_equal" in error_type:
-                    limit = error.get("ctx", {}).get("le")
-                    if limit is not None:
-                        error_message = f"Must be {limit} or less"
-                elif "min_length" in error_type:
-                    min_length = error.get("ctx", {}).get("min_length")
-                    if min_length is not None:
-                        error_message = f"Must be at least {min_length} characters"
-                elif "max_length" in error_type:
-                    max_length = error.get("ctx", {}).get("max_length")
-                    if max_length is not None:
-                        error_message = f"Must be no more than {max_length} characters"
-
-                errors[field_name] = error_message
+            return ValidationResult(is_valid=True, data=validated_data, model=validated_instance)
+
+        except ValidationError as e:
+            return ValidationResult(is_valid=False, errors=_format_validation_errors(e.errors()))
+
+        except Exception as e:
+            # Handle unexpected errors
+            return ValidationResult(is_valid=False, errors={"general": str(e)})
+
+    def _validate_layouts(
+        self, validated_instance: Any, validated_data: Dict[str, Any], data: Dict[str, Any]
+    ) -> Dict[str, str]:
+        from .rendering.layout_engine import get_nested_form_data
+
+        layout_errors: Dict[str, str] = {}
+
+        for layout_field_name in self.layout_field_names:
+            layout_value = getattr(validated_instance, layout_field_name, None)
+            nested_layout_data = get_nested_form_data(layout_field_name, data, layout_value)
+            if nested_layout_data:
+                is_nested_payload = any(
+                    isinstance(value, dict) for value in nested_layout_data.values()
+                )
+
+                # Validate the nested payload against the layout's underlying FormModel(s)
+                # so constraints like `min_length` and required fields are enforced.
+                nested_result: Optional[ValidationResult] = None
+
+                validate_method = getattr(layout_value, "validate", None)
+                if callable(validate_method):
+                    try:
+                        nested_result = validate_method(nested_layout_data)
+                    except Exception:
+                        nested_result = None
+
+                # Fallback: validate each nested form class if available.
+                if nested_result is None and callable(getattr(layout_value, "_get_forms", None)):
+                    combined_data: Dict[str, Any] = {}
+                    combined_errors: Dict[str, str] = {}
+                    is_valid = True
+
+                    try:
+                        for form_cls in layout_value._get_forms() or []:
+                            child = validate_form_data(form_cls, nested_layout_data)
+                            if not child.is_valid:
+                                is_valid = False
+                                combined_errors.update(child.errors)
+                            combined_data.update(child.data)
+                    except Exception:
+                        # If introspection validation fails, fall back to accepting payload.
+                        combined_data = {}
+                        combined_errors = {}
+                        is_valid = True
+
+                    nested_result = ValidationResult(
+                        is_valid=is_valid,
+                        data=combined_data or nested_layout_data,
+                        errors=combined_errors,
+                    )
+
+                if nested_result is not None:
+                    # Preserve the schema-derived nested payload shape (e.g. tabbed layouts)
+                    # while still preferring coerced values for flat layouts.
+                    validated_data[layout_field_name] = nested_layout_data
+                    if not is_nested_payload and nested_result.data:
+                        validated_data[layout_field_name] = nested_result.data
+                    if not nested_result.is_valid:
+                        layout_errors.update(nested_result.errors)
+                else:
+                    validated_data[layout_field_name] = nested_layout_data
+
+                continue
+
+            layout_payload = validated_data.get(layout_field_name)
+            if isinstance(layout_payload, dict) and layout_payload.get("layout") is True:
+                validated_data.pop(layout_field_name, None)
+
+        return layout_errors
+
+    @property
+    def list_adapter(self) -> Any:
+        if self._list_adapter is None:
+            from pydantic import TypeAdapter, WrapValidator
+
+            # Each row's failure is captured in place, so one bad row does not fail the list.
+            row_type = Annotated[self.runtime_model, WrapValidator(_capture_row_failure)]
+            self._list_adapter = TypeAdapter(List[row_type])  # type: ignore[valid-type]
+        return self._list_adapter
+
+    def _row_result(self, instance: Any, dump: bool) -> ValidationResult:
+        if not dump:
+            return ValidationResult(is_valid=True, model=instance)
+        return ValidationResult(is_valid=True, data=instance.model_dump(), model=instance)
+
+    def validate_chunk(self, rows: List[Any], *, dump: bool = True) -> List[ValidationResult]:
+        if self.layout_field_names:
+            # Layout fields validate their nested forms separately, row by row.
+            return [self.validate(row, dump=dump) for row in rows]
+
+        results = []
+        for row, outcome in zip(rows, self.list_adapter.validate_python(rows), strict=True):
+            if not isinstance(outcome, _RowFailure):
+                results.append(self._row_result(outcome, dump))
+            elif isinstance(outcome.error, ValidationError):
+                results.append(
+                    ValidationResult(
+                        is_valid=False, errors=_format_validation_errors(outcome.error.errors())
+                    )
+                )
             else:
-                errors["general"] = error["msg"]
+                # Validators raising something other than ValueError: re-validate this row.
+                results.append(self.validate(row, dump=dump))
+        return results
+
 
-        return ValidationResult(is_valid=False, errors=errors)
+class _RowFailure:
+    """Placeholder for a row that failed inside ``TypeAdapter(list[Model])``."""
 
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def _capture_row_failure(value: Any, handler: Callable[[Any], Any]) -> Any:
+    try:
+        return handler(value)
     except Exception as e:
-        # Handle unexpected errors
-        return ValidationResult(is_valid=False, errors={"general": str(e)})
+        return _RowFailure(e)
+
+
+_VALIDATION_PIPELINE_CACHE_MAX = 256
+_validation_pipeline_cache: "OrderedDict[type, Tuple[int, _ValidationPipeline]]" = OrderedDict()
+_validation_pipeline_cache_lock = RLock()
+
+
+def get_validation_pipeline(form_model_class: type) -> _ValidationPipeline:
+    """Return the cached validation pipeline for ``form_model_class``.
+
+    Entries are stamped with ``FormModel.schema_version()`` so fields registered at runtime
+    are picked up.
+    """
+
+    schema_version = getattr(form_model_class, "schema_version", None)
+    version = schema_version() if schema_version is not None else 0
+    with _validation_pipeline_cache_lock:
+        entry = _validation_pipeline_cache.get(form_model_class)
+        if entry is not None and entry[0] == version:
+            _validation_pipeline_cache.move_to_end(form_model_class)
+            return entry[1]
+    pipeline = _ValidationPipeline(form_model_class)
+    with _validation_pipeline_cache_lock:
+        _validation_pipeline_cache[form_model_class] = (version, pipeline)
+        _validation_pipeline_cache.move_to_end(form_model_class)
+        if len(_validation_pipeline_cache) > _VALIDATION_PIPELINE_CACHE_MAX:
+            _validation_pipeline_cache.popitem(last=False)
+    return pipeline
+
+
+def reset_validation_pipeline_cache() -> None:
+    """Clear the per-model validation pipelines (used in tests or hot reload)."""
+
+    with _validation_pipeline_cache_lock:
+        _validation_pipeline_cache.clear()
+
+
+def validate_form_data(
+    form_model_class: type, data: Dict[str, Any], *, dump: bool = True
+) -> ValidationResult:
+    """
+    Validate form data against a Pydantic model.
+
+    The runtime model, layout fields and error formatting are resolved once per model
+    (see :func:`get_validation_pipeline`) rather than on every call.
+
+    Args:
+        form_model_class: The Pydantic model class to validate against
+        data: Dictionary of form data to validate
+        dump: Set ``False`` to skip ``model_dump()`` and use ``result.model`` (the
+            validated instance) instead of ``result.data``. Models with layout fields are
+            always dumped.
+
+    Returns:
+        ValidationResult with is_valid, data, errors and model
+    """
+    return get_validation_pipeline(form_model_class).validate(data, dump=dump)
+
+
+def _validate_chunk(
+    form_model_class: type, rows: List[Any], *, dump: bool = True
+) -> List[ValidationResult]:
+    # Module-level so process pool workers can unpickle it.
+    return get_validation_pipeline(form_model_class).validate_chunk(rows, dump=dump)
+
+
+def _chunked(rows: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    chunk: List[Any] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_many(
+    form_model_class: type,
+    rows: Iterable[Dict[str, Any]],
+    *,
+    chunk_size: int = 1000,
+    workers: Optional[int] = None,
+    dump: bool = True,
+) -> List[ValidationResult]:
+    """
+    Validate many rows (CSV imports, API batches) against one model.
+
+    Rows are validated a chunk at a time through a cached ``TypeAdapter(list[Model])``,
+    so the per-row cost is pydantic's core validation instead of a model construction,
+    a layout-field scan and a ``try``/``except`` each. Results come back in row order
+    with the same ``data`` and ``errors`` (including paths like ``pets[0].weight``) as
+    :func:`validate_form_data`. Models with layout fields are validated row by row.
+
+    Args:
+        form_model_class: The Pydantic model class to validate against
+        rows: Iterable of form data dictionaries, consumed lazily chunk by chunk
+        chunk_size: Rows handed to the validator (or to a worker) at once
+        workers: Validate chunks in a process pool of this size. The model class must
+            be importable by the worker processes (defined at module level).
+        dump: Set ``False`` to keep only the validated instances (``result.model``).
+
+    Returns:
+        One ValidationResult per row, in input order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunks = _chunked(rows, chunk_size)
+    results: List[ValidationResult] = []
+
+    if workers is not None and workers > 1:
+        from concurrent.futures import Future, ProcessPoolExecutor
+
+        # Keep at most ``workers * 2`` chunks in flight so ``rows`` is still read lazily.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future[List[ValidationResult]]] = deque()
+            for chunk in chunks:
+                if len(pending) >= workers * 2:
+                    results.extend(pending.popleft().result())
+                pending.append(executor.submit(_validate_chunk, form_model_class, chunk, dump=dump))
+            while pending:
+                results.extend(pending.popleft().result())
+        return results
+
+    pipeline = get_validation_pipeline(form_model_class)
+    for chunk in chunks:
+        results.extend(pipeline.validate_chunk(chunk, dump=dump))
+    return results
 
 
 # Export validation rules for easy access
@@ -1044,12 +1868,17 @@ __all__ = [
     "DateRangeRule",
     "CustomRule",
     "FieldValidator",
+    "CompiledFieldValidator",
     "ValidationSchema",
     "FormValidator",
     "CrossFieldRules",
+    "cross_field_rule",
     "create_validator",
     "create_email_validator",
     "create_password_strength_validator",
     "ValidationResult",
+    "get_validation_pipeline",
+    "reset_validation_pipeline_cache",
     "validate_form_data",
+    "validate_many",
 ]
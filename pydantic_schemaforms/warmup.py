@@ -0,0 +1,184 @@
+"""Pre-fork warm-up of the per-process render caches.
+
+Pre-forking servers (gunicorn, uWSGI, multiprocessing pools) copy the parent's memory
+into every worker copy-on-write. Everything a render needs - compiled templates, the
+input component map, schema metadata and render plans, pooled renderers and their theme
+CSS/JS, vendored asset text - is otherwise built lazily by each worker on its first
+request, so every worker pays that latency and keeps a private copy. Calling
+:func:`warmup` in the parent (e.g. gunicorn's ``on_starting`` hook or with ``--preload``)
+builds it once::
+
+    from pydantic_schemaforms import warmup
+
+    report = warmup(models=[SignupForm, ProfileForm], frameworks=["bootstrap"], freeze=True)
+    print(report.summary())
+
+With ``freeze=True`` the surviving objects are moved to the permanent generation via
+:func:`gc.freeze`, so the collector in the workers never writes to their headers and the
+pages stay shared.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Tuple, Type
+
+if TYPE_CHECKING:  # pragma: no cover - import-time only for type hints
+    from .schema_form import FormModel
+
+DEFAULT_WARMUP_FRAMEWORKS: Tuple[str, ...] = ("bootstrap", "material")
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """What :func:`warmup` built and how much memory the process holds afterwards."""
+
+    models: Tuple[str, ...]
+    frameworks: Tuple[str, ...]
+    layouts: Tuple[str, ...]
+    renders: int
+    assets: int
+    duration: float
+    rss_before: Optional[int]
+    rss_after: Optional[int]
+    frozen_objects: int
+
+    @property
+    def rss_delta(self) -> Optional[int]:
+        """Bytes of resident memory added by the warm-up (``None`` if RSS is unavailable)."""
+
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+
+    def summary(self) -> str:
+        rss = "n/a" if self.rss_after is None else f"{self.rss_after / 1_048_576:.1f} MiB"
+        delta = "" if self.rss_delta is None else f" (+{self.rss_delta / 1_048_576:.1f} MiB)"
+        return (
+            f"Warmed {len(self.models)} models x {len(self.frameworks)} frameworks "
+            f"({self.renders} renders, {self.assets} assets) in {self.duration * 1000:.1f} ms; "
+            f"RSS {rss}{delta}; {self.frozen_objects} objects frozen"
+        )
+
+
+def _current_rss() -> Optional[int]:
+    """Resident set size in bytes, read from ``/proc`` (``None`` where unavailable)."""
+
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _warm_assets(frameworks: Sequence[str], asset_mode: str, include_imask: bool) -> int:
+    from .assets.runtime import (
+        framework_css_tag,
+        framework_js_tag,
+        htmx_script_tag,
+        imask_script_tag,
+        validation_runtime_script_tag,
+        vendored_asset_variants,
+    )
+
+    tags = [htmx_script_tag(asset_mode=asset_mode), validation_runtime_script_tag(asset_mode=asset_mode)]
+    if include_imask:
+        tags.append(imask_script_tag(asset_mode=asset_mode))
+    for framework in frameworks:
+        tags.append(framework_css_tag(framework=framework, asset_mode=asset_mode))
+        tags.append(framework_js_tag(framework=framework, asset_mode=asset_mode))
+    count = sum(1 for tag in tags if tag)
+
+    if asset_mode.replace("_", "-") == "local-static":
+        from .assets.static import static_asset_index
+
+        # Precompressed bodies and ETags served by the static asset handler.
+        static_asset_index()
+        count += len(vendored_asset_variants())
+    return count
+
+
+def warmup(
+    models: Iterable[Type["FormModel"]] = (),
+    frameworks: Iterable[str] = DEFAULT_WARMUP_FRAMEWORKS,
+    *,
+    layouts: Iterable[str] = ("vertical",),
+    asset_mode: str = "vendored",
+    include_imask: bool = False,
+    freeze: bool = False,
+) -> WarmupReport:
+    """Populate every render cache for ``models`` before workers fork.
+
+    Each model is rendered once per framework and layout, which builds its schema
+    metadata, render plans and pooled renderer (including theme CSS/JS). Templates, the
+    input component map and the vendored assets for ``asset_mode`` are loaded as well.
+
+    Args:
+        models: Form models the application renders.
+        frameworks: Frameworks to warm (``"bootstrap"``, ``"material"``, ``"none"``).
+        layouts: Layouts the models are rendered with.
+        asset_mode: Asset mode the application renders with.
+        include_imask: Also load the IMask script.
+        freeze: Call :func:`gc.collect` then :func:`gc.freeze` afterwards so the warmed
+            objects are never touched by the collector in forked workers.
+
+    Returns:
+        A :class:`WarmupReport` with counts, timing and resident memory.
+    """
+
+    from .inputs.registry import get_input_component_map
+    from .render_form import render_form_html
+    from .templates import precompile_templates
+
+    model_list = tuple(models)
+    framework_list = tuple(frameworks)
+    layout_list = tuple(layouts)
+
+    rss_before = _current_rss()
+    start = time.perf_counter()
+
+    precompile_templates()
+    get_input_component_map()
+    assets = _warm_assets(framework_list, asset_mode, include_imask)
+
+    renders = 0
+    for model_cls in model_list:
+        for framework in framework_list:
+            for layout in layout_list:
+                render_form_html(
+                    model_cls,
+                    framework=framework,
+                    submit_url="/",
+                    asset_mode=asset_mode,
+                    include_imask=include_imask,
+                    layout=layout,
+                )
+                renders += 1
+
+    duration = time.perf_counter() - start
+
+    frozen_objects = 0
+    if freeze:
+        # Collect first so garbage from the warm-up is not pinned in the permanent generation.
+        gc.collect()
+        gc.freeze()
+        frozen_objects = gc.get_freeze_count()
+
+    return WarmupReport(
+        models=tuple(model_cls.__name__ for model_cls in model_list),
+        frameworks=framework_list,
+        layouts=layout_list,
+        renders=renders,
+        assets=assets,
+        duration=duration,
+        rss_before=rss_before,
+        rss_after=_current_rss(),
+        frozen_objects=frozen_objects,
+    )
+
+
+__all__ = ["DEFAULT_WARMUP_FRAMEWORKS", "WarmupReport", "warmup"]
@@ -0,0 +1,185 @@
+"""Tests for async validation rules and the avalidate paths."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from pydantic_schemaforms.integration.async_support import handle_async_form
+from pydantic_schemaforms.integration.builder import FormBuilder
+from pydantic_schemaforms.live_validation import LiveValidator
+from pydantic_schemaforms.validation import CustomRule, FieldValidator, FormValidator, ValidationResponse
+
+
+async def _username_available(value: str) -> bool:
+    await asyncio.sleep(0.05)
+    return value != "taken"
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_async_custom_rule() -> None:
+    rule = CustomRule(_username_available, "Username is taken")
+
+    assert rule.is_async is True
+    assert _run(rule.avalidate("free")) == (True, "")
+    assert _run(rule.avalidate("taken")) == (False, "Username is taken")
+    # Outside an event loop the sync path still works.
+    assert rule.validate("taken") == (False, "Username is taken")
+
+
+def test_sync_validate_inside_loop_reports_error() -> None:
+    rule = CustomRule(_username_available)
+
+    async def call_sync():
+        return rule.validate("x")
+
+    is_valid, message = _run(call_sync())
+    assert is_valid is False
+    assert "avalidate" in message
+
+
+def test_rule_timeout() -> None:
+    async def slow(value):
+        await asyncio.sleep(1)
+        return True
+
+    assert _run(CustomRule(slow, timeout=0.01).avalidate("x")) == (False, "Validation timed out")
+    assert _run(CustomRule(slow).avalidate("x", timeout=0.01)) == (False, "Validation timed out")
+
+
+def test_field_validator_avalidate_keeps_rule_order() -> None:
+    validator = FieldValidator("username").required().custom(_username_available, "Taken").min_length(10)
+
+    is_valid, errors = _run(validator.avalidate("taken"))
+
+    assert is_valid is False
+    assert errors == ["Taken", "Must be at least 10 characters long"]
+
+
+def test_form_validator_runs_fields_concurrently() -> None:
+    form = FormValidator()
+    for name in ("a", "b", "c", "d"):
+        form.field(name).custom(_username_available, "Taken")
+
+    async def passwords_match(data):
+        return data.get("a") == data.get("b"), {"b": "Must match a"}
+
+    form.add_cross_field_rule(passwords_match)
+
+    start = time.perf_counter()
+    is_valid, errors = _run(form.avalidate({"a": "x", "b": "y", "c": "taken", "d": "ok"}))
+    elapsed = time.perf_counter() - start
+
+    assert is_valid is False
+    assert errors == {"c": ["Taken"], "b": ["Must match a"]}
+    assert elapsed < 0.15
+
+
+def test_form_validator_concurrency_limit() -> None:
+    running = 0
+    peak = 0
+
+    async def tracked(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return True
+
+    form = FormValidator()
+    for index in range(6):
+        form.field(f"f{index}").custom(tracked)
+
+    assert _run(form.avalidate({}, max_concurrency=2)) == (True, {})
+    assert peak == 2
+    with pytest.raises(ValueError):
+        _run(form.avalidate({}, max_concurrency=0))
+
+
+def test_live_validator_avalidate_fields() -> None:
+    live = LiveValidator()
+    live.register_field_validator(FieldValidator("username").custom(_username_available, "Taken"))
+
+    async def check_email(value):
+        await asyncio.sleep(0.05)
+        return ValidationResponse(field_name="email", is_valid="@" in value)
+
+    live.register_validator("email", check_email)
+
+    start = time.perf_counter()
+    results = _run(live.avalidate_fields({"username": "taken", "email": "a@b", "other": 1}))
+    elapsed = time.perf_counter() - start
+
+    assert list(results) == ["username", "email"]
+    assert results["username"].errors == ["Taken"]
+    assert results["email"].is_valid is True
+    assert elapsed < 0.09
+    assert _run(live.avalidate_field("email", "nope")).is_valid is False
+
+
+def test_live_validator_timeout_and_cache() -> None:
+    calls = []
+
+    async def slow(value):
+        calls.append(value)
+        await asyncio.sleep(0.2 if value == "slow" else 0)
+        return ValidationResponse(field_name="name", is_valid=True)
+
+    live = LiveValidator()
+    live.register_validator("name", slow)
+    live.enable_result_cache()
+
+    assert _run(live.avalidate_field("name", "slow", timeout=0.01)).errors == ["Validation timed out"]
+    _run(live.avalidate_field("name", "fast"))
+    _run(live.avalidate_field("name", "fast"))
+    assert calls == ["slow", "fast"]
+
+
+def test_handle_async_form_awaits_async_rules() -> None:
+    builder = FormBuilder().text_input("username")
+    builder.validator.field("username").custom(_username_available, "Taken")
+
+    result = _run(handle_async_form(builder, {"username": "taken"}, render_on_error=False))
+
+    assert result == {"success": False, "errors": {"username": ["Taken"]}}
+    assert _run(handle_async_form(builder, {"username": "free"}))["success"] is True
+
+
+def test_sync_validate_awaits_all_async_rules_in_one_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    loops = []
+    real_run = asyncio.run
+
+    def counting_run(coroutine):
+        loops.append(coroutine)
+        return real_run(coroutine)
+
+    monkeypatch.setattr(asyncio, "run", counting_run)
+
+    form = FormValidator()
+    form.field("username").custom(_username_available, "Taken").custom(_username_available, "Again")
+    form.field("nickname").custom(_username_available, "Taken")
+
+    async def differs(data):
+        return data.get("username") != data.get("nickname"), {"nickname": "Must differ"}
+
+    form.add_cross_field_rule(differs)
+
+    assert form.validate({"username": "taken", "nickname": "taken"}) == (
+        False,
+        {"username": ["Taken", "Again"], "nickname": ["Taken", "Must differ"]},
+    )
+    assert form.field_validators["username"].validate("taken") == (False, ["Taken", "Again"])
+
+    live = LiveValidator()
+    live.register_field_validator(form.field_validators["username"])
+    live.register_field_validator(form.field_validators["nickname"])
+    results = live.validate_fields({"username": "free", "nickname": "taken"})
+
+    assert [response.is_valid for response in results.values()] == [True, False]
+    assert len(loops) == 3
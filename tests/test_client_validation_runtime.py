@@ -0,0 +1,154 @@
+"""Tests for the static client validation runtime and per-form rule descriptors."""
+
+from __future__ import annotations
+
+import json
+import re
+from enum import Enum
+from typing import List, Literal, Optional
+
+import pytest
+
+from pydantic_schemaforms.assets.runtime import (
+    VALIDATION_RUNTIME_PATH,
+    hashed_asset_name,
+    read_asset_bytes,
+    read_asset_text,
+    static_asset_url,
+)
+from pydantic_schemaforms.assets.static import serve_static_asset
+from pydantic_schemaforms.client_validation import (
+    client_validation_tags,
+    form_rule_descriptor,
+    reset_client_rules_cache,
+    rule_descriptor_tag,
+)
+from pydantic_schemaforms.modern_renderer import FormDefinition, FormField, ModernFormRenderer
+from pydantic_schemaforms.schema_form import Field, FormModel
+from pydantic_schemaforms.validation import FormValidator
+
+
+class _Plan(str, Enum):
+    FREE = "free"
+    PRO = "pro"
+
+
+class _SignupForm(FormModel):
+    username: str = Field(..., min_length=3, max_length=12, pattern=r"^[a-z0-9_]+$")
+    nickname: Optional[str] = Field(None, max_length=8)
+    age: int = Field(..., ge=18, lt=130)
+    plan: _Plan = Field(_Plan.FREE)
+    size: Literal["s", "m"] = Field("s")
+    newsletter: bool = Field(False)
+    tags: List[str] = Field(default_factory=list)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_client_rules_cache()
+    yield
+    reset_client_rules_cache()
+
+
+def _descriptor_payload(html: str) -> dict:
+    match = re.search(r"<script type=\"application/json\" data-schemaforms-rules[^>]*>(.*?)</script>", html)
+    assert match is not None
+    return json.loads(match.group(1))
+
+
+def test_descriptor_is_derived_from_schema_constraints() -> None:
+    fields = form_rule_descriptor(_SignupForm)["fields"]
+
+    assert [rule["type"] for rule in fields["username"]] == ["required", "min_length", "max_length", "regex"]
+    assert fields["username"][3]["pattern"] == r"^[a-z0-9_]+$"
+    assert fields["nickname"] == [
+        {"type": "max_length", "message": "Must be no more than 8 characters long", "max_length": 8}
+    ]
+    assert fields["age"][1] == {
+        "type": "numeric_range",
+        "message": "Must be at least 18 and less than 130",
+        "min": 18,
+        "max": 130,
+        "exclusive_max": True,
+    }
+    assert fields["plan"][0]["values"] == ["free", "pro"]
+    assert fields["size"][0]["values"] == ["s", "m"]
+    # Booleans and multi-value fields have no client rules.
+    assert "newsletter" not in fields and "tags" not in fields
+
+
+def test_validator_rules_are_merged_and_server_only_rules_dropped() -> None:
+    validator = FormValidator()
+    validator.field("username").min_length(5, "Too short").required("Pick a name")
+    validator.field("username").custom(lambda value: True, "Never sent")
+    validator.field("birthday").date_range("2000-01-01")
+
+    fields = form_rule_descriptor(_SignupForm, validator=validator)["fields"]
+
+    assert fields["username"] == [
+        {"type": "required", "message": "Pick a name"},
+        {"type": "max_length", "message": "Must be no more than 12 characters long", "max_length": 12},
+        {"type": "regex", "message": "Invalid format", "pattern": r"^[a-z0-9_]+$"},
+        {"type": "min_length", "message": "Too short", "min_length": 5},
+    ]
+    assert fields["birthday"][0]["min_date"] == "2000-01-01"
+    # The cached model descriptor is not modified by the merge.
+    assert form_rule_descriptor(_SignupForm)["fields"]["username"][0]["message"] == "This field is required"
+
+
+def test_descriptor_tag_cannot_break_out_of_the_script() -> None:
+    descriptor = {"fields": {"x": [{"type": "regex", "message": "</script><b>", "pattern": "a"}]}}
+
+    tag = rule_descriptor_tag(descriptor, form_id='signup"form')
+
+    assert tag.count("</script>") == 1
+    assert 'data-form="signup&quot;form"' in tag
+    assert _descriptor_payload(tag) == descriptor
+
+
+def test_asset_modes() -> None:
+    inline = client_validation_tags(_SignupForm)
+    assert read_asset_text(VALIDATION_RUNTIME_PATH) in inline
+    assert inline.index("data-schemaforms-rules") < inline.index("SchemaFormsValidation")
+
+    local = client_validation_tags(_SignupForm, asset_mode="local-static")
+    assert f'<script src="{static_asset_url(VALIDATION_RUNTIME_PATH)}"></script>' in local
+    assert "SchemaFormsValidation" not in local
+
+    descriptor_only = client_validation_tags(_SignupForm, asset_mode="none")
+    assert descriptor_only.startswith("<script type=\"application/json\"")
+    assert "<script>" not in descriptor_only and "src=" not in descriptor_only
+
+
+def test_runtime_is_served_as_a_hashed_static_asset() -> None:
+    public_name = hashed_asset_name(VALIDATION_RUNTIME_PATH)
+    assert re.fullmatch(r"js/schemaforms-validation\.[0-9a-f]{12}\.js", public_name)
+
+    response = serve_static_asset(public_name)
+    assert response.status == 200
+    assert response.body == read_asset_bytes(VALIDATION_RUNTIME_PATH)
+
+
+def test_serialized_descriptor_is_cached_until_the_schema_changes() -> None:
+    class _TenantForm(FormModel):
+        title: str = Field(..., max_length=20)
+
+    first = client_validation_tags(_TenantForm, asset_mode="none")
+    assert client_validation_tags(_TenantForm, asset_mode="none") == first
+
+    _TenantForm.register_field("seats", annotation=int, field=Field(..., ge=1))
+    fields = _descriptor_payload(client_validation_tags(_TenantForm, asset_mode="none"))["fields"]
+    assert fields["seats"] == [{"type": "required", "message": "This field is required"}]
+
+
+def test_modern_renderer_emits_descriptor_instead_of_inline_script() -> None:
+    form_def = FormDefinition(
+        title="Signup",
+        fields=[FormField("username", field_type="text", required=True)],
+    )
+
+    html = ModernFormRenderer(asset_mode="local-static").render_form(form_def)
+
+    assert _descriptor_payload(html)["fields"]["username"][0]["type"] == "required"
+    assert static_asset_url(VALIDATION_RUNTIME_PATH) in html
+    assert "main-form" not in html
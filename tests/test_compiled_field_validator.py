@@ -0,0 +1,102 @@
+"""Tests for FieldValidator.compile() and columnar validation."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Tuple
+
+import pytest
+
+from pydantic_schemaforms.validation import (
+    EmailRule,
+    FieldValidator,
+    MinLengthRule,
+    PhoneRule,
+    RegexRule,
+)
+
+VALUES = [
+    None,
+    "",
+    "   ",
+    "ab",
+    "ada@example.com",
+    "not-an-email",
+    "x" * 40 + "@example.com",
+    42,
+    "12.5",
+    "abc",
+    "2024-02-29",
+    "2024-2-3",
+    "2030-01-01",
+    "2024-13-01",
+    date(2024, 6, 1),
+]
+
+
+def _validators():
+    yield FieldValidator("email").required().min_length(3).max_length(30).email()
+    yield FieldValidator("phone").phone().regex(r"^\+?\d")
+    yield FieldValidator("score").numeric_range(0, 20)
+    yield FieldValidator("lower").numeric_range(min_val=10)
+    yield FieldValidator("when").date_range("2024-01-01", date(2025, 1, 1))
+    yield FieldValidator("odd").custom(lambda value: len(str(value)) % 2 == 1, "Must be odd")
+
+
+@pytest.mark.parametrize("validator", list(_validators()), ids=lambda v: v.field_name)
+def test_compiled_chain_matches_validate(validator: FieldValidator) -> None:
+    compiled = validator.compile()
+    for value in VALUES:
+        assert compiled(value) == validator.validate(value), value
+
+
+@pytest.mark.parametrize("validator", list(_validators()), ids=lambda v: v.field_name)
+def test_validate_column_matches_validate(validator: FieldValidator) -> None:
+    values = VALUES * 3
+
+    assert validator.validate_column(iter(values)) == [validator.validate(v) for v in values]
+
+
+def test_compiled_chain_is_cached_until_rules_change() -> None:
+    validator = FieldValidator("name").required()
+    compiled = validator.compile()
+    assert validator.compile() is compiled
+
+    validator.min_length(5)
+    recompiled = validator.compile()
+    assert recompiled is not compiled
+    assert recompiled("abc") == (False, ["Must be at least 5 characters long"])
+
+
+def test_email_and_phone_rules_share_compiled_patterns() -> None:
+    assert EmailRule().regex is EmailRule("Other message").regex
+    assert PhoneRule().regex is PhoneRule().regex
+    assert RegexRule(r"^\d+$").regex is RegexRule(r"^\d+$", "Digits only").regex
+
+
+def test_subclass_overriding_validate_is_not_bypassed() -> None:
+    class _StrictMinLength(MinLengthRule):
+        def validate(self, value: Any, field_name: str = "") -> Tuple[bool, str]:
+            if value == "banned":
+                return False, "Not allowed"
+            return super().validate(value, field_name)
+
+    validator = FieldValidator("name", [_StrictMinLength(3)])
+
+    assert validator.compile()("banned") == (False, ["Not allowed"])
+    assert validator.validate_column(["banned", "ok", "fine"]) == [
+        (False, ["Not allowed"]),
+        (False, ["Must be at least 3 characters long"]),
+        (True, []),
+    ]
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [FieldValidator("score").numeric_range(0, 20), FieldValidator("lower").numeric_range(min_val=10)],
+    ids=["bounded", "one_sided"],
+)
+def test_validate_column_matches_validate_for_non_finite_numbers(validator: FieldValidator) -> None:
+    values = ["nan", "inf", "5"]
+
+    assert validator.validate_column(values) == [validator.validate(v) for v in values]
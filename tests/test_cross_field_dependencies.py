@@ -0,0 +1,141 @@
+"""Tests for dependency-graph driven incremental validation in FormValidator."""
+
+from __future__ import annotations
+
+import asyncio
+
+from pydantic_schemaforms.validation import (
+    CrossFieldRules,
+    FormValidator,
+    _infer_rule_fields,
+    cross_field_rule,
+)
+
+SHIPPING_FIELD = "shipping_country"
+
+
+def _counting(rule, calls, name):
+    def wrapper(data):
+        calls.append(name)
+        return rule(data)
+
+    wrapper.depends_on = rule.depends_on
+    return wrapper
+
+
+def _build_validator(calls):
+    validator = FormValidator()
+    validator.field("username").required().min_length(3)
+    validator.field("password").required().min_length(8)
+    validator.field("confirm_password").required()
+    validator.field("start").required()
+    validator.field("end").required()
+    validator.add_cross_field_rule(
+        _counting(CrossFieldRules.password_confirmation(), calls, "passwords")
+    )
+    validator.add_cross_field_rule(
+        _counting(CrossFieldRules.date_range_validation("start", "end"), calls, "dates")
+    )
+    return validator
+
+
+VALID = {
+    "username": "ada",
+    "password": "correct horse",
+    "confirm_password": "correct horse",
+    "start": "2024-01-01",
+    "end": "2024-02-01",
+}
+
+
+def test_changed_fields_only_run_affected_rules() -> None:
+    calls = []
+    validator = _build_validator(calls)
+
+    data = {**VALID, "confirm_password": "battery staple", "end": "2023-01-01"}
+    is_valid, errors = validator.validate(data, changed=["confirm_password"])
+
+    assert calls == ["passwords"]
+    assert is_valid is False
+    # The date error is outside the affected fields and not reported.
+    assert errors == {"confirm_password": ["Passwords do not match"]}
+    assert validator.affected_fields(["confirm_password"]) == ["confirm_password", "password"]
+
+
+def test_unrelated_change_runs_no_cross_field_rules() -> None:
+    calls = []
+    validator = _build_validator(calls)
+
+    is_valid, errors = validator.validate({**VALID, "username": "x"}, changed=["username"])
+
+    assert calls == []
+    assert is_valid is False
+    assert list(errors) == ["username"]
+
+
+def test_full_validation_is_unchanged() -> None:
+    calls = []
+    validator = _build_validator(calls)
+
+    data = {**VALID, "confirm_password": "nope", "end": "2023-01-01"}
+    is_valid, errors = validator.validate(data)
+
+    assert calls == ["passwords", "dates"]
+    assert is_valid is False
+    assert errors == {
+        "confirm_password": ["Passwords do not match"],
+        "end": ["End date must be after start date"],
+    }
+
+
+def test_fields_are_inferred_from_rule_source() -> None:
+    limit_field = "max_guests"
+
+    def guests_within_limit(data):
+        if int(data.get("guests", 0)) > int(data[limit_field]):
+            return False, {"guests": "Too many guests"}
+        return True, {}
+
+    def passes_data_on(data):
+        return all(data.values()), {}
+
+    assert _infer_rule_fields(guests_within_limit) == frozenset({"guests", "max_guests"})
+    assert _infer_rule_fields(passes_data_on) is None
+    assert _infer_rule_fields(lambda data: (True, {})) is None
+
+
+def test_declared_and_unknown_dependencies() -> None:
+    calls = []
+
+    @cross_field_rule("country", SHIPPING_FIELD)
+    def same_country(data):
+        calls.append("declared")
+        return True, {}
+
+    def opaque(data):
+        calls.append("opaque")
+        return not data.items(), {"general": "Nope", "other": "Hidden"}
+
+    validator = FormValidator()
+    validator.add_cross_field_rule(same_country)
+    validator.add_cross_field_rule(opaque)
+    validator.add_cross_field_rule(lambda data: (calls.append("explicit") or True, {}), fields=["zip"])
+
+    is_valid, errors = validator.validate({"country": "NL"}, changed=["country"])
+
+    assert calls == ["declared", "opaque"]
+    assert is_valid is False
+    assert errors == {"general": ["Nope"]}
+    assert validator.affected_fields(["zip"]) == ["zip"]
+
+
+def test_async_incremental_validation() -> None:
+    calls = []
+    validator = _build_validator(calls)
+
+    data = {**VALID, "start": "2025-01-01"}
+    is_valid, errors = asyncio.run(validator.avalidate(data, changed=["start"]))
+
+    assert calls == ["dates"]
+    assert is_valid is False
+    assert errors == {"end": ["End date must be after start date"]}
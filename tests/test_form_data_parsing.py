@@ -1,12 +1,27 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+from starlette.datastructures import FormData as StarletteFormData
+from werkzeug.datastructures import MultiDict
+
 from pydantic_schemaforms.form_data import (
+    FormDataLimitError,
+    FormDataLimits,
+    FormDataShapeError,
     _assign_list_token,
     _assign_mapping_token,
     _assign_nested,
     _coerce_to_list,
     _ensure_list_index,
     _new_container,
+    _tokenize_form_path,
+    form_coercer,
+    multi_value_fields,
     parse_nested_form_data,
 )
+from pydantic_schemaforms.integration.sync import normalize_form_data
+from pydantic_schemaforms.schema_form import Field, FormModel
 
 
 def test_coerce_form_value_non_string_is_returned_unchanged() -> None:
@@ -164,3 +179,230 @@ def test_assign_list_token_uses_reparented_list_for_non_list_current() -> None:
     _assign_nested(container, ["node", 0, "name"], "Neo")
 
     assert container == {"node": {"node": [{"name": "Neo"}]}}
+
+
+def test_huge_list_index_is_rejected_before_allocating() -> None:
+    with pytest.raises(FormDataLimitError) as exc_info:
+        parse_nested_form_data({"pets[50000000].name": "Rex"})
+
+    error = exc_info.value
+    assert error.limit == "max_index"
+    assert error.key == "pets[50000000].name"
+    assert error.value == 50_000_000
+    assert error.errors[0]["name"] == "pets[50000000].name"
+    assert error.errors[0]["type"] == "form_data_max_index"
+
+
+def test_index_with_absurd_digit_count_is_rejected() -> None:
+    with pytest.raises(FormDataLimitError):
+        parse_nested_form_data({f"pets[{'9' * 5000}]": "x"})
+
+
+@pytest.mark.parametrize(
+    ("limits", "form_data", "limit"),
+    [
+        (FormDataLimits(max_depth=3), {"a.b.c.d": "x"}, "max_depth"),
+        (FormDataLimits(max_keys=2), {"a": "1", "b": "2", "c": "3"}, "max_keys"),
+        (FormDataLimits(max_value_bytes=4), {"name": "\u00e9\u00e9\u00e9"}, "max_value_bytes"),
+        (FormDataLimits(max_value_bytes=4), {"blob": b"12345"}, "max_value_bytes"),
+        (FormDataLimits(max_value_bytes=4), [("tags", ["ok", "too long"])], "max_value_bytes"),
+    ],
+)
+def test_configurable_limits_raise_structured_error(limits, form_data, limit) -> None:
+    with pytest.raises(FormDataLimitError) as exc_info:
+        parse_nested_form_data(form_data, limits=limits)
+    assert exc_info.value.limit == limit
+
+
+def test_values_within_limits_are_accepted() -> None:
+    limits = FormDataLimits(max_index=2, max_depth=3, max_keys=3, max_value_bytes=4)
+    parsed = parse_nested_form_data({"pets[2].name": "Rex", "note": "\u00e9\u00e9"}, limits=limits)
+    assert parsed == {"pets": [None, None, {"name": "Rex"}], "note": "\u00e9\u00e9"}
+
+
+def test_unbounded_limits_disable_checks() -> None:
+    parsed = parse_nested_form_data({"items[1001]": "x"}, limits=FormDataLimits.unbounded())
+    assert len(parsed["items"]) == 1002
+
+
+def test_sparse_indices_compact_without_padding() -> None:
+    form_data = {
+        "pets[900].name": "Rex",
+        "pets[3].name": "Mochi",
+        "pets[900].age": "3",
+        "owner.tags[7]": "b",
+        "owner.tags[2]": "a",
+        "grid[4][9]": "y",
+        "grid[4][1]": "x",
+    }
+
+    parsed = parse_nested_form_data(form_data, coerce_values=False, sparse_indices=True)
+
+    assert parsed == {
+        "pets": [{"name": "Mochi"}, {"name": "Rex", "age": "3"}],
+        "owner": {"tags": ["a", "b"]},
+        "grid": [["x", "y"]],
+    }
+    assert type(parsed["pets"]) is list
+
+
+@pytest.mark.parametrize("sparse_indices", [False, True])
+@pytest.mark.parametrize(
+    ("form_data", "key", "path"),
+    [
+        ({"a[0]": "x", "a.b": "y"}, "a.b", "a"),
+        ({"a[0]": "x", "a[b]": "y"}, "a[b]", "a"),
+        ({"a": "x", "a[0]": "y"}, "a[0]", "a"),
+        ({"a[0]": "x", "a[0].b": "y"}, "a[0].b", "a[0]"),
+        ({"a.b": "x", "a[0]": "y"}, "a[0]", "a"),
+        ({"x.a.b": "x", "x.a[0]": "y"}, "x.a[0]", "x.a"),
+    ],
+)
+def test_conflicting_key_shapes_raise_structured_error(form_data, key, path, sparse_indices) -> None:
+    with pytest.raises(FormDataShapeError) as exc_info:
+        parse_nested_form_data(form_data, sparse_indices=sparse_indices)
+
+    error = exc_info.value
+    assert (error.key, error.path) == (key, path)
+    assert error.errors[0]["type"] == "form_data_shape"
+
+
+def test_sparse_indices_still_enforce_max_index() -> None:
+    with pytest.raises(FormDataLimitError):
+        parse_nested_form_data({"pets[5000].name": "Rex"}, sparse_indices=True)
+
+    parsed = parse_nested_form_data(
+        {"pets[50000000].name": "Rex"},
+        sparse_indices=True,
+        limits=FormDataLimits(max_index=None),
+    )
+    assert parsed == {"pets": [{"name": "Rex"}]}
+
+
+def test_tokenized_paths_are_cached() -> None:
+    assert _tokenize_form_path("pets[0].name") == ("pets", 0, "name")
+    assert _tokenize_form_path("pets[0].name") is _tokenize_form_path("pets[0].name")
+
+
+class _MultiValueForm(FormModel):
+    name: str = Field(..., title="Name")
+    colors: List[str] = Field(default_factory=list, ui_element="multiselect", options=["red", "green", "blue"])
+    toppings: List[str] = Field(default_factory=list, ui_element="checkbox_group")
+    tags: List[str] = Field(default_factory=list)
+
+
+def test_schema_metadata_lists_array_fields() -> None:
+    assert multi_value_fields(_MultiValueForm) == frozenset({"colors", "toppings", "tags"})
+    assert multi_value_fields(None) == frozenset()
+
+
+def test_starlette_form_data_collects_repeated_keys() -> None:
+    form = StarletteFormData(
+        [("name", "Ada"), ("colors", "red"), ("colors", "blue"), ("toppings", "on"), ("tags", "1")]
+    )
+
+    parsed = parse_nested_form_data(form, model=_MultiValueForm)
+
+    assert parsed == {"name": "Ada", "colors": ["red", "blue"], "toppings": ["on"], "tags": ["1"]}
+
+
+def test_werkzeug_multidict_collects_repeated_keys() -> None:
+    form = MultiDict([("colors", "red"), ("colors", "green"), ("name", "Ada")])
+
+    parsed = parse_nested_form_data(form, multi_value_keys={"colors"})
+
+    assert parsed == {"colors": ["red", "green"], "name": "Ada"}
+
+
+def test_multi_value_keys_accept_lists_and_nested_paths() -> None:
+    parsed = parse_nested_form_data(
+        [("owner.tags", "a"), ("owner.tags", "b"), ("colors", ["red", "blue"])],
+        multi_value_keys={"owner.tags", "colors"},
+    )
+
+    assert parsed == {"owner": {"tags": ["a", "b"]}, "colors": ["red", "blue"]}
+
+
+def test_repeated_values_count_towards_key_limit() -> None:
+    form = MultiDict([("colors", "red")] * 5)
+    with pytest.raises(FormDataLimitError):
+        parse_nested_form_data(form, multi_value_keys={"colors"}, limits=FormDataLimits(max_keys=4))
+
+
+def test_normalize_form_data_merges_repeated_keys() -> None:
+    form = StarletteFormData([("colors", "red"), ("colors", "blue"), ("subscribe", "on"), ("name", ["Ada"])])
+
+    assert normalize_form_data(form, array_fields={"colors"}) == {
+        "colors": ["red", "blue"],
+        "subscribe": True,
+        "name": "Ada",
+    }
+    # Without array fields the previous one-value-per-key behaviour is unchanged.
+    assert normalize_form_data(form)["colors"] == "blue"
+
+
+class _Pet(BaseModel):
+    name: str
+    vaccinated: bool = False
+    weight: Optional[float] = None
+
+
+class _CoercedForm(FormModel):
+    code: str = Field(..., title="Code")
+    subscribe: bool = Field(False, title="Subscribe")
+    age: Optional[int] = Field(None, title="Age")
+    pets: List[_Pet] = Field(default_factory=list, title="Pets", ui_element="model_list")
+    colors: List[str] = Field(default_factory=list, ui_element="multiselect")
+
+
+def test_model_coercer_converts_by_field_type() -> None:
+    parsed = parse_nested_form_data(
+        [
+            ("code", "1"),
+            ("subscribe", "yes"),
+            ("age", ""),
+            ("pets[0].name", "no"),
+            ("pets[0].vaccinated", "on"),
+            ("pets[0].weight", ""),
+            ("colors", "1"),
+            ("unknown", "off"),
+        ],
+        model=_CoercedForm,
+    )
+
+    assert parsed == {
+        "code": "1",
+        "subscribe": True,
+        "age": None,
+        "pets": [{"name": "no", "vaccinated": True, "weight": None}],
+        "colors": ["1"],
+        "unknown": False,
+    }
+    assert _CoercedForm(**parsed).code == "1"
+
+
+def test_model_coercer_is_compiled_once_per_schema() -> None:
+    class _TenantForm(FormModel):
+        title: str = Field("", title="Title")
+
+    coercer = form_coercer(_TenantForm)
+    assert form_coercer(_TenantForm) is coercer
+    assert form_coercer(None) is None
+
+    _TenantForm.register_field("active", annotation=bool, field=Field(False, title="Active"))
+    assert form_coercer(_TenantForm) is not coercer
+    assert parse_nested_form_data({"active": "1", "title": "1"}, model=_TenantForm) == {
+        "active": True,
+        "title": "1",
+    }
+
+
+def test_normalize_form_data_uses_the_model_coercer() -> None:
+    form = StarletteFormData([("code", "on"), ("subscribe", "1"), ("age", ""), ("colors", "red")])
+
+    assert normalize_form_data(form, model=_CoercedForm) == {
+        "code": "on",
+        "subscribe": True,
+        "age": None,
+        "colors": ["red"],
+    }
@@ -31,3 +31,20 @@ def test_render_form_page_wrapped_by_default() -> None:
     html = render_form_page(create_login_form(), title="Login")
     assert html.splitlines()[0] == "<!--- Start Pydantic-SchemaForms -->"
     assert html.splitlines()[-1] == "<!--- End Pydantic-SchemaForms -->"
+
+
+def test_wrap_replaces_existing_markers_without_duplicating() -> None:
+    from pydantic_schemaforms.html_markers import END_MARKER, START_MARKER, wrap_with_schemaforms_markers
+
+    wrapped = wrap_with_schemaforms_markers(f"  {START_MARKER}  \r\n<p>x</p>\n{END_MARKER}\n\n")
+    assert wrapped == f"{START_MARKER}\n<p>x</p>\n{END_MARKER}"
+    assert wrap_with_schemaforms_markers(wrapped) == wrapped
+    assert wrap_with_schemaforms_markers(f"{START_MARKER}\n{END_MARKER}") == f"{START_MARKER}\n{END_MARKER}"
+    assert wrap_with_schemaforms_markers(" \n ") == f"{START_MARKER}\n{END_MARKER}"
+
+
+def test_wrap_keeps_markers_that_share_a_line_with_content() -> None:
+    from pydantic_schemaforms.html_markers import END_MARKER, START_MARKER, wrap_with_schemaforms_markers
+
+    inner = f"{START_MARKER}<p>x</p>{END_MARKER}"
+    assert wrap_with_schemaforms_markers(inner) == f"{START_MARKER}\n{inner}\n{END_MARKER}"
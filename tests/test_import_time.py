@@ -0,0 +1,68 @@
+"""Regression tests for the cost of ``import pydantic_schemaforms``."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_schemaforms
+
+# Modules that must only load when their part of the API is used.
+HEAVY_MODULES = (
+    "pydantic",
+    "pydantic_schemaforms.enhanced_renderer",
+    "pydantic_schemaforms.form_layouts",
+    "pydantic_schemaforms.integration",
+    "pydantic_schemaforms.live_validation",
+    "pydantic_schemaforms.rendering.layout_engine",
+    "pydantic_schemaforms.rendering.themes",
+    "pydantic_schemaforms.templates",
+    "pydantic_schemaforms.validation",
+)
+
+# Cumulative import time budget for the package itself, in microseconds. A bare import
+# takes a few milliseconds; eager imports of the renderers take several hundred.
+IMPORT_TIME_BUDGET_US = 100_000
+
+
+def _import_profile() -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pydantic_schemaforms"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, module = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative_us.isdigit():
+            cumulative[module] = int(cumulative_us)
+    return cumulative
+
+
+@pytest.fixture(scope="module")
+def import_profile() -> dict[str, int]:
+    return _import_profile()
+
+
+def test_package_import_does_not_load_heavy_modules(import_profile: dict[str, int]) -> None:
+    loaded = [module for module in HEAVY_MODULES if module in import_profile]
+    assert loaded == []
+
+
+def test_package_import_stays_within_budget(import_profile: dict[str, int]) -> None:
+    assert import_profile["pydantic_schemaforms"] < IMPORT_TIME_BUDGET_US
+
+
+def test_public_api_resolves_lazily() -> None:
+    for name in pydantic_schemaforms.__all__:
+        assert getattr(pydantic_schemaforms, name) is not None
+    assert pydantic_schemaforms.FormModel.__name__ == "FormModel"
+    assert "render_form_html" in dir(pydantic_schemaforms)
+    missing_name = "not_a_public_name"
+    with pytest.raises(AttributeError):
+        getattr(pydantic_schemaforms, missing_name)
@@ -0,0 +1,183 @@
+"""Tests for opt-in render instrumentation."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from pydantic_schemaforms import collect_render_metrics, iter_render_form, render_form_html
+from pydantic_schemaforms.enhanced_renderer import EnhancedFormRenderer
+from pydantic_schemaforms.instrumentation import (
+    CACHE_RENDER_PLAN,
+    CACHE_RENDERER_POOL,
+    CACHE_SCHEMA_METADATA,
+    NULL_RECORDER,
+    PHASE_ASSETS,
+    PHASE_FIELDS,
+    PHASE_MARKERS,
+    PHASE_RENDER_PLAN,
+    PHASE_SCHEMA_METADATA,
+    PHASE_WRAPPER,
+    LoggingObserver,
+    PrometheusObserver,
+    RenderObserver,
+    SpanCollectorObserver,
+    add_render_observer,
+    begin_render,
+    remove_render_observer,
+    to_otel_spans,
+)
+from pydantic_schemaforms.rendering.render_plan import reset_render_plan_cache
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+
+class _MetricsForm(FormModel):
+    name: str = Field(..., title="Name")
+    email: str = Field(..., title="Email", ui_element="email")
+    age: int = Field(0, title="Age", ui_element="number")
+    notes: str = Field("", title="Notes", ui_element="textarea")
+
+
+def test_no_recorder_without_observers_or_collectors() -> None:
+    assert begin_render(_MetricsForm, "test") is NULL_RECORDER
+
+
+def test_collector_records_phases_fields_and_size() -> None:
+    with collect_render_metrics() as collector:
+        html = render_form_html(_MetricsForm, submit_url="/submit")
+
+    assert len(collector.renders) == 1
+    metrics = collector.renders[0]
+    assert metrics.model == "_MetricsForm"
+    assert metrics.entry_point == "render_form_html"
+    assert metrics.framework == "bootstrap"
+    assert metrics.layout == "vertical"
+    assert metrics.output_bytes == len(html.encode("utf-8"))
+    assert metrics.field_types == {"text": 1, "email": 1, "number": 1, "textarea": 1}
+    assert metrics.field_count == 4
+    for phase in (PHASE_SCHEMA_METADATA, PHASE_RENDER_PLAN, PHASE_FIELDS, PHASE_WRAPPER, PHASE_ASSETS, PHASE_MARKERS):
+        assert phase in metrics.phases
+    assert sum(metrics.phases.values()) <= metrics.duration
+    assert set(metrics.field_type_seconds) == set(metrics.field_types)
+
+
+def test_cache_hits_are_counted() -> None:
+    reset_render_plan_cache()
+    with collect_render_metrics() as collector:
+        render_form_html(_MetricsForm, submit_url="/submit")
+        render_form_html(_MetricsForm, submit_url="/submit")
+
+    first, second = collector.renders
+    assert first.cache[CACHE_RENDER_PLAN] == {"hit": 0, "miss": 1}
+    assert second.cache[CACHE_RENDER_PLAN] == {"hit": 1, "miss": 0}
+    assert second.cache[CACHE_SCHEMA_METADATA]["hit"] == 1
+    assert second.cache[CACHE_RENDERER_POOL]["hit"] == 1
+
+
+def test_streamed_render_counts_bytes_once() -> None:
+    with collect_render_metrics() as collector:
+        stream = iter_render_form(_MetricsForm, submit_url="/submit")
+        assert collector.renders == []
+        fragments = list(stream)
+
+    assert len(collector.renders) == 1
+    metrics = collector.renders[0]
+    assert metrics.streamed is True
+    assert metrics.entry_point == "iter_render_form"
+    assert metrics.output_bytes == len("".join(fragments).encode("utf-8"))
+    assert metrics.field_count == 4
+
+
+def test_renderer_method_is_instrumented_directly() -> None:
+    renderer = EnhancedFormRenderer(framework="none")
+    with collect_render_metrics() as collector:
+        html = renderer.render_form_from_model(_MetricsForm, layout="tabbed")
+
+    metrics = collector.renders[0]
+    assert metrics.entry_point == "EnhancedFormRenderer"
+    assert metrics.framework == "none"
+    assert metrics.output_bytes == len(html.encode("utf-8"))
+    assert "layout" in metrics.phases
+
+
+def test_observer_callbacks_and_removal() -> None:
+    events = []
+
+    class _Observer(RenderObserver):
+        def on_render_start(self, metrics):
+            events.append(("start", metrics.model))
+
+        def on_render_end(self, metrics):
+            events.append(("end", metrics.output_bytes > 0))
+
+    observer = add_render_observer(_Observer())
+    try:
+        render_form_html(_MetricsForm, submit_url="/submit")
+    finally:
+        remove_render_observer(observer)
+    render_form_html(_MetricsForm, submit_url="/submit")
+
+    assert events == [("start", "_MetricsForm"), ("end", True)]
+
+
+def test_prometheus_observer_aggregates() -> None:
+    observer = PrometheusObserver()
+    add_render_observer(observer)
+    try:
+        render_form_html(_MetricsForm, submit_url="/submit")
+        render_form_html(_MetricsForm, submit_url="/submit")
+    finally:
+        remove_render_observer(observer)
+
+    values = observer.as_dict()
+    assert values['schemaforms_renders_total{framework="bootstrap",model="_MetricsForm"}'] == 2
+    assert values['schemaforms_rendered_fields_total{framework="bootstrap",model="_MetricsForm",type="email"}'] == 2
+    text = observer.render_text()
+    assert "# TYPE schemaforms_renders_total counter" in text
+    assert 'schemaforms_render_phase_seconds_total{framework="bootstrap",model="_MetricsForm",phase="fields"}' in text
+
+    observer.reset()
+    assert observer.render_text() == ""
+
+
+def test_otel_spans_shape() -> None:
+    with collect_render_metrics() as collector:
+        render_form_html(_MetricsForm, submit_url="/submit")
+    metrics = collector.renders[0]
+
+    spans = to_otel_spans(metrics, trace_id="0" * 32)
+    root, children = spans[0], spans[1:]
+    assert root["name"] == "schemaforms.render"
+    assert root["parent_span_id"] is None
+    assert root["attributes"]["schemaforms.field_count"] == 4
+    assert {span["name"] for span in children} == {f"schemaforms.render.{phase}" for phase in metrics.phases}
+    for span in children:
+        assert span["trace_id"] == "0" * 32
+        assert span["parent_span_id"] == root["span_id"]
+        assert root["start_time_unix_nano"] <= span["start_time_unix_nano"] <= span["end_time_unix_nano"]
+
+
+def test_span_collector_keeps_recent_renders() -> None:
+    observer = SpanCollectorObserver(max_renders=1)
+    add_render_observer(observer)
+    try:
+        render_form_html(_MetricsForm, submit_url="/submit")
+        render_form_html(_MetricsForm, submit_url="/submit")
+    finally:
+        remove_render_observer(observer)
+
+    assert sum(1 for span in observer.spans if span["parent_span_id"] is None) == 1
+
+
+def test_logging_observer(caplog: pytest.LogCaptureFixture) -> None:
+    observer = LoggingObserver(logging.getLogger("schemaforms.test"))
+    add_render_observer(observer)
+    try:
+        with caplog.at_level(logging.INFO, logger="schemaforms.test"):
+            render_form_html(_MetricsForm, submit_url="/submit")
+    finally:
+        remove_render_observer(observer)
+
+    assert "Rendered _MetricsForm via render_form_html (bootstrap, vertical)" in caplog.text
+    assert "4 fields" in caplog.text
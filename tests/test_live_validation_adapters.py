@@ -0,0 +1,129 @@
+"""Tests for per-field TypeAdapter validation in LiveValidator."""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any, List, Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+
+from pydantic_schemaforms.live_validation import (
+    LiveValidator,
+    get_field_adapters,
+    reset_field_adapter_cache,
+)
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+
+class _Address(BaseModel):
+    zip_code: int
+
+
+class _OnboardingModel(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    name: str = Field(..., min_length=3)
+    age: int = Field(..., ge=0)
+    scores: List[int] = []
+    address: Optional[_Address] = None
+    code: str = "A"
+
+    @field_validator("code")
+    @classmethod
+    def _upper(cls, value: str) -> str:
+        if value != value.upper():
+            raise ValueError("must be upper case")
+        return value
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_field_adapter_cache()
+    yield
+    reset_field_adapter_cache()
+
+
+@pytest.fixture
+def validator() -> LiveValidator:
+    live = LiveValidator()
+    live.register_model_validator(_OnboardingModel)
+    return live
+
+
+def test_field_is_validated_without_the_rest_of_the_model(validator: LiveValidator, monkeypatch) -> None:
+    def _fail(*args, **kwargs):
+        raise AssertionError("model_validate should not be called")
+
+    monkeypatch.setattr(_OnboardingModel, "model_validate", _fail)
+
+    assert validator.validate_field("name", "Ada Lovelace").is_valid is True
+    short = validator.validate_field("name", "Al")
+    assert short.is_valid is False
+    assert short.errors == ["String should have at least 3 characters"]
+    assert validator.validate_field("name", "  abc  ").is_valid is True
+    assert validator.validate_field("age", "42").is_valid is True
+    assert validator.validate_field("age", -1).errors == ["Input should be greater than or equal to 0"]
+
+
+def test_nested_errors_are_reported(validator: LiveValidator) -> None:
+    assert validator.validate_field("scores", ["x"]).is_valid is False
+    response = validator.validate_field("address", {"zip_code": "nope"})
+    assert response.is_valid is False
+    assert response.errors
+
+
+def test_field_validators_fall_back_to_the_model(validator: LiveValidator) -> None:
+    assert get_field_adapters(_OnboardingModel).get("code") is None
+    assert validator.validate_field("code", "ABC").is_valid is True
+    lower = validator.validate_field("code", "abc")
+    assert lower.is_valid is False
+    assert lower.errors == ["Value error, must be upper case"]
+
+
+def test_adapters_are_compiled_once_per_model() -> None:
+    adapters = get_field_adapters(_OnboardingModel)
+    first = adapters.get("age")
+    assert get_field_adapters(_OnboardingModel) is adapters
+    assert adapters.get("age") is first
+
+
+def test_schema_version_change_rebuilds_adapters() -> None:
+    class _TenantForm(FormModel):
+        title: str = Field("", title="Title")
+
+    adapters = get_field_adapters(_TenantForm)
+    _TenantForm.register_field("nickname", annotation=str, field=Field("", title="Nickname"))
+    assert get_field_adapters(_TenantForm) is not adapters
+
+
+def test_aliased_fields_compile_without_warnings() -> None:
+    class _AliasedForm(FormModel):
+        full_name: str = Field(..., alias="fullName", min_length=2, title="Full name")
+        secret: str = Field("", exclude=True, max_length=4)
+
+    live = LiveValidator()
+    live.register_model_validator(_AliasedForm)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert get_field_adapters(_AliasedForm).get("full_name") is not None
+        assert live.validate_field("full_name", "A").errors == ["String should have at least 2 characters"]
+        assert live.validate_field("secret", "toolong").is_valid is False
+
+
+def test_before_model_validators_fall_back_to_the_model() -> None:
+    class _Normalized(BaseModel):
+        code: str = Field(..., max_length=3)
+
+        @model_validator(mode="before")
+        @classmethod
+        def _strip_prefix(cls, data: Any) -> Any:
+            if isinstance(data, dict) and isinstance(data.get("code"), str):
+                data = {**data, "code": data["code"].removeprefix("ID-")}
+            return data
+
+    live = LiveValidator()
+    live.register_model_validator(_Normalized)
+
+    assert get_field_adapters(_Normalized).get("code") is None
+    assert live.validate_field("code", "ID-abc").is_valid is True
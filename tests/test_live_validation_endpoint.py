@@ -0,0 +1,185 @@
+"""Tests for the batched live-validation endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from urllib.parse import urlencode
+
+import pytest
+
+from pydantic_schemaforms.live_validation import HTMXValidationConfig, LiveValidator
+from pydantic_schemaforms.live_validation_endpoint import (
+    StaleRequestGuard,
+    create_asgi_validation_app,
+    create_wsgi_validation_app,
+    handle_validation_request,
+    parse_validation_request,
+)
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+FORM = "application/x-www-form-urlencoded"
+
+
+class _SignupForm(FormModel):
+    username: str = Field(..., min_length=3)
+    age: int = Field(..., ge=18)
+    bio: str = Field("", max_length=10)
+
+
+@pytest.fixture
+def live() -> LiveValidator:
+    validator = LiveValidator()
+    validator.register_model_validator(_SignupForm)
+    return validator
+
+
+def test_validate_fields_skips_unregistered_fields(live: LiveValidator) -> None:
+    results = live.validate_fields({"username": "al", "age": "30", "csrf_token": "x"})
+
+    assert list(results) == ["username", "age"]
+    assert results["username"].is_valid is False
+    assert results["age"].is_valid is True
+
+
+def test_htmx_request_gets_out_of_band_feedback(live: LiveValidator) -> None:
+    response = handle_validation_request(
+        live,
+        method="POST",
+        body=urlencode({"username": "al", "age": "30", "bio": ""}).encode(),
+        content_type=FORM,
+        headers={"hx-request": "true"},
+    )
+
+    assert response.status == 200
+    assert dict(response.headers)["content-type"].startswith("text/html")
+    body = response.body.decode()
+    assert body.count('hx-swap-oob="true"') == 2
+    assert 'id="username-feedback"' in body and "is-invalid" in body
+    assert 'id="age-feedback"' in body
+    assert "bio-feedback" not in body
+
+
+def test_trigger_field_is_validated_even_when_blank(live: LiveValidator) -> None:
+    response = handle_validation_request(
+        live,
+        method="POST",
+        body=urlencode({"username": "", "age": ""}).encode(),
+        content_type=FORM,
+        headers={"hx-request": "true", "hx-trigger-name": "username"},
+    )
+
+    body = response.body.decode()
+    assert 'id="username-feedback"' in body
+    assert "age-feedback" not in body
+
+
+def test_json_request_gets_json(live: LiveValidator) -> None:
+    response = handle_validation_request(
+        live,
+        method="POST",
+        body=json.dumps({"fields": {"username": "alice", "age": 12}, "seq": 1}).encode(),
+        content_type="application/json",
+    )
+
+    payload = json.loads(response.body)
+    assert payload["is_valid"] is False
+    assert payload["fields"]["username"]["is_valid"] is True
+    assert payload["fields"]["age"]["errors"] == ["Input should be greater than or equal to 18"]
+
+
+def test_parse_validation_request_variants() -> None:
+    assert parse_validation_request(b'{"a": 1, "seq": 4}', "application/json") == ({"a": 1}, 4)
+    assert parse_validation_request(b"a=1&a=2&_validation_seq=7", FORM) == ({"a": ["1", "2"]}, 7)
+
+
+@pytest.mark.parametrize(
+    ("method", "body", "content_type", "status"),
+    [
+        ("GET", b"", FORM, 405),
+        ("POST", b"[1, 2]", "application/json", 400),
+        ("POST", b"--x", "multipart/form-data; boundary=x", 415),
+        ("POST", b"a=" + b"x" * 100, FORM, 413),
+    ],
+)
+def test_rejected_requests(live: LiveValidator, method: str, body: bytes, content_type: str, status: int) -> None:
+    response = handle_validation_request(
+        live, method=method, body=body, content_type=content_type, max_body_bytes=64
+    )
+    assert response.status == status
+
+
+def test_stale_requests_are_dropped(live: LiveValidator) -> None:
+    guard = StaleRequestGuard()
+    headers = {"x-validation-client": "tab-1"}
+
+    def post(sequence: int) -> int:
+        body = urlencode({"username": "alice", "_validation_seq": sequence}).encode()
+        return handle_validation_request(
+            live, method="POST", body=body, content_type=FORM, headers=headers, guard=guard
+        ).status
+
+    assert post(2) == 200
+    assert post(1) == 204
+    assert post(3) == 200
+
+
+def test_asgi_validation_app(live: LiveValidator) -> None:
+    app = create_asgi_validation_app(live)
+    sent: list[dict] = []
+    messages = [
+        {"type": "http.request", "body": b"username=al", "more_body": True},
+        {"type": "http.request", "body": b"ice&age=40", "more_body": False},
+    ]
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"format=json",
+        "headers": [(b"content-type", FORM.encode()), (b"hx-request", b"true")],
+    }
+    asyncio.run(app(scope, receive, send))
+
+    assert sent[0]["status"] == 200
+    assert json.loads(sent[1]["body"])["is_valid"] is True
+
+
+def test_wsgi_validation_app(live: LiveValidator) -> None:
+    app = create_wsgi_validation_app(live)
+    statuses: list[str] = []
+    body = b"username=al"
+
+    result = app(
+        {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": FORM,
+            "CONTENT_LENGTH": str(len(body)),
+            "HTTP_HX_REQUEST": "true",
+            "wsgi.input": io.BytesIO(body),
+        },
+        lambda status, headers: statuses.append(status),
+    )
+
+    assert statuses == ["200 OK"]
+    assert b'id="username-feedback"' in b"".join(result)
+
+
+def test_batch_validation_attributes(live: LiveValidator) -> None:
+    attributes = live.batch_validation_attributes("/validate")
+    assert 'hx-post="/validate"' in attributes
+    assert 'hx-sync="this:replace"' in attributes
+    assert 'hx-swap="none"' in attributes
+
+
+def test_batch_validation_attributes_without_live_triggers() -> None:
+    config = HTMXValidationConfig(validate_on_blur=False, validate_on_input=False, validate_on_change=False)
+
+    assert LiveValidator(config).batch_validation_attributes("/validate") == ""
@@ -0,0 +1,126 @@
+"""Tests for opt-in memoization of LiveValidator results."""
+
+from __future__ import annotations
+
+import pytest
+
+from pydantic_schemaforms.live_validation import LiveValidator, _ValidationResultCache
+from pydantic_schemaforms.validation import ValidationResponse
+
+
+def _counting_validator(calls: list):
+    def validator(value):
+        calls.append(value)
+        return ValidationResponse(field_name="username", is_valid=value != "taken", errors=[] if value != "taken" else ["Taken"])
+
+    return validator
+
+
+def test_results_are_memoized_per_value() -> None:
+    calls: list = []
+    live = LiveValidator()
+    live.register_validator("username", _counting_validator(calls))
+    live.enable_result_cache()
+
+    first = live.validate_field("username", "taken")
+    first.errors.append("mutated")
+    second = live.validate_field("username", "taken")
+    live.validate_field("username", "free")
+
+    assert calls == ["taken", "free"]
+    assert second.errors == ["Taken"]
+    info = live.result_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_values_of_different_types_do_not_collide() -> None:
+    calls: list = []
+    live = LiveValidator()
+    live.register_validator("username", _counting_validator(calls))
+    live.enable_result_cache()
+
+    for value in (1, True, 1.0, "1", ["1"], ["1"]):
+        live.validate_field("username", value)
+
+    assert calls == [1, True, 1.0, "1", ["1"]]
+
+
+def test_per_field_enablement() -> None:
+    cached_calls: list = []
+    plain_calls: list = []
+    live = LiveValidator()
+    live.register_validator("username", _counting_validator(cached_calls))
+    live.register_validator("email", _counting_validator(plain_calls))
+    live.enable_result_cache("username")
+
+    for _ in range(3):
+        live.validate_fields({"username": "ada", "email": "ada@example.com"})
+
+    assert cached_calls == ["ada"]
+    assert len(plain_calls) == 3
+
+    live.disable_result_cache("username")
+    live.validate_field("username", "ada")
+    assert cached_calls == ["ada", "ada"]
+
+    live.disable_result_cache()
+    assert live.result_cache_info() is None
+
+
+def test_reregistering_a_validator_retires_its_results() -> None:
+    calls: list = []
+    live = LiveValidator()
+    live.register_validator("username", _counting_validator(calls))
+    live.enable_result_cache()
+    live.validate_field("username", "ada")
+
+    live.register_validator("username", _counting_validator(calls))
+    live.validate_field("username", "ada")
+
+    assert calls == ["ada", "ada"]
+
+
+def test_ttl_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("pydantic_schemaforms.live_validation.time.monotonic", lambda: now[0])
+    calls: list = []
+    live = LiveValidator()
+    live.register_validator("username", _counting_validator(calls))
+    live.enable_result_cache(ttl=5)
+
+    live.validate_field("username", "ada")
+    now[0] += 4
+    live.validate_field("username", "ada")
+    now[0] += 2
+    live.validate_field("username", "ada")
+
+    assert calls == ["ada", "ada"]
+    assert live.result_cache_info().expirations == 1
+
+
+def test_lru_and_memory_budget() -> None:
+    response = ValidationResponse(field_name="f", is_valid=True)
+    cache = _ValidationResultCache(maxsize=2, max_bytes=10**6, ttl=None)
+    for key in ("a", "b", "a", "c"):
+        cache.put(key, key, response)
+    assert cache.get("b") is None
+    assert cache.get("a") is response
+    assert cache.info().evictions == 1
+
+    small = _ValidationResultCache(maxsize=100, max_bytes=400, ttl=None)
+    for key in range(10):
+        small.put(key, "x" * 10, response)
+    info = small.info()
+    assert info.current_bytes <= 400
+    assert info.currsize < 10
+
+    small.put("huge", "x" * 1000, response)
+    assert small.get("huge") is None
+
+
+def test_invalid_configuration() -> None:
+    live = LiveValidator()
+    with pytest.raises(ValueError):
+        live.enable_result_cache(maxsize=0)
+    with pytest.raises(ValueError):
+        live.enable_result_cache(ttl=0)
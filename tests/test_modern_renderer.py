@@ -322,3 +322,58 @@ class TestModernFormRenderer:
                             print(f"Field {field.name} has accessibility attributes")
         except AttributeError:
             pass
+
+
+class TestGeneratedModelCache:
+    """FormDefinition models are shared by structural fingerprint."""
+
+    @staticmethod
+    def _builder(label: str = "Name"):
+        from pydantic_schemaforms.integration.builder import FormBuilder
+
+        builder = FormBuilder()
+        builder.text_input("name", label)
+        builder.email_input("email", "Email")
+        return builder
+
+    def test_repeated_builds_share_one_model(self, monkeypatch):
+        from pydantic_schemaforms import modern_renderer
+
+        modern_renderer.reset_generated_model_cache()
+        calls = []
+        real_create_model = modern_renderer.create_model
+
+        def counting_create_model(*args, **kwargs):
+            calls.append(args[0])
+            return real_create_model(*args, **kwargs)
+
+        monkeypatch.setattr(modern_renderer, "create_model", counting_create_model)
+        builder = self._builder()
+
+        first = builder.render()
+        second = builder.render()
+
+        assert first == second
+        assert len(calls) == 1
+        assert builder.build().to_form_model_class() is builder.build().to_form_model_class()
+
+    def test_fingerprint_tracks_structure(self):
+        base = self._builder().build()
+        assert base.fingerprint() == self._builder().build().fingerprint()
+        assert base.fingerprint() != self._builder(label="Full name").build().fingerprint()
+        assert base.to_form_model_class() is not self._builder(label="Full name").build().to_form_model_class()
+
+    def test_cache_is_bounded_and_weakref_aware(self, monkeypatch):
+        from pydantic_schemaforms import modern_renderer
+        from pydantic_schemaforms.modern_renderer import FormDefinition, FormField
+
+        modern_renderer.reset_generated_model_cache()
+        monkeypatch.setattr(modern_renderer, "_GENERATED_MODEL_CACHE_MAX", 2)
+
+        kept = FormDefinition(title="Kept", fields=[FormField("a")]).to_form_model_class()
+        for index in range(3):
+            FormDefinition(title=f"Other{index}", fields=[FormField("a")]).to_form_model_class()
+
+        assert modern_renderer.generated_model_cache_size() == 2
+        # Evicted from the LRU but still alive, so the same class is returned.
+        assert FormDefinition(title="Kept", fields=[FormField("a")]).to_form_model_class() is kept
@@ -0,0 +1,139 @@
+"""Tests for the optional on-disk schema cache."""
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+from typing import Literal
+
+import pytest
+
+from pydantic_schemaforms.rendering import persistent_cache
+from pydantic_schemaforms.rendering.persistent_cache import (
+    disable_persistent_schema_cache,
+    enable_persistent_schema_cache,
+    model_fingerprint,
+    model_qualname,
+)
+from pydantic_schemaforms.rendering.schema_parser import build_schema_metadata, reset_schema_metadata_cache
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+
+class _PetForm(FormModel):
+    name: str = Field(..., title="Pet Name")
+    species: str = Field("dog", title="Species", ui_element="select")
+
+
+class _OwnerForm(FormModel):
+    owner: str = Field(..., title="Owner", ui_order=1)
+    pets: list[_PetForm] = Field(default_factory=list, title="Pets", ui_element="model_list")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    reset_schema_metadata_cache()
+    yield
+    disable_persistent_schema_cache()
+    reset_schema_metadata_cache()
+
+
+def _count_schema_calls(monkeypatch: pytest.MonkeyPatch, model_cls) -> list:
+    calls = []
+    original = model_cls.model_json_schema.__func__
+
+    def counting(cls, *args, **kwargs):
+        calls.append(cls)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(model_cls, "model_json_schema", classmethod(counting))
+    return calls
+
+
+def test_second_process_loads_schema_from_disk(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = enable_persistent_schema_cache(tmp_path)
+    generated = build_schema_metadata(_OwnerForm)
+    assert cache.stats()["stores"] == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    # A fresh worker: empty in-memory cache, same directory.
+    reset_schema_metadata_cache()
+    calls = _count_schema_calls(monkeypatch, _OwnerForm)
+    loaded = build_schema_metadata(_OwnerForm)
+
+    assert calls == []
+    assert cache.stats()["loads"] == 1
+    assert loaded.schema == generated.schema
+    assert [name for name, _ in loaded.fields] == [name for name, _ in generated.fields]
+    assert loaded.required_fields == generated.required_fields
+
+
+def test_corrupt_or_mismatched_files_fall_back(tmp_path) -> None:
+    cache = enable_persistent_schema_cache(tmp_path)
+    expected = build_schema_metadata(_PetForm).schema
+    path = cache.path_for(_PetForm)
+
+    path.write_text("{not json", encoding="utf-8")
+    reset_schema_metadata_cache()
+    assert build_schema_metadata(_PetForm).schema == expected
+    assert cache.stats()["errors"] == 1
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["fingerprint"] = "0" * 64
+    payload["schema"] = {"properties": {"bogus": {"type": "string"}}}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    reset_schema_metadata_cache()
+    assert build_schema_metadata(_PetForm).schema == expected
+
+
+def test_library_version_change_misses(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = enable_persistent_schema_cache(tmp_path)
+    fingerprint = model_fingerprint(_PetForm)
+    build_schema_metadata(_PetForm)
+
+    monkeypatch.setattr(persistent_cache, "_library_version", lambda: "999.0.0")
+    assert model_fingerprint(_PetForm) != fingerprint
+    assert cache.load(_PetForm) is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_nested_model_changes_change_the_fingerprint() -> None:
+    class _Item(FormModel):
+        label: str = Field(..., title="Label")
+
+    class _Order(FormModel):
+        items: list[_Item] = Field(default_factory=list, title="Items")
+
+    fingerprint = model_fingerprint(_Order)
+    _Item.register_field("quantity", annotation=int, field=Field(1, title="Quantity"))
+
+    assert model_fingerprint(_Order) != fingerprint
+
+
+def _color_form(*members: str) -> type:
+    palette = Enum("Color", {member.upper(): member for member in members}, type=str, module=__name__)
+
+    class _ColorForm(FormModel):
+        color: palette = Field(members[0], title="Color")
+        size: Literal["s", "m"] = Field("s", title="Size")
+
+    return _ColorForm
+
+
+def test_enum_member_changes_change_the_fingerprint(tmp_path) -> None:
+    before = _color_form("red", "blue")
+    after = _color_form("red", "blue", "green")
+    assert model_qualname(before) == model_qualname(after)
+    assert model_fingerprint(before) != model_fingerprint(after)
+    assert model_fingerprint(_color_form("red", "blue")) == model_fingerprint(before)
+
+    cache = enable_persistent_schema_cache(tmp_path)
+    build_schema_metadata(before)
+    assert cache.load(after) is None
+
+
+def test_schemas_that_do_not_round_trip_are_not_stored(tmp_path) -> None:
+    cache = enable_persistent_schema_cache(tmp_path)
+
+    assert cache.store(_PetForm, {"properties": {}, "enum": (1, 2)}) is False
+    assert list(tmp_path.glob("*.json")) == []
+    assert cache.clear() == 0
@@ -0,0 +1,113 @@
+"""Tests for compiled render plans used by EnhancedFormRenderer."""
+
+from __future__ import annotations
+
+from pydantic_schemaforms.enhanced_renderer import EnhancedFormRenderer
+from pydantic_schemaforms.rendering.render_plan import get_render_plan, reset_render_plan_cache
+from pydantic_schemaforms.rendering.schema_parser import (
+    build_schema_metadata,
+    reset_schema_metadata_cache,
+)
+from pydantic_schemaforms.rendering.themes import BootstrapTheme, FrameworkTheme
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+
+class _PlanForm(FormModel):
+    name: str = Field(..., title="Name", min_length=2, ui_placeholder="Your name")
+    email: str = Field(..., title="Email", ui_element="email")
+    color: str = Field("red", title="Color", ui_element="select", ui_options={"choices": ["red", "blue"]})
+    subscribe: bool = Field(False, title="Subscribe", ui_element="checkbox")
+    meeting: str = Field("", title="Meeting", ui_element="datetime")
+    token: str = Field("", json_schema_extra={"hidden": True})
+
+
+class _UncompiledRenderer(EnhancedFormRenderer):
+    """Overrides the field hook so the legacy per-field path is used."""
+
+    def _render_field(self, *args, **kwargs):  # type: ignore[override]
+        return super()._render_field(*args, **kwargs)
+
+
+def test_render_plan_is_cached_per_model_and_layout() -> None:
+    renderer = EnhancedFormRenderer()
+    metadata = build_schema_metadata(_PlanForm)
+
+    plan = get_render_plan(renderer, _PlanForm, metadata, "vertical")
+
+    assert get_render_plan(EnhancedFormRenderer(), _PlanForm, metadata, "vertical") is plan
+    assert get_render_plan(renderer, _PlanForm, metadata, "tabbed") is not plan
+    assert [field.name for field in plan.fields] == [name for name, _ in metadata.fields]
+
+
+def test_render_plan_is_keyed_by_theme_configuration() -> None:
+    metadata = build_schema_metadata(_PlanForm)
+    bootstrap = get_render_plan(EnhancedFormRenderer(theme=FrameworkTheme("bootstrap")), _PlanForm, metadata)
+    material = get_render_plan(EnhancedFormRenderer(theme=FrameworkTheme("material")), _PlanForm, metadata)
+
+    assert material is not bootstrap
+    assert get_render_plan(EnhancedFormRenderer(theme=FrameworkTheme("bootstrap")), _PlanForm, metadata) is bootstrap
+
+    custom = BootstrapTheme()
+    custom.config = {**custom.config, "input_class": "my-input"}
+    plan = get_render_plan(EnhancedFormRenderer(theme=custom), _PlanForm, metadata)
+    assert plan is not get_render_plan(EnhancedFormRenderer(theme=BootstrapTheme()), _PlanForm, metadata)
+    assert "my-input" in plan.fields[0].pristine_html
+
+
+def test_render_plan_invalidated_with_schema_metadata() -> None:
+    renderer = EnhancedFormRenderer()
+    plan = get_render_plan(renderer, _PlanForm, build_schema_metadata(_PlanForm))
+
+    reset_schema_metadata_cache()
+
+    rebuilt = get_render_plan(renderer, _PlanForm, build_schema_metadata(_PlanForm))
+    assert rebuilt is not plan
+
+    reset_render_plan_cache()
+    assert get_render_plan(renderer, _PlanForm, rebuilt.metadata) is not rebuilt
+
+
+def test_render_plan_precomputes_only_static_markup() -> None:
+    plan = get_render_plan(EnhancedFormRenderer(), _PlanForm, build_schema_metadata(_PlanForm))
+    by_name = {field.name: field for field in plan.fields}
+
+    assert by_name["name"].pristine_html is not None
+    assert 'minlength="2"' in by_name["name"].pristine_html
+    assert by_name["meeting"].pristine_html is None
+    assert by_name["token"].kind == "hidden"
+
+
+def test_subclass_overriding_field_hook_skips_field_plans() -> None:
+    plan = get_render_plan(_UncompiledRenderer(), _PlanForm, build_schema_metadata(_PlanForm))
+
+    assert plan.fields == ()
+
+
+def test_compiled_render_matches_uncompiled_render() -> None:
+    data = {"name": "Ada", "email": "ada@example.com", "color": "blue", "subscribe": "on"}
+    errors = {"email": "Invalid email"}
+
+    for framework in ("bootstrap", "material", "none"):
+        for payload, payload_errors in ((None, None), (data, errors)):
+            compiled = EnhancedFormRenderer(framework=framework).render_form_from_model(
+                _PlanForm, data=payload, errors=payload_errors, submit_url="/submit"
+            )
+            uncompiled = _UncompiledRenderer(framework=framework).render_form_from_model(
+                _PlanForm, data=payload, errors=payload_errors, submit_url="/submit"
+            )
+            assert compiled == uncompiled
+
+
+def test_compiled_render_splices_values_and_errors() -> None:
+    renderer = EnhancedFormRenderer()
+
+    html = renderer.render_form_from_model(
+        _PlanForm,
+        data={"name": "Grace", "subscribe": True},
+        errors={"name": "Too short"},
+        submit_url="/submit",
+    )
+
+    assert 'value="Grace"' in html
+    assert "Too short" in html
+    assert "checked" in html
@@ -0,0 +1,95 @@
+"""Tests for the process-wide renderer pool used by render_form_html."""
+
+from __future__ import annotations
+
+import threading
+
+from pydantic_schemaforms.enhanced_renderer import EnhancedFormRenderer, render_form_html
+from pydantic_schemaforms.rendering.form_style import FormStyle, get_form_style, register_form_style
+from pydantic_schemaforms.rendering.renderer_pool import (
+    get_pooled_renderer,
+    invalidate_renderer_pool,
+    renderer_pool_size,
+)
+from pydantic_schemaforms.rendering.themes import BootstrapTheme, MaterialEmbeddedTheme, PlainTheme
+from pydantic_schemaforms.schema_form import Field, FormModel
+from pydantic_schemaforms.simple_material_renderer import SimpleMaterialRenderer
+
+
+class _PoolForm(FormModel):
+    name: str = Field("", title="Name")
+
+
+def test_pooled_renderer_is_reused_per_configuration() -> None:
+    invalidate_renderer_pool()
+
+    first = get_pooled_renderer("bootstrap")
+    assert get_pooled_renderer("bootstrap", asset_mode=" Vendored ") is first
+    assert isinstance(first.theme, BootstrapTheme)
+
+    with_assets = get_pooled_renderer("bootstrap", include_framework_assets=True)
+    assert with_assets is not first
+    assert with_assets.include_framework_assets is True
+
+    cdn = get_pooled_renderer("bootstrap", asset_mode="cdn")
+    assert cdn is not first
+    assert cdn.asset_mode == "cdn"
+
+    assert isinstance(get_pooled_renderer("none").theme, PlainTheme)
+    assert renderer_pool_size() == 4
+
+
+def test_pooled_material_renderer_uses_embedded_theme() -> None:
+    renderer = get_pooled_renderer("material")
+
+    assert isinstance(renderer, SimpleMaterialRenderer)
+    assert isinstance(renderer.theme, MaterialEmbeddedTheme)
+    assert get_pooled_renderer("material") is renderer
+
+
+def test_pooled_renderer_accepts_explicit_theme_class() -> None:
+    renderer = get_pooled_renderer("bootstrap", theme_cls=PlainTheme)
+
+    assert isinstance(renderer, EnhancedFormRenderer)
+    assert isinstance(renderer.theme, PlainTheme)
+    assert renderer is not get_pooled_renderer("bootstrap")
+
+
+def test_invalidate_renderer_pool_by_framework() -> None:
+    invalidate_renderer_pool()
+    bootstrap = get_pooled_renderer("bootstrap")
+    plain = get_pooled_renderer("none")
+
+    assert invalidate_renderer_pool("bootstrap") == 1
+    assert get_pooled_renderer("none") is plain
+    assert get_pooled_renderer("bootstrap") is not bootstrap
+
+
+def test_register_form_style_invalidates_pool() -> None:
+    pooled = get_pooled_renderer("bootstrap")
+    original_style = get_form_style("bootstrap")
+
+    try:
+        register_form_style(FormStyle(framework="bootstrap", templates=original_style.templates))
+        assert get_pooled_renderer("bootstrap") is not pooled
+    finally:
+        register_form_style(original_style)
+
+
+def test_pooled_renderer_is_safe_across_threads() -> None:
+    invalidate_renderer_pool()
+    seen: list[EnhancedFormRenderer] = []
+    outputs: list[str] = []
+
+    def _render() -> None:
+        seen.append(get_pooled_renderer("bootstrap"))
+        outputs.append(render_form_html(_PoolForm, submit_url="/submit"))
+
+    threads = [threading.Thread(target=_render) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(renderer) for renderer in seen}) == 1
+    assert len(set(outputs)) == 1
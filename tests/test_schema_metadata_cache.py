@@ -0,0 +1,106 @@
+"""Tests for the per-model schema metadata cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from pydantic_schemaforms.rendering.schema_parser import (
+    build_schema_metadata,
+    configure_schema_metadata_cache,
+    invalidate_schema_metadata,
+    reset_schema_metadata_cache,
+    schema_metadata_cache_info,
+)
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_schema_metadata_cache()
+    yield
+    configure_schema_metadata_cache(128)
+    reset_schema_metadata_cache()
+
+
+def _make_form(name: str) -> type[FormModel]:
+    return type(name, (FormModel,), {"__annotations__": {"title": str}, "title": Field("", title="Title")})
+
+
+def test_repeated_builds_hit_the_cache() -> None:
+    form = _make_form("CachedForm")
+
+    first = build_schema_metadata(form)
+    assert build_schema_metadata(form) is first
+
+    info = schema_metadata_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_register_field_only_rebuilds_that_model() -> None:
+    tenant_a = _make_form("TenantAForm")
+    tenant_b = _make_form("TenantBForm")
+    metadata_a = build_schema_metadata(tenant_a)
+    metadata_b = build_schema_metadata(tenant_b)
+
+    version = tenant_a.schema_version()
+    tenant_a.register_field("nickname", annotation=str, field=Field("", title="Nickname"))
+
+    assert tenant_a.schema_version() == version + 1
+    rebuilt = build_schema_metadata(tenant_a)
+    assert rebuilt is not metadata_a
+    assert "nickname" in dict(rebuilt.fields)
+    assert build_schema_metadata(tenant_b) is metadata_b
+    assert schema_metadata_cache_info().invalidations == 1
+
+
+def test_attribute_assignment_and_deletion_bump_the_version() -> None:
+    form = _make_form("AssignedForm")
+    version = form.schema_version()
+    metadata = build_schema_metadata(form)
+
+    form.extra = Field("", title="Extra")
+    with_extra = build_schema_metadata(form)
+    assert with_extra is not metadata
+    assert "extra" in dict(with_extra.fields)
+
+    form.plain_attribute = 5
+    assert build_schema_metadata(form) is with_extra
+
+    del form.extra
+    assert form.schema_version() == version + 2
+
+
+def test_ensure_dynamic_fields_skips_rescan_when_version_is_unchanged() -> None:
+    form = _make_form("ScannedForm")
+    form.extra = Field("", title="Extra")
+
+    assert form.ensure_dynamic_fields() is True
+    assert form.ensure_dynamic_fields() is False
+
+
+def test_invalidate_single_entry() -> None:
+    form = _make_form("InvalidatedForm")
+    other = _make_form("OtherForm")
+    metadata = build_schema_metadata(form)
+    other_metadata = build_schema_metadata(other)
+
+    assert invalidate_schema_metadata(form) is True
+    assert invalidate_schema_metadata(form) is False
+    assert build_schema_metadata(form) is not metadata
+    assert build_schema_metadata(other) is other_metadata
+
+
+def test_configurable_size_evicts_least_recently_used() -> None:
+    configure_schema_metadata_cache(2)
+    forms = [_make_form(f"EvictForm{index}") for index in range(3)]
+    first = build_schema_metadata(forms[0])
+    build_schema_metadata(forms[1])
+    build_schema_metadata(forms[0])
+    build_schema_metadata(forms[2])
+
+    info = schema_metadata_cache_info()
+    assert (info.currsize, info.maxsize, info.evictions) == (2, 2, 1)
+    assert build_schema_metadata(forms[0]) is first
+
+    with pytest.raises(ValueError):
+        configure_schema_metadata_cache(0)
@@ -0,0 +1,192 @@
+"""Tests for asset_mode='local-static' and the hashed static asset handler."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import zlib
+
+import pytest
+
+from pydantic_schemaforms.assets.runtime import (
+    DEFAULT_STATIC_URL_PREFIX,
+    asset_variants,
+    framework_css_tag,
+    hashed_asset_name,
+    htmx_script_tag,
+    negotiate_asset_encoding,
+    read_asset_bytes,
+    set_static_url_prefix,
+    static_asset_url,
+    vendored_asset_variants,
+)
+from pydantic_schemaforms.assets.static import (
+    IMMUTABLE_CACHE_CONTROL,
+    create_asgi_static_app,
+    create_wsgi_static_app,
+    serve_static_asset,
+    static_asset_index,
+)
+from pydantic_schemaforms.enhanced_renderer import EnhancedFormRenderer
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+HTMX_PATH = "assets/vendor/htmx/htmx.min.js"
+
+
+def _htmx_public_name() -> str:
+    return hashed_asset_name(HTMX_PATH)
+
+
+def test_hashed_asset_name_embeds_content_digest() -> None:
+    digest = hashlib.sha256(read_asset_bytes(HTMX_PATH)).hexdigest()
+
+    assert _htmx_public_name() == f"htmx/htmx.min.{digest[:12]}.js"
+    assert static_asset_index()[_htmx_public_name()] == HTMX_PATH
+
+
+def test_local_static_mode_emits_src_tags() -> None:
+    tag = htmx_script_tag(asset_mode="local-static")
+
+    assert tag == f'<script src="{DEFAULT_STATIC_URL_PREFIX}/{_htmx_public_name()}"></script>'
+    assert framework_css_tag(framework="bootstrap", asset_mode="local-static").startswith(
+        f'<link rel="stylesheet" href="{DEFAULT_STATIC_URL_PREFIX}/bootstrap/bootstrap.min.'
+    )
+
+
+def test_renderer_local_static_mode_does_not_inline_assets() -> None:
+    class Demo(FormModel):
+        name: str = Field(title="Name")
+
+    html = EnhancedFormRenderer(
+        framework="bootstrap",
+        include_framework_assets=True,
+        asset_mode="local-static",
+    ).render_form_from_model(Demo)
+
+    assert "v5.3.0" not in html
+    assert f'href="{DEFAULT_STATIC_URL_PREFIX}/bootstrap/bootstrap.min.' in html
+    assert f'src="{DEFAULT_STATIC_URL_PREFIX}/bootstrap/bootstrap.bundle.min.' in html
+    assert "cdn.jsdelivr.net" not in html
+
+
+def test_static_url_prefix_is_configurable() -> None:
+    try:
+        set_static_url_prefix("static/forms/")
+        assert static_asset_url(HTMX_PATH) == f"/static/forms/{_htmx_public_name()}"
+    finally:
+        set_static_url_prefix(DEFAULT_STATIC_URL_PREFIX)
+
+
+def test_serve_static_asset_sets_cache_headers_and_etag() -> None:
+    response = serve_static_asset(f"/{_htmx_public_name()}")
+    headers = dict(response.headers)
+
+    assert response.status == 200
+    assert response.body == read_asset_bytes(HTMX_PATH)
+    assert headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert headers["content-type"].startswith("text/javascript")
+
+    not_modified = serve_static_asset(_htmx_public_name(), if_none_match=headers["etag"])
+    assert not_modified.status == 304
+    assert not_modified.body == b""
+
+    head = serve_static_asset(_htmx_public_name(), method="HEAD")
+    assert head.status == 200 and head.body == b""
+
+
+@pytest.mark.parametrize(
+    ("path", "method", "status"),
+    [
+        ("htmx/htmx.min.js", "GET", 404),
+        ("htmx/LICENSE", "GET", 404),
+        ("../runtime.py", "GET", 404),
+        ("htmx/htmx.min.js", "POST", 405),
+    ],
+)
+def test_serve_static_asset_rejects_unknown_requests(path: str, method: str, status: int) -> None:
+    assert serve_static_asset(path, method=method).status == status
+
+
+def test_asset_variants_are_precompressed_once() -> None:
+    variants = asset_variants(HTMX_PATH)
+
+    assert asset_variants(HTMX_PATH) is variants
+    assert variants.identity == read_asset_bytes(HTMX_PATH)
+    assert gzip.decompress(variants.gzip) == variants.identity
+    assert zlib.decompress(variants.deflate) == variants.identity
+    assert variants.sha256 == hashlib.sha256(variants.identity).hexdigest()
+    assert len(variants.gzip) < len(variants.identity)
+    assert variants.etag("gzip") != variants.etag()
+    assert HTMX_PATH in vendored_asset_variants()
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, "identity"),
+        ("gzip, deflate, br", "gzip"),
+        ("deflate", "deflate"),
+        ("gzip;q=0.5, deflate;q=0.8", "deflate"),
+        ("gzip;q=0, deflate;q=0", "identity"),
+        ("*", "gzip"),
+        ("br", "identity"),
+    ],
+)
+def test_negotiate_asset_encoding(header: str | None, expected: str) -> None:
+    assert negotiate_asset_encoding(header) == expected
+
+
+def test_serve_static_asset_negotiates_content_encoding() -> None:
+    variants = asset_variants(HTMX_PATH)
+
+    response = serve_static_asset(_htmx_public_name(), accept_encoding="gzip, deflate")
+    headers = dict(response.headers)
+
+    assert response.body is variants.gzip
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(variants.gzip))
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["etag"] == variants.etag("gzip")
+
+    identity = serve_static_asset(_htmx_public_name())
+    assert "content-encoding" not in dict(identity.headers)
+    assert identity.body is variants.identity
+
+
+def test_asgi_static_app_serves_mounted_asset() -> None:
+    app = create_asgi_static_app()
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "root_path": DEFAULT_STATIC_URL_PREFIX,
+        "path": f"{DEFAULT_STATIC_URL_PREFIX}/{_htmx_public_name()}",
+        "headers": [],
+    }
+    asyncio.run(app(scope, receive, send))
+
+    assert sent[0]["status"] == 200
+    assert (b"cache-control", IMMUTABLE_CACHE_CONTROL.encode()) in sent[0]["headers"]
+    assert sent[1]["body"] == read_asset_bytes(HTMX_PATH)
+
+
+def test_wsgi_static_app_honours_if_none_match() -> None:
+    app = create_wsgi_static_app()
+    etag = dict(serve_static_asset(_htmx_public_name()).headers)["etag"]
+    statuses: list[str] = []
+
+    body = app(
+        {"PATH_INFO": f"/{_htmx_public_name()}", "REQUEST_METHOD": "GET", "HTTP_IF_NONE_MATCH": etag},
+        lambda status, headers: statuses.append(status),
+    )
+
+    assert statuses == ["304 Not Modified"]
+    assert b"".join(body) == b""
@@ -0,0 +1,133 @@
+"""Tests for the streaming render API (iter_render_form / aiter_render_form)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from pydantic_schemaforms import aiter_render_form, iter_render_form
+from pydantic_schemaforms.enhanced_renderer import EnhancedFormRenderer, iter_form_html
+from pydantic_schemaforms.enhanced_renderer import render_form_html as core_render_form_html
+from pydantic_schemaforms.html_markers import (
+    END_MARKER,
+    START_MARKER,
+    iter_with_schemaforms_markers,
+    wrap_with_schemaforms_markers,
+)
+from pydantic_schemaforms.render_form import render_form_html
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+
+class _Pet(FormModel):
+    name: str = Field("", title="Pet Name")
+
+
+class _StreamForm(FormModel):
+    name: str = Field(..., title="Name", min_length=2)
+    email: str = Field(..., title="Email", ui_element="email")
+    notes: str = Field("", title="Notes", ui_element="textarea")
+    pets: List[_Pet] = Field(default_factory=list, title="Pets", ui_element="model_list")
+
+
+@pytest.mark.parametrize("framework", ["bootstrap", "material", "none"])
+@pytest.mark.parametrize("layout", ["vertical", "tabbed", "side-by-side"])
+def test_iter_render_form_matches_render_form_html(framework: str, layout: str) -> None:
+    data = {"name": "A", "pets": [{"name": "Rex"}]}
+    errors = {"name": "Too short"}
+
+    streamed = "".join(
+        iter_render_form(
+            _StreamForm,
+            form_data=data,
+            errors=errors,
+            framework=framework,
+            layout=layout,
+            submit_url="/submit",
+            include_imask=True,
+        )
+    )
+
+    assert streamed == render_form_html(
+        _StreamForm,
+        form_data=data,
+        errors=errors,
+        framework=framework,
+        layout=layout,
+        submit_url="/submit",
+        include_imask=True,
+    )
+
+
+def test_iter_form_html_matches_with_assets_and_timing() -> None:
+    for kwargs in ({"self_contained": True}, {"show_timing": True}, {"include_html_markers": False}):
+        streamed = "".join(iter_form_html(_StreamForm, submit_url="/submit", **kwargs))
+        assert streamed == core_render_form_html(_StreamForm, submit_url="/submit", **kwargs)
+
+
+def test_iter_render_form_yields_fragments_in_document_order() -> None:
+    fragments = list(iter_render_form(_StreamForm, submit_url="/submit"))
+
+    assert fragments[0] == START_MARKER
+    assert fragments[-1] == END_MARKER
+
+    def index_of(needle: str) -> int:
+        return next(i for i, fragment in enumerate(fragments) if needle in fragment)
+
+    assert index_of("data-schemaforms-layout-support") < index_of("<form")
+    assert index_of("<form") < index_of('name="name"') < index_of('name="email"')
+    assert index_of('name="email"') < index_of('type="submit"') < index_of("htmx")
+    # Each field is its own fragment rather than part of one large document.
+    assert index_of('name="name"') != index_of('name="email"')
+
+
+def test_iter_render_form_is_lazy() -> None:
+    renderer = EnhancedFormRenderer()
+    calls: List[str] = []
+    original = renderer._field_renderer.render_compiled_field
+
+    def _tracking(plan, *args, **kwargs):
+        calls.append(plan.name)
+        return original(plan, *args, **kwargs)
+
+    renderer._field_renderer.render_compiled_field = _tracking  # type: ignore[method-assign]
+
+    class _Flat(FormModel):
+        first: str = Field("", title="First")
+        second: str = Field("", title="Second")
+
+    fragments = renderer.iter_form_from_model(_Flat, submit_url="/submit")
+    for fragment in fragments:
+        if "<form" in fragment:
+            break
+
+    assert calls == []
+    assert "".join(fragments)
+    assert calls == ["first", "second"]
+
+
+def test_iter_render_form_validates_submit_url_eagerly() -> None:
+    with pytest.raises(ValueError):
+        iter_form_html(_StreamForm, submit_url="  ")
+
+
+def test_aiter_render_form_matches_sync_output() -> None:
+    async def _collect() -> str:
+        parts = [fragment async for fragment in aiter_render_form(_StreamForm, submit_url="/submit", batch_size=3)]
+        return "".join(parts)
+
+    assert asyncio.run(_collect()) == render_form_html(_StreamForm, submit_url="/submit")
+
+
+@pytest.mark.parametrize(
+    "fragments",
+    [
+        [],
+        ["", "  \n"],
+        ["\n  <p>a</p>", "\n", "<p>b</p>  ", "\n\n"],
+        ["<p>a</p>", "   ", "<p>b</p>"],
+    ],
+)
+def test_iter_with_markers_matches_wrap(fragments: List[str]) -> None:
+    assert "".join(iter_with_schemaforms_markers(fragments)) == wrap_with_schemaforms_markers("".join(fragments))
@@ -0,0 +1,183 @@
+"""Tests for bulk validation with validate_many."""
+
+from __future__ import annotations
+
+import concurrent.futures
+from concurrent.futures import Future
+from typing import Any, List
+
+import pytest
+from pydantic import BaseModel, field_validator
+
+from pydantic_schemaforms.schema_form import Field, FormModel
+from pydantic_schemaforms.validation import (
+    get_validation_pipeline,
+    reset_validation_pipeline_cache,
+    validate_form_data,
+    validate_many,
+)
+
+
+class _Pet(BaseModel):
+    name: str
+    weight: float = Field(..., ge=0)
+
+
+class _ImportRow(FormModel):
+    email: str = Field(..., min_length=3)
+    age: int = Field(..., ge=18, le=120)
+    pets: List[_Pet] = Field(default_factory=list)
+
+    @field_validator("email")
+    @classmethod
+    def _needs_at(cls, value: str) -> str:
+        if "@" not in value:
+            raise ValueError("must contain @")
+        return value
+
+
+ROWS = [
+    {"email": "ada@example.com", "age": "36"},
+    {"email": "x", "age": 12},
+    {"email": "bob@example.com", "age": 40, "pets": [{"name": "Rex", "weight": -1}]},
+    {"email": "noat.example.com", "age": 30},
+    {"email": "eve@example.com", "age": 200},
+    {"email": "kim@example.com", "age": 22, "pets": [{"name": "Tom", "weight": "4.5"}]},
+    "not a row",
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_validation_pipeline_cache()
+    yield
+    reset_validation_pipeline_cache()
+
+
+def _as_tuples(results):
+    return [(result.is_valid, result.data, result.errors) for result in results]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_results_match_validate_form_data(chunk_size: int) -> None:
+    expected = [validate_form_data(_ImportRow, row) for row in ROWS[:-1]]
+    results = validate_many(_ImportRow, iter(ROWS[:-1]), chunk_size=chunk_size)
+
+    assert _as_tuples(results) == _as_tuples(expected)
+    assert results[2].errors == {"pets[0].weight": "Must be 0.0 or greater"}
+    assert results[4].errors == {"age": "Must be 120 or less"}
+    assert results[5].data["pets"] == [{"name": "Tom", "weight": 4.5}]
+
+
+def test_non_mapping_rows_report_a_general_error() -> None:
+    result = validate_many(_ImportRow, ROWS)[-1]
+
+    assert result.is_valid is False
+    assert list(result.errors) == ["general"]
+
+
+def test_list_adapter_is_compiled_once_and_rebuilt_on_schema_change() -> None:
+    class _TenantRow(FormModel):
+        title: str = Field("", title="Title")
+
+    validate_many(_TenantRow, [{"title": "a"}])
+    pipeline = get_validation_pipeline(_TenantRow)
+    adapter = pipeline.list_adapter
+    validate_many(_TenantRow, [{"title": "b"}])
+    assert get_validation_pipeline(_TenantRow).list_adapter is adapter
+
+    _TenantRow.register_field("code", annotation=int, field=Field(..., title="Code"))
+    results = validate_many(_TenantRow, [{"title": "c", "code": "7"}, {"title": "d"}])
+    assert get_validation_pipeline(_TenantRow) is not pipeline
+    assert results[0].data == {"title": "c", "code": 7}
+    assert results[1].errors == {"code": "Field required"}
+
+
+def test_process_pool_preserves_row_order() -> None:
+    rows = ROWS[:-1] * 4
+    serial = validate_many(_ImportRow, rows, chunk_size=5)
+    pooled = validate_many(_ImportRow, rows, chunk_size=5, workers=2)
+
+    assert _as_tuples(pooled) == _as_tuples(serial)
+
+
+def test_chunk_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        validate_many(_ImportRow, ROWS, chunk_size=0)
+
+
+class _CountingRow(FormModel):
+    code: int = Field(..., ge=0)
+
+    @field_validator("code")
+    @classmethod
+    def _count(cls, value: int) -> int:
+        _validated.append(value)
+        return value
+
+
+_validated: List[int] = []
+
+
+def test_failing_rows_do_not_revalidate_the_chunk() -> None:
+    _validated.clear()
+    results = validate_many(_CountingRow, [{"code": 1}, {"code": -1}, {"code": 2}])
+
+    assert [result.is_valid for result in results] == [True, False, True]
+    assert results[1].errors == {"code": "Must be 0 or greater"}
+    assert _validated == [1, 2]
+
+
+class _LowercaseRow(FormModel):
+    email: str
+
+    def __init__(self, **data: Any) -> None:
+        data["email"] = str(data.get("email", "")).lower()
+        super().__init__(**data)
+
+
+def test_custom_init_runs_for_every_row() -> None:
+    results = validate_many(_LowercaseRow, [{"email": "ADA@EXAMPLE.COM"}, {"email": "Bob@X"}])
+
+    assert [result.data for result in results] == [{"email": "ada@example.com"}, {"email": "bob@x"}]
+
+
+class _InlineExecutor:
+    """Runs submissions synchronously and records how many results were outstanding."""
+
+    instances: List["_InlineExecutor"] = []
+
+    def __init__(self, max_workers: int) -> None:
+        self.outstanding = 0
+        self.peak = 0
+        self.instances.append(self)
+
+    def __enter__(self) -> "_InlineExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def submit(self, fn: Any, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        self.outstanding += 1
+        self.peak = max(self.peak, self.outstanding)
+        original_result = future.result
+
+        def result(timeout: Any = None) -> Any:
+            self.outstanding -= 1
+            return original_result(timeout)
+
+        future.result = result  # type: ignore[method-assign]
+        return future
+
+
+def test_process_pool_bounds_chunks_in_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _InlineExecutor)
+    rows = ROWS[:-1] * 10
+
+    pooled = validate_many(_ImportRow, iter(rows), chunk_size=2, workers=2)
+
+    assert _as_tuples(pooled) == _as_tuples(validate_many(_ImportRow, rows, chunk_size=2))
+    assert _InlineExecutor.instances[-1].peak == 4
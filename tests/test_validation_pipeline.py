@@ -0,0 +1,148 @@
+"""Tests for the per-model validate_form_data pipeline."""
+
+from __future__ import annotations
+
+from typing import Any, List
+
+import pytest
+
+from examples.shared_models import LayoutDemonstrationForm
+from pydantic_schemaforms.schema_form import Field, FormModel
+from pydantic_schemaforms.validation import (
+    _error_message_formatters,
+    get_validation_pipeline,
+    reset_validation_pipeline_cache,
+    validate_form_data,
+)
+
+
+class _SignupForm(FormModel):
+    username: str = Field(..., min_length=3, max_length=12)
+    age: int = Field(..., ge=18, le=99)
+    tags: List[str] = Field(default_factory=list)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_validation_pipeline_cache()
+    yield
+    reset_validation_pipeline_cache()
+
+
+def test_pipeline_resolves_the_runtime_model_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    original = _SignupForm.get_runtime_model.__func__
+
+    def counting(cls):
+        calls.append(cls)
+        return original(cls)
+
+    monkeypatch.setattr(_SignupForm, "get_runtime_model", classmethod(counting))
+
+    for _ in range(3):
+        assert validate_form_data(_SignupForm, {"username": "ada", "age": 30}).is_valid
+
+    assert len(calls) == 1
+    assert get_validation_pipeline(_SignupForm).layout_field_names == ()
+
+
+def test_dump_false_returns_the_instance() -> None:
+    result = validate_form_data(_SignupForm, {"username": "ada", "age": "30"}, dump=False)
+
+    assert result.is_valid is True
+    assert result.data == {}
+    assert isinstance(result.model, _SignupForm)
+    assert result.model.age == 30
+
+    dumped = validate_form_data(_SignupForm, {"username": "ada", "age": 30})
+    assert dumped.data == {"username": "ada", "age": 30, "tags": []}
+    assert dumped.model.username == "ada"
+
+
+def test_error_messages_use_the_formatter_table() -> None:
+    result = validate_form_data(_SignupForm, {"username": "x" * 20, "age": 120, "tags": [1]})
+
+    assert result.errors == {
+        "username": "String should have at most 12 characters",
+        "age": "Must be 99 or less",
+        "tags[0]": "Input should be a valid string",
+    }
+    assert "less_than_equal" in _error_message_formatters
+    assert validate_form_data(_SignupForm, {"username": "ada", "age": 3}).errors == {
+        "age": "Must be 18 or greater"
+    }
+
+
+def test_registered_fields_rebuild_the_pipeline() -> None:
+    class _TenantForm(FormModel):
+        title: str = Field("", title="Title")
+
+    pipeline = get_validation_pipeline(_TenantForm)
+    _TenantForm.register_field("seats", annotation=int, field=Field(..., title="Seats"))
+
+    assert get_validation_pipeline(_TenantForm) is not pipeline
+    assert validate_form_data(_TenantForm, {"title": "a"}).errors == {"seats": "Field required"}
+
+
+def test_layout_models_keep_their_nested_validation() -> None:
+    pipeline = get_validation_pipeline(LayoutDemonstrationForm)
+    assert pipeline.layout_field_names
+
+    result = validate_form_data(LayoutDemonstrationForm, {"first_name": "", "last_name": "J"})
+    assert result.is_valid is False
+    assert "first_name" in result.errors
+
+
+class _NormalizingForm(FormModel):
+    username: str = Field(..., min_length=3)
+
+    def __init__(self, **data: Any) -> None:
+        data["username"] = str(data.get("username", "")).strip().lower()
+        super().__init__(**data)
+
+
+def test_custom_init_still_runs() -> None:
+    result = validate_form_data(_NormalizingForm, {"username": "  Alice "})
+
+    assert result.is_valid
+    assert result.data == {"username": "alice"}
+    assert get_validation_pipeline(_SignupForm).model_validate is not None
+    assert get_validation_pipeline(_NormalizingForm).model_validate is None
+
+
+class _CityForm(FormModel):
+    city: str = Field(..., min_length=3)
+
+
+class _PostalForm(FormModel):
+    postal_code: str = Field(..., min_length=5)
+
+
+class _PerInstanceLayout:
+    """A layout whose nested form is chosen per instance."""
+
+    forms = {"city": _CityForm, "postal": _PostalForm}
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+
+    def _get_forms(self) -> List[type]:
+        return [self.forms[self.kind]]
+
+
+class _AddressForm(FormModel):
+    horizontal_tab: Any = Field(None, json_schema_extra={"ui_element": "layout"})
+
+
+def test_layout_forms_are_resolved_per_instance() -> None:
+    payload = {"city": "NY", "postal_code": "123"}
+
+    city = validate_form_data(
+        _AddressForm, {"horizontal_tab": _PerInstanceLayout("city"), **payload}
+    )
+    postal = validate_form_data(
+        _AddressForm, {"horizontal_tab": _PerInstanceLayout("postal"), **payload}
+    )
+
+    assert set(city.errors) == {"city"}
+    assert set(postal.errors) == {"postal_code"}
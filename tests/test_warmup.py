@@ -0,0 +1,50 @@
+"""Tests for the pre-fork warm-up API."""
+
+from __future__ import annotations
+
+import gc
+
+from pydantic_schemaforms import WarmupReport, warmup
+from pydantic_schemaforms.inputs.registry import get_input_component_map
+from pydantic_schemaforms.rendering import render_plan
+from pydantic_schemaforms.rendering.renderer_pool import get_pooled_renderer
+from pydantic_schemaforms.rendering.schema_parser import reset_schema_metadata_cache, schema_metadata_cache_info
+from pydantic_schemaforms.schema_form import Field, FormModel
+
+
+class _WarmForm(FormModel):
+    name: str = Field(..., title="Name")
+    email: str = Field(..., title="Email", ui_element="email")
+
+
+def test_warmup_populates_render_caches() -> None:
+    reset_schema_metadata_cache()
+    render_plan.reset_render_plan_cache()
+
+    report = warmup(models=[_WarmForm], frameworks=["bootstrap", "material"], layouts=["vertical", "tabbed"])
+
+    assert isinstance(report, WarmupReport)
+    assert report.models == ("_WarmForm",)
+    assert report.renders == 4
+    assert report.assets >= 3
+    assert report.frozen_objects == 0
+    assert schema_metadata_cache_info().currsize >= 1
+    assert len(render_plan._render_plan_cache) >= 2
+    assert get_input_component_map.cache_info().currsize == 1
+    assert get_pooled_renderer("material") is get_pooled_renderer("material")
+    assert "_WarmForm" not in report.summary() and "1 models x 2 frameworks" in report.summary()
+
+
+def test_warmup_local_static_precompresses_assets() -> None:
+    report = warmup(frameworks=["bootstrap"], asset_mode="local-static")
+
+    assert report.renders == 0
+    assert report.assets > 3
+
+
+def test_warmup_can_freeze_objects() -> None:
+    try:
+        report = warmup(models=[_WarmForm], frameworks=["none"], freeze=True)
+        assert report.frozen_objects > 0
+    finally:
+        gc.unfreeze()